@@ -1,7 +1,6 @@
 import streamlit as st
 import pandas as pd
 import folium
-from streamlit_folium import st_folium
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
@@ -14,14 +13,27 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+# Placeholders and maps are needed even when other imports fail
+from services.placeholders import placeholder_image
+from utils.map_cache import map_key, render_map
+
 # Import our comprehensive data and components
 try:
-    from data.destinations import (
-        DAY_TRIP_DESTINATIONS, MULTI_DAY_DESTINATIONS, TOUR_PACKAGES,
-        KARNATAKA_WATERFALLS, KARNATAKA_HERITAGE_SITES, KARNATAKA_BEACHES
-    )
+    from data.catalog import get_catalog
+    catalog = get_catalog()
+    DAY_TRIP_DESTINATIONS = catalog.destinations("day_trips")
+    MULTI_DAY_DESTINATIONS = catalog.destinations("multi_day")
+    KARNATAKA_WATERFALLS = catalog.destinations("waterfalls")
+    KARNATAKA_HERITAGE_SITES = catalog.destinations("heritage_sites")
+    KARNATAKA_BEACHES = catalog.destinations("beaches")
+    TOUR_PACKAGES = catalog.table("tour_packages")
     from components.multimedia import multimedia_manager
+    from services.photo_service import prefetch_photos
+    from services.thumbnails import thumbnail
     from pages.direction_itineraries import show_itinerary_pages
+    from services.warmup import start_warmup
+    # Fill the photo caches in the background; live page requests go first
+    start_warmup()
 except ImportError as e:
     st.error(f"Import error: {e}")
     st.info("Some features may be limited due to missing dependencies.")
@@ -403,8 +415,7 @@ def display_destination_card(destination):
     
     with col1:
         # Placeholder image - replace with actual destination images
-        image_url = f"https://via.placeholder.com/300x200/FF6B35/FFFFFF?text={destination['name'].replace(' ', '+')}"
-        st.image(image_url, caption=destination['name'], use_container_width=True)
+        st.image(placeholder_image(destination['name'], "card", "FF6B35"), caption=destination['name'], use_container_width=True)
     
     with col2:
         st.markdown(f"**🏷️ Type:** {destination['type']}")
@@ -475,7 +486,7 @@ def main():
     
     # Sidebar for main navigation
     with st.sidebar:
-        st.image("https://via.placeholder.com/300x150/FF6B35/FFFFFF?text=Karnataka+Tourism", width=300)
+        st.image(placeholder_image("Karnataka Tourism", "logo", "FF6B35"), width=300)
         
         page = st.selectbox(
             "Choose Your Planning Mode",
@@ -651,22 +662,8 @@ def show_recommended_trips(duration, interests, budget):
                     st.session_state.selected_trip = trip
                     st.success(f"Selected: {trip['title']}")
 
-def show_day_trips():
-    st.markdown("## 📍 Day Trips from Bangalore (Within 100km)")
-    
-    # Interactive map
-    st.markdown("### 🗺️ Explore Destinations on Map")
-    
-    # Sample locations within 100km of Bangalore
-    locations = [
-        {"name": "Nandi Hills", "lat": 13.3703, "lon": 77.6838, "distance": "60km", "type": "Hill Station"},
-        {"name": "Bannerghatta National Park", "lat": 12.7993, "lon": 77.5769, "distance": "25km", "type": "Wildlife"},
-        {"name": "Skandagiri", "lat": 13.4067, "lon": 77.6833, "distance": "62km", "type": "Trekking"},
-        {"name": "Savandurga", "lat": 12.9167, "lon": 77.2833, "distance": "50km", "type": "Adventure"},
-        {"name": "Wonderla", "lat": 12.8347, "lon": 77.3997, "distance": "28km", "type": "Theme Park"}
-    ]
-    
-    # Create map
+def build_day_trip_map(locations):
+    """Folium map of the sample day-trip locations around Bangalore"""
     m = folium.Map(location=[12.9716, 77.5946], zoom_start=9)
     
     # Add Bangalore marker
@@ -684,7 +681,26 @@ def show_day_trips():
             icon=folium.Icon(color='blue', icon='map-pin')
         ).add_to(m)
     
-    map_data = st_folium(m, width=700, height=400)
+    return m
+
+def show_day_trips():
+    st.markdown("## 📍 Day Trips from Bangalore (Within 100km)")
+    
+    # Interactive map
+    st.markdown("### 🗺️ Explore Destinations on Map")
+    
+    # Sample locations within 100km of Bangalore
+    locations = [
+        {"name": "Nandi Hills", "lat": 13.3703, "lon": 77.6838, "distance": "60km", "type": "Hill Station"},
+        {"name": "Bannerghatta National Park", "lat": 12.7993, "lon": 77.5769, "distance": "25km", "type": "Wildlife"},
+        {"name": "Skandagiri", "lat": 13.4067, "lon": 77.6833, "distance": "62km", "type": "Trekking"},
+        {"name": "Savandurga", "lat": 12.9167, "lon": 77.2833, "distance": "50km", "type": "Adventure"},
+        {"name": "Wonderla", "lat": 12.8347, "lon": 77.3997, "distance": "28km", "type": "Theme Park"}
+    ]
+    
+    # Create map (built and serialized once per process)
+    key = map_key((loc['name'] for loc in locations), "day_trips", (12.9716, 77.5946), 9)
+    map_data = render_map(key, lambda: build_day_trip_map(locations), width=700, height=400)
     
     # Filter options
     col1, col2, col3 = st.columns(3)
@@ -717,7 +733,7 @@ def show_day_trip_cards():
             "duration": "12 hours",
             "price": "₹1,200",
             "rating": 4.6,
-            "image": "https://via.placeholder.com/300x200/4CAF50/FFFFFF?text=Nandi+Hills",
+            "image": placeholder_image("Nandi Hills", "card", "4CAF50"),
             "highlights": ["Sunrise View", "Tipu's Drop", "Bhoga Nandeeshwara Temple"],
             "includes": ["Transport", "Breakfast", "Guide"]
         },
@@ -727,7 +743,7 @@ def show_day_trip_cards():
             "duration": "8 hours",
             "price": "₹800",
             "rating": 4.4,
-            "image": "https://via.placeholder.com/300x200/FF9800/FFFFFF?text=Safari",
+            "image": placeholder_image("Safari", "card", "FF9800"),
             "highlights": ["Lion Safari", "Tiger Safari", "Butterfly Park"],
             "includes": ["Transport", "Entry Tickets", "Lunch"]
         }
@@ -873,7 +889,7 @@ def show_accommodations():
             "price": "₹8,500",
             "rating": 4.5,
             "amenities": ["WiFi", "Pool", "Spa", "Restaurant", "Gym"],
-            "image": "https://via.placeholder.com/300x200/2196F3/FFFFFF?text=5-Star+Hotel"
+            "image": placeholder_image("5-Star Hotel", "card", "2196F3")
         },
         {
             "name": "Coorg Wilderness Resort",
@@ -882,7 +898,7 @@ def show_accommodations():
             "price": "₹6,200",
             "rating": 4.7,
             "amenities": ["WiFi", "Pool", "Restaurant", "Nature Walks"],
-            "image": "https://via.placeholder.com/300x200/4CAF50/FFFFFF?text=Resort"
+            "image": placeholder_image("Resort", "card", "4CAF50")
         }
     ]
     
@@ -1048,7 +1064,11 @@ def show_waterfalls_page():
 
 def show_heritage_sites_page():
     """Display comprehensive heritage sites page"""
-    multimedia_manager.display_heritage_showcase(KARNATAKA_HERITAGE_SITES)
+    multimedia_manager.display_heritage_showcase(
+        KARNATAKA_HERITAGE_SITES,
+        unesco_sites=catalog.unesco_sites,
+        other_sites=catalog.other_heritage_sites
+    )
     
     # Interactive heritage map
     st.markdown("### 🗺️ Heritage Sites Map")
@@ -1058,6 +1078,8 @@ def show_beaches_page():
     """Display beaches page with multimedia"""
     st.markdown("## 🏖️ Karnataka's Beautiful Beaches")
     
+    prefetch_photos(beach.photos for beach in KARNATAKA_BEACHES)
+    
     for beach in KARNATAKA_BEACHES:
         with st.container():
             col1, col2 = st.columns([1, 2])
@@ -1065,7 +1087,7 @@ def show_beaches_page():
             with col1:
                 if beach.get('photos'):
                     st.image(
-                        beach['photos'][0],
+                        thumbnail(beach['photos'][0]),
                         caption=beach['name'],
                         use_container_width=True
                     )
@@ -1073,7 +1095,7 @@ def show_beaches_page():
             with col2:
                 st.markdown(f"### {beach['name']}")
                 st.markdown(f"**📍 District:** {beach['district']}")
-                st.markdown(f"**🚗 Distance:** {beach['distance_from_bangalore']}km from Bangalore")
+                st.markdown(f"**🚗 Distance:** {beach.distance_km}km from Bangalore")
                 st.markdown(f"**🌊 Beaches:** {', '.join(beach['beaches'])}")
                 st.markdown(f"**🎯 Activities:** {', '.join(beach['activities'])}")
                 st.markdown(f"**🌟 Best Time:** {beach['best_time']}")
@@ -1089,9 +1111,8 @@ def show_hidden_gems_page():
     st.markdown("# 💎 Hidden Gems of Karnataka")
     st.markdown("*Discover Karnataka's best-kept secrets that even locals might not know about!*")
     
-    # Combine all hidden gems from different categories
-    all_destinations = DAY_TRIP_DESTINATIONS + MULTI_DAY_DESTINATIONS + KARNATAKA_WATERFALLS + KARNATAKA_HERITAGE_SITES
-    hidden_gems = [dest for dest in all_destinations if dest.get('hidden_gem', False)]
+    # Hidden gems from every category, collected once per process
+    hidden_gems = catalog.hidden_gems
     
     if hidden_gems:
         # Featured hidden gem
@@ -1119,14 +1140,14 @@ def show_hidden_gems_page():
             with col2:
                 if kailasagiri.get('photos'):
                     st.image(
-                        kailasagiri['photos'][0],
+                        thumbnail(kailasagiri['photos'][0]),
                         caption="Kailasagiri Cave Temple - A Hidden Spiritual Gem",
                         use_container_width=True
                     )
                 
-                st.markdown(f"**📍 Distance:** {kailasagiri.get('distance_km', 'N/A')}km")
-                st.markdown(f"**💰 Entry Fee:** ₹{kailasagiri.get('entry_fee', 0)}")
-                st.markdown(f"**⏱️ Time Needed:** {kailasagiri.get('estimated_time', 'N/A')}")
+                st.markdown(f"**📍 Distance:** {kailasagiri.distance_km}km")
+                st.markdown(f"**💰 Entry Fee:** ₹{kailasagiri.entry_fee or 0}")
+                st.markdown(f"**⏱️ Time Needed:** {kailasagiri.time_needed}")
                 
                 if st.button("🚀 Plan Trip to Kailasagiri"):
                     st.success("Added Kailasagiri Hill to your hidden gems adventure!")
@@ -3,10 +3,23 @@ Multimedia components for Karnataka Travel Planner
 Handles photos, videos, and interactive media content
 """
 
+import folium
 import streamlit as st
-import requests
-from PIL import Image
-import io
+from data.spatial_index import get_spatial_index
+from services.photo_service import prefetch_photos
+from services.thumbnails import thumbnail
+from utils.map_cache import map_key, render_map
+from utils.map_markers import add_markers, destination_feature
+from utils.map_viewport import render_viewport_map, use_viewport
+
+# Initial view of the statewide media map
+MEDIA_MAP_CENTER = (13.0827, 77.5877)
+MEDIA_MAP_ZOOM = 7
+MEDIA_MARKER_STYLE = dict(
+    rows=[("Category", "cat"), ("Distance", "km", "km")],
+    color='gray',
+    icon='info-sign'
+)
 
 class MultimediaManager:
     """Manages multimedia content for destinations"""
@@ -71,7 +84,7 @@ class MultimediaManager:
                     try:
                         # In production, replace with actual image loading
                         st.image(
-                            photo_url,
+                            thumbnail(photo_url, "gallery"),
                             caption=f"{destination['name']} - View {idx + 1}",
                             use_container_width=True
                         )
@@ -114,7 +127,7 @@ class MultimediaManager:
                     # Main image
                     if selected_waterfall.get('photos'):
                         st.image(
-                            selected_waterfall['photos'][0],
+                            thumbnail(selected_waterfall['photos'][0], "gallery"),
                             caption=f"{selected_waterfall['name']} - {selected_waterfall['height']}",
                             use_container_width=True
                         )
@@ -122,7 +135,7 @@ class MultimediaManager:
                 with col2:
                     st.markdown(f"**📍 Location:** {selected_waterfall['district']}")
                     st.markdown(f"**📏 Height:** {selected_waterfall['height']}")
-                    st.markdown(f"**🚗 Distance:** {selected_waterfall['distance_from_bangalore']}km from Bangalore")
+                    st.markdown(f"**🚗 Distance:** {selected_waterfall.distance_km}km from Bangalore")
                     st.markdown(f"**🌟 Best Time:** {selected_waterfall['best_time']}")
                     st.markdown(f"**💰 Entry Fee:** ₹{selected_waterfall['entry_fee']}")
                     
@@ -138,18 +151,24 @@ class MultimediaManager:
                     st.markdown("**✨ Highlights:**")
                     for highlight in selected_waterfall['highlights']:
                         st.markdown(f"• {highlight}")
+                
+                self.display_nearby_destinations(selected_waterfall)
     
-    def display_heritage_showcase(self, heritage_sites):
+    def display_heritage_showcase(self, heritage_sites, unesco_sites=None, other_sites=None):
         """Display heritage sites with multimedia"""
         
         st.markdown("## 🏛️ Karnataka's Rich Heritage")
         
-        # UNESCO vs Non-UNESCO sites
-        unesco_sites = [site for site in heritage_sites if site.get('unesco_status', False)]
-        other_sites = [site for site in heritage_sites if not site.get('unesco_status', False)]
+        # UNESCO vs Non-UNESCO sites (precomputed by the catalog when passed in)
+        if unesco_sites is None:
+            unesco_sites = [site for site in heritage_sites if site.get('unesco_status', False)]
+        if other_sites is None:
+            other_sites = [site for site in heritage_sites if not site.get('unesco_status', False)]
         
         tab1, tab2 = st.tabs(["🌟 UNESCO World Heritage Sites", "🏺 Other Heritage Sites"])
         
+        prefetch_photos(site.photos for site in (*unesco_sites, *other_sites))
+        
         with tab1:
             for site in unesco_sites:
                 self._display_heritage_card(site, is_unesco=True)
@@ -167,7 +186,7 @@ class MultimediaManager:
             with col1:
                 if site.get('photos'):
                     st.image(
-                        site['photos'][0],
+                        thumbnail(site['photos'][0]),
                         caption=site['name'],
                         use_container_width=True
                     )
@@ -179,7 +198,7 @@ class MultimediaManager:
                 st.markdown(f"**📍 District:** {site['district']}")
                 st.markdown(f"**⏳ Period:** {site['period']}")
                 st.markdown(f"**👑 Dynasty:** {site['dynasty']}")
-                st.markdown(f"**🚗 Distance:** {site['distance_from_bangalore']}km")
+                st.markdown(f"**🚗 Distance:** {site.distance_km}km")
                 st.markdown(f"**💰 Entry Fee:** ₹{site['entry_fee']}")
                 
                 # Highlights
@@ -210,7 +229,7 @@ class MultimediaManager:
                 cols = st.columns(min(len(site['photos']), 4))
                 for idx, photo in enumerate(site['photos']):
                     with cols[idx % 4]:
-                        st.image(photo, use_container_width=True)
+                        st.image(thumbnail(photo), use_container_width=True)
             
             # Activities
             if site.get('activities'):
@@ -223,6 +242,8 @@ class MultimediaManager:
                 st.markdown("**🏢 Facilities:**")
                 facilities_text = " • ".join(site['facilities'])
                 st.markdown(facilities_text)
+            
+            self.display_nearby_destinations(site)
     
     def display_hidden_gems_section(self, destinations):
         """Display hidden gems with special highlighting"""
@@ -230,12 +251,15 @@ class MultimediaManager:
         st.markdown("## 💎 Hidden Gems of Karnataka")
         st.markdown("*Discover the unexplored treasures that most tourists miss*")
         
-        hidden_gems = [dest for dest in destinations if dest.get('hidden_gem', False)]
+        hidden_gems = [dest for dest in destinations if dest.hidden_gem]
         
         if not hidden_gems:
             st.info("No hidden gems data available yet.")
             return
         
+        # Fetch every card's photos in one concurrent batch
+        prefetch_photos(gem.photos for gem in hidden_gems)
+        
         # Create a special layout for hidden gems
         for gem in hidden_gems:
             with st.container():
@@ -248,84 +272,93 @@ class MultimediaManager:
                     color: white;
                     margin: 1rem 0;
                 ">
-                    <h3>💎 {gem['name']} - Hidden Gem</h3>
+                    <h3>💎 {gem.name} - Hidden Gem</h3>
                 </div>
                 """, unsafe_allow_html=True)
                 
                 col1, col2 = st.columns([1, 2])
                 
                 with col1:
-                    if gem.get('photos'):
+                    if gem.photos:
                         st.image(
-                            gem['photos'][0],
-                            caption=f"Hidden Gem: {gem['name']}",
+                            thumbnail(gem.photos[0]),
+                            caption=f"Hidden Gem: {gem.name}",
                             use_container_width=True
                         )
                 
                 with col2:
-                    st.markdown(f"**📍 Distance:** {gem.get('distance_km', 'N/A')}km from Bangalore")
-                    st.markdown(f"**🏷️ Category:** {gem.get('category', 'N/A')}")
+                    st.markdown(f"**📍 Distance:** {gem.distance_km}km from Bangalore")
+                    st.markdown(f"**🏷️ Category:** {gem.category}")
                     
-                    if gem.get('description'):
-                        st.markdown(f"**📖 About:** {gem['description']}")
+                    if gem.description:
+                        st.markdown(f"**📖 About:** {gem.description}")
                     
                     # Highlights
-                    if gem.get('highlights'):
+                    if gem.highlights:
                         st.markdown("**✨ What makes it special:**")
-                        for highlight in gem['highlights'][:3]:
+                        for highlight in gem.highlights[:3]:
                             st.markdown(f"• {highlight}")
                     
-                    if st.button(f"Explore {gem['name']}", key=f"gem_{gem['id']}"):
-                        st.success(f"Added {gem['name']} to your adventure list!")
+                    if st.button(f"Explore {gem.name}", key=f"gem_{gem.uid}"):
+                        st.success(f"Added {gem.name} to your adventure list!")
                 
                 st.divider()
     
-    def create_interactive_map_with_media(self, destinations):
-        """Create interactive map with multimedia popups"""
+    def create_interactive_map_with_media(self, destinations, marker_mode="auto", viewport="auto"):
+        """Create interactive map with multimedia popups
         
-        import folium
-        from streamlit_folium import st_folium
+        Large destination sets are clustered automatically (see utils.map_markers).
+        Above utils.map_viewport.VIEWPORT_THRESHOLD destinations (or with
+        ``viewport=True``) only the markers in view are sent, and more load
+        as the map is panned; smaller maps stay display-only.
+        """
         
-        # Create base map
-        m = folium.Map(location=[13.0827, 77.5877], zoom_start=7)
-        
-        # Add markers with multimedia content
-        for dest in destinations:
-            if dest.get('coordinates'):
-                # Create popup content with media
-                popup_html = f"""
-                <div style="width: 300px;">
-                    <h4>{dest['name']}</h4>
-                    <p><strong>Category:</strong> {dest.get('category', 'N/A')}</p>
-                    <p><strong>Distance:</strong> {dest.get('distance_km', 'N/A')}km</p>
-                    <p>{dest.get('description', '')[:100]}...</p>
-                </div>
-                """
-                
-                # Color code by category
-                color_map = {
-                    'Heritage': 'red',
-                    'Hill Station': 'green',
-                    'Adventure': 'orange',
-                    'Beach': 'blue',
-                    'Spiritual': 'purple',
-                    'Waterfalls': 'lightblue'
-                }
-                
-                color = color_map.get(dest.get('category'), 'gray')
-                
-                folium.Marker(
-                    [dest['coordinates']['lat'], dest['coordinates']['lon']],
-                    popup=folium.Popup(popup_html, max_width=300),
-                    tooltip=dest['name'],
-                    icon=folium.Icon(color=color, icon='camera' if dest.get('photos') else 'info-sign')
-                ).add_to(m)
+        destinations = [dest for dest in destinations if dest.lat is not None]
+        
+        if use_viewport(len(destinations), viewport):
+            key = map_key((dest.uid for dest in destinations), "media:viewport", MEDIA_MAP_CENTER, MEDIA_MAP_ZOOM)
+            return render_viewport_map(
+                key,
+                lambda: folium.Map(location=MEDIA_MAP_CENTER, zoom_start=MEDIA_MAP_ZOOM),
+                destinations, self._media_feature, MEDIA_MAP_CENTER, MEDIA_MAP_ZOOM,
+                marker_mode=marker_mode, **MEDIA_MARKER_STYLE
+            )
         
-        # Display map
-        map_data = st_folium(m, width=700, height=500)
+        # Built and serialized once per set of destinations
+        key = map_key((dest.uid for dest in destinations), f"media:{marker_mode}", MEDIA_MAP_CENTER, MEDIA_MAP_ZOOM)
+        map_data = render_map(key, lambda: self._build_media_map(destinations, marker_mode), width=700, height=500)
         
         return map_data
     
+    @staticmethod
+    def _media_feature(dest):
+        return destination_feature(
+            dest.lat, dest.lon, dest.name,
+            category=dest.category,
+            icon='camera' if dest.photos else None,
+            text=(dest.description or '')[:100],
+            km=dest.distance_km
+        )
+    
+    def _build_media_map(self, destinations, marker_mode="auto"):
+        # Create base map
+        m = folium.Map(location=MEDIA_MAP_CENTER, zoom_start=MEDIA_MAP_ZOOM)
+        
+        # One GeoJSON layer; icons, colours and popups are drawn in the browser
+        features = [self._media_feature(dest) for dest in destinations]
+        add_markers(m, features, marker_mode, **MEDIA_MARKER_STYLE)
+        return m
+    
+    def display_nearby_destinations(self, destination, radius_km=100, limit=4):
+        """Display the closest other destinations from any catalog"""
+        
+        nearby = get_spatial_index().nearby(destination, km=radius_km, k=limit)
+        
+        if nearby:
+            st.markdown("**🧭 Nearby:**")
+            for distance, other in nearby:
+                st.markdown(f"• {other.name} ({other.category or 'Destination'}) - {distance:.0f}km away")
+    
     def display_seasonal_recommendations(self, destinations):
         """Display destinations based on current season"""
         
@@ -336,16 +369,15 @@ class MultimediaManager:
         # Determine season
         if current_month in [12, 1, 2]:
             season = "Winter"
-            season_destinations = [d for d in destinations if "December" in d.get('best_season', '') or "January" in d.get('best_season', '')]
         elif current_month in [3, 4, 5]:
             season = "Summer"
-            season_destinations = [d for d in destinations if "March" in d.get('best_season', '') or "April" in d.get('best_season', '')]
         elif current_month in [6, 7, 8, 9]:
             season = "Monsoon"
-            season_destinations = [d for d in destinations if "July" in d.get('best_season', '') or "August" in d.get('best_season', '')]
         else:
             season = "Post-Monsoon"
-            season_destinations = [d for d in destinations if "October" in d.get('best_season', '') or "November" in d.get('best_season', '')]
+        
+        # Month masks are parsed at catalog load, so "October to March" matches December
+        season_destinations = [d for d in destinations if d.in_season(current_month)]
         
         st.markdown(f"## 🌤️ Perfect for {season} Season")
         st.markdown(f"*Best destinations to visit during {season.lower()} in Karnataka*")
@@ -356,7 +388,7 @@ class MultimediaManager:
             for idx, dest in enumerate(season_destinations[:6]):  # Show max 6
                 with cols[idx % 3]:
                     if dest.get('photos'):
-                        st.image(dest['photos'][0], use_container_width=True)
+                        st.image(thumbnail(dest['photos'][0]), use_container_width=True)
                     
                     st.markdown(f"**{dest['name']}**")
                     st.markdown(f"📍 {dest.get('distance_km', 'N/A')}km")
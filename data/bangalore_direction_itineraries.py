@@ -3,7 +3,7 @@ Comprehensive Direction-wise Itineraries from Bangalore
 Hidden Gems and Lesser-Known Destinations within 100km
 """
 
-from services.photo_service import get_curated_photos, get_destination_video
+from services.photo_service import defer_media
 
 # Direction-wise Hidden Gems from Bangalore
 BANGALORE_DIRECTION_ITINERARIES = {
@@ -25,7 +25,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A hidden forest reserve perfect for adventure activities and nature photography. Popular among rock climbers and mountain bikers.",
                 "entry_fee": 0,
                 "best_time": "Early morning or evening",
-                "photos": get_curated_photos("Turahalli Forest Bangalore"),
+                "photos": defer_media("Turahalli Forest Bangalore"),
                 "hidden_gem": True
             },
             {
@@ -38,7 +38,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A single 400-year-old banyan tree spreading over 3 acres, creating a natural canopy. Perfect for meditation and photography.",
                 "entry_fee": 10,
                 "best_time": "Morning or evening",
-                "photos": get_curated_photos("Big Banyan Tree Bangalore"),
+                "photos": defer_media("Big Banyan Tree Bangalore"),
                 "hidden_gem": True
             },
             {
@@ -51,7 +51,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A cultural village dedicated to Indian classical dance, set beside a peaceful lake. Often hosts dance performances and workshops.",
                 "entry_fee": 50,
                 "best_time": "Morning or during cultural events",
-                "photos": get_curated_photos("Nrityagram Hesaraghatta"),
+                "photos": defer_media("Nrityagram Hesaraghatta"),
                 "hidden_gem": True
             },
             {
@@ -64,7 +64,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A lesser-known hilltop offering 360-degree views of the surrounding landscape. Perfect for rock climbing and photography.",
                 "entry_fee": 20,
                 "best_time": "Early morning for sunrise",
-                "photos": get_curated_photos("Avalabetta Hill Bangalore"),
+                "photos": defer_media("Avalabetta Hill Bangalore"),
                 "hidden_gem": True
             }
         ]
@@ -87,7 +87,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A beautiful reservoir project near Hosur, perfect for water activities and peaceful picnics. Less crowded than other water bodies.",
                 "entry_fee": 25,
                 "best_time": "Morning or evening",
-                "photos": get_curated_photos("Kelavarapalli Dam Hosur"),
+                "photos": defer_media("Kelavarapalli Dam Hosur"),
                 "hidden_gem": True
             },
             {
@@ -100,7 +100,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "An ancient temple with unique Dravidian architecture, known for its peaceful ambiance and spiritual significance.",
                 "entry_fee": 0,
                 "best_time": "Early morning or evening",
-                "photos": get_curated_photos("Chandrachoodeshwara Temple Hosur"),
+                "photos": defer_media("Chandrachoodeshwara Temple Hosur"),
                 "hidden_gem": True
             },
             {
@@ -113,7 +113,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A hidden Hoysala-era temple with exquisite stone carvings and sculptures, showcasing ancient Karnataka's architectural brilliance.",
                 "entry_fee": 10,
                 "best_time": "Morning",
-                "photos": get_curated_photos("Jalamangala Temple Karnataka"),
+                "photos": defer_media("Jalamangala Temple Karnataka"),
                 "hidden_gem": True
             }
         ]
@@ -136,7 +136,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "Volcanic rock formation with natural caves and a sacred perennial spring. Famous for cave exploration and night treks through rocky terrain.",
                 "entry_fee": 20,
                 "best_time": "Early morning or for night trek",
-                "photos": get_curated_photos("Antaragange Caves Kolar"),
+                "photos": defer_media("Antaragange Caves Kolar"),
                 "hidden_gem": True
             },
             {
@@ -149,7 +149,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "Home to over 10 million Shiva lingas, this temple holds a world record. The sight of countless lingas is truly mesmerizing and spiritually uplifting.",
                 "entry_fee": 0,
                 "best_time": "Early morning or evening",
-                "photos": get_curated_photos("Kotilingeshwara Temple Kolar"),
+                "photos": defer_media("Kotilingeshwara Temple Kolar"),
                 "hidden_gem": False
             },
             {
@@ -162,7 +162,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "Historic gold mining area with colonial-era buildings and mining heritage. Made famous by the KGF movie series, showcasing India's mining history.",
                 "entry_fee": 50,
                 "best_time": "Morning",
-                "photos": get_curated_photos("Kolar Gold Fields KGF"),
+                "photos": defer_media("Kolar Gold Fields KGF"),
                 "hidden_gem": False
             },
             {
@@ -175,7 +175,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "An ancient temple showcasing Chola architectural style with intricate stone carvings. A hidden gem for history and architecture enthusiasts.",
                 "entry_fee": 10,
                 "best_time": "Morning or evening",
-                "photos": get_curated_photos("Someshwara Temple Kolar"),
+                "photos": defer_media("Someshwara Temple Kolar"),
                 "hidden_gem": True
             }
         ]
@@ -198,7 +198,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A beautiful waterfall cascading from 50 feet height, surrounded by lush greenery. Perfect for swimming in natural pools and photography.",
                 "entry_fee": 30,
                 "best_time": "Post-monsoon (Oct-Feb)",
-                "photos": get_curated_photos("Chunchi Falls Kanakapura"),
+                "photos": defer_media("Chunchi Falls Kanakapura"),
                 "hidden_gem": True
             },
             {
@@ -211,7 +211,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A unique hilltop temple built under a massive granite rock at 3,780 feet. Offers stunning panoramic views and spiritual experience.",
                 "entry_fee": 20,
                 "best_time": "Early morning for sunrise",
-                "photos": get_curated_photos("Bilikal Rangaswamy Betta"),
+                "photos": defer_media("Bilikal Rangaswamy Betta"),
                 "hidden_gem": True
             },
             {
@@ -224,7 +224,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A narrow gorge where River Cauvery flows through rocks, creating a spectacular natural formation. The name means 'Goat's Leap' in Kannada.",
                 "entry_fee": 25,
                 "best_time": "Post-monsoon",
-                "photos": get_curated_photos("Mekedatu Kanakapura"),
+                "photos": defer_media("Mekedatu Kanakapura"),
                 "hidden_gem": False
             },
             {
@@ -237,7 +237,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "Confluence of rivers Arkavathi and Cauvery, creating a serene and spiritually significant spot. Popular for coracle rides and fishing.",
                 "entry_fee": 15,
                 "best_time": "Morning or evening",
-                "photos": get_curated_photos("Sangama Kanakapura"),
+                "photos": defer_media("Sangama Kanakapura"),
                 "hidden_gem": True
             }
         ]
@@ -260,7 +260,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "Known as Pearl Valley, this 92-meter waterfall creates a misty spray that looks like falling pearls. Surrounded by rocky terrain and lush vegetation.",
                 "entry_fee": 25,
                 "best_time": "Post-monsoon",
-                "photos": get_curated_photos("Muthyala Maduvu Pearl Valley"),
+                "photos": defer_media("Muthyala Maduvu Pearl Valley"),
                 "hidden_gem": True
             },
             {
@@ -273,7 +273,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A serene artificial lake surrounded by hills, perfect for boating and bird watching. Less crowded alternative to other water bodies near Bangalore.",
                 "entry_fee": 20,
                 "best_time": "Evening for sunset",
-                "photos": get_curated_photos("Kanva Reservoir Bangalore"),
+                "photos": defer_media("Kanva Reservoir Bangalore"),
                 "hidden_gem": True
             },
             {
@@ -286,7 +286,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A rocky hill known for its vulture sanctuary and rock climbing opportunities. Offers excellent views of the surrounding landscape.",
                 "entry_fee": 15,
                 "best_time": "Early morning",
-                "photos": get_curated_photos("Ramadevara Betta Bangalore"),
+                "photos": defer_media("Ramadevara Betta Bangalore"),
                 "hidden_gem": True
             }
         ]
@@ -309,7 +309,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "One of Asia's largest monolithic rocks, perfect for rock climbing and trekking. The twin hills of Karigudda and Billigudda offer challenging climbs.",
                 "entry_fee": 25,
                 "best_time": "Early morning",
-                "photos": get_curated_photos("Savandurga Monolith"),
+                "photos": defer_media("Savandurga Monolith"),
                 "hidden_gem": False
             },
             {
@@ -322,7 +322,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A popular spot for adventure sports like kayaking and rappelling. The dam creates a beautiful reservoir surrounded by rocky hills.",
                 "entry_fee": 50,
                 "best_time": "Morning",
-                "photos": get_curated_photos("Manchanabele Dam Adventure"),
+                "photos": defer_media("Manchanabele Dam Adventure"),
                 "hidden_gem": True
             },
             {
@@ -335,7 +335,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "An ancient fort with historical significance, offering insights into the region's past. The climb to the top provides excellent views.",
                 "entry_fee": 20,
                 "best_time": "Morning or evening",
-                "photos": get_curated_photos("Magadi Fort Karnataka"),
+                "photos": defer_media("Magadi Fort Karnataka"),
                 "hidden_gem": True
             }
         ]
@@ -358,7 +358,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A hill station at 3,940 feet with ancient temples and a sacred natural spring. Perfect blend of spirituality and natural beauty.",
                 "entry_fee": 15,
                 "best_time": "Early morning",
-                "photos": get_curated_photos("Devarayanadurga Hill Station"),
+                "photos": defer_media("Devarayanadurga Hill Station"),
                 "hidden_gem": False
             },
             {
@@ -371,7 +371,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "Built on Asia's second-largest monolith, this 17th-century fort offers a challenging climb and rich history. The steep ascent is rewarding.",
                 "entry_fee": 30,
                 "best_time": "Early morning",
-                "photos": get_curated_photos("Madhugiri Fort Monolith"),
+                "photos": defer_media("Madhugiri Fort Monolith"),
                 "hidden_gem": False
             },
             {
@@ -384,7 +384,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "Known as the 'Hill of Saints', this sacred hill features cave temples and offers a spiritual trekking experience with panoramic views.",
                 "entry_fee": 20,
                 "best_time": "Early morning",
-                "photos": get_curated_photos("Siddara Betta Tumkur"),
+                "photos": defer_media("Siddara Betta Tumkur"),
                 "hidden_gem": True
             },
             {
@@ -397,7 +397,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "An ancient temple dedicated to Goddess Mahalakshmi, known for its peaceful ambiance and spiritual significance among locals.",
                 "entry_fee": 0,
                 "best_time": "Morning or evening",
-                "photos": get_curated_photos("Goravanahalli Temple"),
+                "photos": defer_media("Goravanahalli Temple"),
                 "hidden_gem": True
             }
         ]
@@ -420,7 +420,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "Famous hill station known for spectacular sunrise views and historical significance. Popular for paragliding and photography.",
                 "entry_fee": 30,
                 "best_time": "Early morning for sunrise",
-                "photos": get_curated_photos("Nandi Hills Sunrise"),
+                "photos": defer_media("Nandi Hills Sunrise"),
                 "hidden_gem": False
             },
             {
@@ -433,7 +433,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A unique temple known for remedies related to Sarpa Dosha (serpent curse). The temple has a peaceful setting amidst hills.",
                 "entry_fee": 0,
                 "best_time": "Morning",
-                "photos": get_curated_photos("Ghati Subramanya Temple"),
+                "photos": defer_media("Ghati Subramanya Temple"),
                 "hidden_gem": True
             },
             {
@@ -446,7 +446,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A small aerodrome with flying club facilities and a beautiful lake. Perfect for aviation enthusiasts and peaceful lake views.",
                 "entry_fee": 100,
                 "best_time": "Morning or evening",
-                "photos": get_curated_photos("Jakkur Aerodrome Lake"),
+                "photos": defer_media("Jakkur Aerodrome Lake"),
                 "hidden_gem": True
             }
         ]
@@ -469,7 +469,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "Historic fort and birthplace of Tipu Sultan, showcasing 18th-century military architecture and rich history of Mysore kingdom.",
                 "entry_fee": 25,
                 "best_time": "Morning or evening",
-                "photos": get_curated_photos("Devanahalli Fort Tipu Sultan"),
+                "photos": defer_media("Devanahalli Fort Tipu Sultan"),
                 "hidden_gem": False
             },
             {
@@ -482,7 +482,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "An ancient temple showcasing Vijayanagara architectural style with beautiful stone carvings and peaceful surroundings.",
                 "entry_fee": 10,
                 "best_time": "Morning",
-                "photos": get_curated_photos("Venugopala Swamy Temple Devanahalli"),
+                "photos": defer_media("Venugopala Swamy Temple Devanahalli"),
                 "hidden_gem": True
             },
             {
@@ -495,7 +495,7 @@ BANGALORE_DIRECTION_ITINERARIES = {
                 "description": "A grove of 300 ancient tamarind trees believed to be from the Chola dynasty period. Now a biodiversity heritage site.",
                 "entry_fee": 15,
                 "best_time": "Morning or evening",
-                "photos": get_curated_photos("Nallur Tamarind Grove"),
+                "photos": defer_media("Nallur Tamarind Grove"),
                 "hidden_gem": True
             }
         ]
@@ -0,0 +1,177 @@
+"""
+Catalog access for Karnataka Travel Planner
+Serves destination catalogs from the precompiled snapshot when it is fresh,
+falling back to the Python data modules otherwise
+"""
+
+import hashlib
+import importlib
+import importlib.util
+import logging
+import os
+from collections.abc import Sequence
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
+
+import streamlit as st
+
+from data.records import Destination, freeze, to_destinations
+
+logger = logging.getLogger(__name__)
+
+# Flat destination lists: catalog name -> (module, attribute)
+LIST_CATALOGS = {
+    "day_trips": ("data.destinations", "DAY_TRIP_DESTINATIONS"),
+    "multi_day": ("data.destinations", "MULTI_DAY_DESTINATIONS"),
+    "waterfalls": ("data.destinations", "KARNATAKA_WATERFALLS"),
+    "heritage_sites": ("data.destinations", "KARNATAKA_HERITAGE_SITES"),
+    "beaches": ("data.destinations", "KARNATAKA_BEACHES"),
+}
+
+# Destinations grouped under a keyed dict with a "destinations" list per group
+GROUPED_CATALOGS = {
+    "hidden_gems": ("data.karnataka_hidden_gems", "KARNATAKA_HIDDEN_GEMS"),
+    "direction_itineraries": ("data.bangalore_direction_itineraries", "BANGALORE_DIRECTION_ITINERARIES"),
+}
+
+# Small lookup tables that are kept whole
+TABLES = {
+    "karnataka_videos": ("data.destinations", "KARNATAKA_VIDEOS"),
+    "accommodation_types": ("data.destinations", "ACCOMMODATION_TYPES"),
+    "transport_options": ("data.destinations", "TRANSPORT_OPTIONS"),
+    "tour_packages": ("data.destinations", "TOUR_PACKAGES"),
+    "seasonal_hidden_gems": ("data.karnataka_hidden_gems", "SEASONAL_HIDDEN_GEMS"),
+    "difficulty_based_gems": ("data.karnataka_hidden_gems", "DIFFICULTY_BASED_GEMS"),
+    "photography_gems": ("data.karnataka_hidden_gems", "PHOTOGRAPHY_GEMS"),
+    "sample_itineraries": ("data.bangalore_direction_itineraries", "SAMPLE_ITINERARIES"),
+}
+
+# Catalogs combined for the Hidden Gems page
+HIDDEN_GEM_SOURCES = ("day_trips", "multi_day", "waterfalls", "heritage_sites")
+
+SOURCE_MODULES = sorted({
+    module
+    for sources in (LIST_CATALOGS, GROUPED_CATALOGS, TABLES)
+    for module, _ in sources.values()
+})
+
+DEFAULT_SNAPSHOT_PATH = os.getenv(
+    "KTP_CATALOG_SNAPSHOT",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog.snapshot")
+)
+
+def _frozen_records(records: Sequence) -> Sequence:
+    # Snapshot record ranges are already read-only and decode lazily
+    return tuple(records) if isinstance(records, list) else records
+
+class Catalog:
+    """Destination catalogs and lookup tables behind one read-only interface
+    
+    One instance is shared by every session in the process: lists are
+    tuples, groups and tables are mapping proxies and records are read-only.
+    Derived collections are computed on first use and then reused.
+    """
+    
+    def __init__(self, lists: Dict[str, Sequence], groups: Dict[str, dict], tables: Dict[str, object], source: str):
+        self._lists = MappingProxyType({name: _frozen_records(records) for name, records in lists.items()})
+        self._groups = MappingProxyType({
+            name: MappingProxyType({
+                key: MappingProxyType({
+                    **{k: freeze(v) for k, v in group.items() if k != "destinations"},
+                    "destinations": _frozen_records(group["destinations"]),
+                })
+                for key, group in catalog_groups.items()
+            })
+            for name, catalog_groups in groups.items()
+        })
+        self._tables = MappingProxyType({name: freeze(table) for name, table in tables.items()})
+        self.source = source
+    
+    def destinations(self, name: str) -> Sequence:
+        """Flat destination list such as "waterfalls" or "day_trips" """
+        return self._lists[name]
+    
+    def groups(self, name: str) -> MappingProxyType:
+        """Grouped catalog such as "hidden_gems" keyed by region"""
+        return self._groups[name]
+    
+    def table(self, name: str):
+        """Lookup table such as "seasonal_hidden_gems" """
+        return self._tables[name]
+    
+    @cached_property
+    def all_destinations(self) -> Tuple[Destination, ...]:
+        """Every record of the flat and grouped catalogs, duplicates included"""
+        return (
+            *(dest for records in self._lists.values() for dest in records),
+            *(dest for groups in self._groups.values() for group in groups.values() for dest in group["destinations"]),
+        )
+    
+    @cached_property
+    def hidden_gems(self) -> Tuple[Destination, ...]:
+        """Hidden gems across HIDDEN_GEM_SOURCES, in catalog order"""
+        return tuple(
+            dest for name in HIDDEN_GEM_SOURCES for dest in self.destinations(name)
+            if dest.hidden_gem
+        )
+    
+    @cached_property
+    def unesco_sites(self) -> Tuple[Destination, ...]:
+        """Heritage sites with UNESCO World Heritage status"""
+        return tuple(site for site in self.destinations("heritage_sites") if site.get('unesco_status', False))
+    
+    @cached_property
+    def other_heritage_sites(self) -> Tuple[Destination, ...]:
+        """Heritage sites without UNESCO status"""
+        return tuple(site for site in self.destinations("heritage_sites") if not site.get('unesco_status', False))
+
+def source_fingerprint() -> str:
+    """Hash of the data module sources, used to detect stale snapshots"""
+    digest = hashlib.sha256()
+    for module in SOURCE_MODULES:
+        spec = importlib.util.find_spec(module)
+        digest.update(module.encode("utf-8"))
+        with open(spec.origin, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def load_from_modules() -> Catalog:
+    """Build the catalog by importing the Python data modules"""
+    def resolve(module, attribute):
+        return getattr(importlib.import_module(module), attribute)
+    
+    lists = {
+        name: to_destinations(resolve(*source), name)
+        for name, source in LIST_CATALOGS.items()
+    }
+    groups = {
+        name: {
+            key: dict(group, destinations=to_destinations(group["destinations"], name, key))
+            for key, group in resolve(*source).items()
+        }
+        for name, source in GROUPED_CATALOGS.items()
+    }
+    tables = {name: resolve(*source) for name, source in TABLES.items()}
+    return Catalog(lists, groups, tables, source="modules")
+
+def load_catalog(snapshot_path: Optional[str] = None) -> Catalog:
+    """Load the catalog from a fresh snapshot, or from the data modules"""
+    from data.catalog_snapshot import CatalogSnapshot, SnapshotError
+    
+    snapshot_path = snapshot_path or DEFAULT_SNAPSHOT_PATH
+    if os.path.exists(snapshot_path):
+        try:
+            snapshot = CatalogSnapshot.open(snapshot_path)
+            if snapshot.source_hash == source_fingerprint():
+                return snapshot.to_catalog()
+            logger.warning("Catalog snapshot %s is stale, loading data modules", snapshot_path)
+        except (OSError, SnapshotError) as e:
+            logger.warning("Could not load catalog snapshot %s: %s", snapshot_path, e)
+    
+    return load_from_modules()
+
+@st.cache_resource(show_spinner=False)
+def get_catalog() -> Catalog:
+    """Process-wide catalog, loaded once and shared by every session"""
+    return load_catalog()
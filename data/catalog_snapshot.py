@@ -0,0 +1,235 @@
+"""
+Precompiled catalog snapshot for Karnataka Travel Planner
+
+Compiles every destination catalog into one versioned binary file that
+workers memory-map instead of re-parsing the data modules. Records are
+decoded on first access, so opening a snapshot costs the same no matter
+how many places it holds, and workers on one host share its pages.
+
+Build it with:  python -m data.catalog_snapshot [path]
+
+Layout (little endian):
+    header    MAGIC, format version, record count, section offsets
+    index     (record count + 1) uint64 offsets into the data section
+    data      one UTF-8 JSON document per normalized Destination record
+    manifest  UTF-8 JSON: source hash, catalog ranges and lookup tables
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from types import MappingProxyType
+from typing import Dict, List, Optional
+
+from data.records import Destination
+from services.photo_service import LazyMedia
+
+MAGIC = b"KTPCATLG"
+FORMAT_VERSION = 2
+
+# magic, format version, flags, record count, index/data/manifest offsets, manifest length
+HEADER = struct.Struct("<8sHHIQQQQ")
+OFFSET = struct.Struct("<Q")
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is missing, corrupt or of another version"""
+
+def _encode_default(value):
+    """JSON hook for values that are not plain data"""
+    if isinstance(value, Destination):
+        return value.to_dict()
+    if isinstance(value, LazyMedia):
+        # Keep media deferred: store the lookup, not the resolved URLs
+        return {"$media": value.media_type, "query": value.query}
+    if isinstance(value, (tuple, set, frozenset)):
+        return list(value)
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(f"Cannot store {type(value).__name__} in catalog snapshot")
+
+def _decode_hook(obj):
+    """JSON hook that restores deferred media lists"""
+    if "$media" in obj:
+        return LazyMedia(obj["query"], obj["$media"])
+    return obj
+
+def _dumps(value) -> bytes:
+    return json.dumps(value, default=_encode_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _loads(data):
+    return json.loads(bytes(data).decode("utf-8"), object_hook=_decode_hook)
+
+def build_snapshot(path: Optional[str] = None) -> str:
+    """Compile all catalogs from the data modules into a snapshot file"""
+    from data.catalog import (
+        DEFAULT_SNAPSHOT_PATH, LIST_CATALOGS, GROUPED_CATALOGS, TABLES,
+        load_from_modules, source_fingerprint
+    )
+    
+    path = path or DEFAULT_SNAPSHOT_PATH
+    catalog = load_from_modules()
+    
+    records: List[bytes] = []
+    catalogs: Dict[str, dict] = {}
+    
+    def add_records(destinations):
+        start = len(records)
+        records.extend(_dumps(dest) for dest in destinations)
+        return start, len(records)
+    
+    for name in LIST_CATALOGS:
+        start, stop = add_records(catalog.destinations(name))
+        catalogs[name] = {"kind": "list", "start": start, "stop": stop}
+    
+    for name in GROUPED_CATALOGS:
+        groups = {}
+        for key, group in catalog.groups(name).items():
+            start, stop = add_records(group["destinations"])
+            meta = {k: v for k, v in group.items() if k != "destinations"}
+            groups[key] = {"meta": meta, "start": start, "stop": stop}
+        catalogs[name] = {"kind": "groups", "groups": groups}
+    
+    manifest = _dumps({
+        "source_hash": source_fingerprint(),
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "catalogs": catalogs,
+        "tables": {name: catalog.table(name) for name in TABLES},
+    })
+    
+    index_offset = HEADER.size
+    data_offset = index_offset + OFFSET.size * (len(records) + 1)
+    offsets = [0]
+    for record in records:
+        offsets.append(offsets[-1] + len(record))
+    manifest_offset = data_offset + offsets[-1]
+    
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0, len(records),
+        index_offset, data_offset, manifest_offset, len(manifest)
+    )
+    
+    # Write to a temp file and swap it in so running workers never see a partial file
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".catalog-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(b"".join(OFFSET.pack(offset) for offset in offsets))
+            f.writelines(records)
+            f.write(manifest)
+        # mkstemp creates 0600; workers may run as a different user than the build
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    
+    return path
+
+class SnapshotRecords(Sequence):
+    """Read-only view over a contiguous range of snapshot records"""
+    
+    __slots__ = ("_snapshot", "_start", "_stop", "_catalog", "_group")
+    
+    def __init__(self, snapshot: "CatalogSnapshot", start: int, stop: int, catalog: str, group: Optional[str] = None):
+        self._snapshot = snapshot
+        self._start = start
+        self._stop = stop
+        self._catalog = catalog
+        self._group = group
+    
+    def __len__(self) -> int:
+        return self._stop - self._start
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("snapshot record index out of range")
+        return self._snapshot.record(self._start + index, self._catalog, self._group)
+    
+    def __iter__(self):
+        for position in range(self._start, self._stop):
+            yield self._snapshot.record(position, self._catalog, self._group)
+    
+    def __repr__(self) -> str:
+        return f"SnapshotRecords({self._start}:{self._stop})"
+
+class CatalogSnapshot:
+    """Memory-mapped catalog snapshot with lazily decoded records"""
+    
+    def __init__(self, buffer: mmap.mmap, path: str):
+        self._buffer = buffer
+        self.path = path
+        
+        if len(buffer) < HEADER.size:
+            raise SnapshotError("file too short for a snapshot header")
+        
+        (magic, version, _flags, self.record_count,
+         self._index_offset, self._data_offset,
+         manifest_offset, manifest_length) = HEADER.unpack_from(buffer, 0)
+        
+        if magic != MAGIC:
+            raise SnapshotError("not a catalog snapshot")
+        if version != FORMAT_VERSION:
+            raise SnapshotError(f"snapshot format {version}, expected {FORMAT_VERSION}")
+        if manifest_offset + manifest_length > len(buffer):
+            raise SnapshotError("snapshot is truncated")
+        
+        self.manifest = _loads(buffer[manifest_offset:manifest_offset + manifest_length])
+        self.source_hash = self.manifest.get("source_hash")
+        self._decoded: Dict[int, Destination] = {}
+    
+    @classmethod
+    def open(cls, path: str) -> "CatalogSnapshot":
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, path)
+    
+    def record(self, position: int, catalog: str, group: Optional[str] = None) -> Destination:
+        """Decode one record into a Destination, memoized per process"""
+        record = self._decoded.get(position)
+        if record is None:
+            entry = self._index_offset + OFFSET.size * position
+            (start,) = OFFSET.unpack_from(self._buffer, entry)
+            (stop,) = OFFSET.unpack_from(self._buffer, entry + OFFSET.size)
+            base = self._data_offset
+            record = Destination.from_dict(_loads(self._buffer[base + start:base + stop]), catalog, group)
+            self._decoded[position] = record
+        return record
+    
+    def to_catalog(self):
+        """Expose the snapshot through the regular Catalog interface"""
+        from data.catalog import Catalog
+        
+        lists = {}
+        groups = {}
+        for name, spec in self.manifest["catalogs"].items():
+            if spec["kind"] == "list":
+                lists[name] = SnapshotRecords(self, spec["start"], spec["stop"], name)
+            else:
+                groups[name] = {
+                    key: dict(group["meta"], destinations=SnapshotRecords(self, group["start"], group["stop"], name, key))
+                    for key, group in spec["groups"].items()
+                }
+        
+        return Catalog(lists, groups, self.manifest["tables"], source="snapshot")
+
+def main(argv=None):
+    """Command line entry point for the snapshot build step"""
+    argv = sys.argv[1:] if argv is None else argv
+    path = build_snapshot(argv[0] if argv else None)
+    snapshot = CatalogSnapshot.open(path)
+    print(f"Catalog snapshot written to {path} ({snapshot.record_count} records, format v{FORMAT_VERSION})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,7 @@ Karnataka Tourism Destinations Data - Comprehensive Collection
 Including famous destinations and hidden gems with multimedia content
 """
 
-from services.photo_service import get_curated_photos, get_destination_video
+from services.photo_service import defer_media
 
 # Karnataka Tourism Video URLs
 KARNATAKA_VIDEOS = {
@@ -19,11 +19,9 @@ KARNATAKA_VIDEOS = {
 
 # Photo and video URLs for destinations
 def get_destination_media(destination_name, media_type="photo"):
-    """Generate media URLs for destinations"""
-    if media_type == "photo":
-        return get_curated_photos(destination_name)
-    elif media_type == "video":
-        return get_destination_video(destination_name)
+    """Deferred media list for destinations, resolved when first rendered"""
+    if media_type in ("photo", "video"):
+        return defer_media(destination_name, media_type)
     return None
 
 # Day trip destinations within 100km of Bangalore
@@ -147,8 +145,8 @@ DAY_TRIP_DESTINATIONS = [
         "difficulty": "Moderate",
         "best_season": "October to March",
         "facilities": ["Adventure Gear Rental", "Instructors", "Parking", "Food"],
-        "photos": [get_destination_media("Ramanagara", "photo")],
-        "videos": [get_destination_media("Ramanagara", "video")]
+        "photos": get_destination_media("Ramanagara", "photo"),
+        "videos": get_destination_media("Ramanagara", "video")
     },
     # Hidden Gems - Lesser Known Destinations
     {
@@ -166,8 +164,8 @@ DAY_TRIP_DESTINATIONS = [
         "best_season": "October to March",
         "facilities": ["Parking", "Basic Facilities", "Stone Path"],
         "description": "Hidden gem near Chintamani featuring a man-made cave temple with three shrines dedicated to Lord Shiva (Chathurmukhalingeshwara), Goddess Parvathi, and Lord Ganesha. Legend says Pandavas lived here during exile.",
-        "photos": [get_destination_media("Kailasagiri Cave Temple", "photo")],
-        "videos": [get_destination_media("Kailasagiri Cave Temple", "video")],
+        "photos": get_destination_media("Kailasagiri Cave Temple", "photo"),
+        "videos": get_destination_media("Kailasagiri Cave Temple", "video"),
         "hidden_gem": True
     },
     {
@@ -185,8 +183,8 @@ DAY_TRIP_DESTINATIONS = [
         "best_season": "October to March",
         "facilities": ["Parking", "Guide Services", "Basic Facilities"],
         "description": "Volcanic rock formation with natural caves and a perennial water source. Popular for cave exploration and night treks.",
-        "photos": [get_destination_media("Antaragange", "photo")],
-        "videos": [get_destination_media("Antaragange", "video")],
+        "photos": get_destination_media("Antaragange", "photo"),
+        "videos": get_destination_media("Antaragange", "video"),
         "hidden_gem": True
     },
     {
@@ -204,8 +202,8 @@ DAY_TRIP_DESTINATIONS = [
         "best_season": "October to March",
         "facilities": ["Parking", "Restrooms", "Food Stalls", "Temple Facilities"],
         "description": "Hill station at 3940 feet with ancient temples and natural spring called Namada Chilume.",
-        "photos": [get_destination_media("Devarayanadurga", "photo")],
-        "videos": [get_destination_media("Devarayanadurga", "video")],
+        "photos": get_destination_media("Devarayanadurga", "photo"),
+        "videos": get_destination_media("Devarayanadurga", "video"),
         "hidden_gem": True
     },
     {
@@ -223,8 +221,8 @@ DAY_TRIP_DESTINATIONS = [
         "best_season": "October to March",
         "facilities": ["Railway Station", "Basic Facilities", "Parking"],
         "description": "Unique trek that starts from a railway station and leads to an ancient hilltop fort with panoramic views.",
-        "photos": [get_destination_media("Makalidurga", "photo")],
-        "videos": [get_destination_media("Makalidurga", "video")],
+        "photos": get_destination_media("Makalidurga", "photo"),
+        "videos": get_destination_media("Makalidurga", "video"),
         "hidden_gem": True
     }
 ]
@@ -242,8 +240,8 @@ MULTI_DAY_DESTINATIONS = [
         "activities": ["Palace Tour", "Temple Visit", "Garden Walk", "Shopping"],
         "best_season": "October to March",
         "famous_for": "Royal Heritage, Silk Sarees, Sandalwood",
-        "photos": [get_destination_media("Mysore Palace", "photo")],
-        "videos": [get_destination_media("Mysore Palace", "video")]
+        "photos": get_destination_media("Mysore Palace", "photo"),
+        "videos": get_destination_media("Mysore Palace", "video")
     },
     {
         "id": 102,
@@ -256,8 +254,8 @@ MULTI_DAY_DESTINATIONS = [
         "activities": ["Plantation Tour", "Elephant Interaction", "River Rafting", "Trekking"],
         "best_season": "October to March",
         "famous_for": "Coffee, Spices, Natural Beauty",
-        "photos": [get_destination_media("Coorg Coffee Plantation", "photo")],
-        "videos": [get_destination_media("Coorg Coffee Plantation", "video")]
+        "photos": get_destination_media("Coorg Coffee Plantation", "photo"),
+        "videos": get_destination_media("Coorg Coffee Plantation", "video")
     },
     {
         "id": 103,
@@ -270,8 +268,8 @@ MULTI_DAY_DESTINATIONS = [
         "activities": ["Heritage Walk", "Coracle Ride", "Rock Climbing", "Photography"],
         "best_season": "October to February",
         "famous_for": "UNESCO World Heritage Site, Ancient Architecture",
-        "photos": [get_destination_media("Hampi Vittala Temple", "photo")],
-        "videos": [get_destination_media("Hampi Vittala Temple", "video")]
+        "photos": get_destination_media("Hampi Vittala Temple", "photo"),
+        "videos": get_destination_media("Hampi Vittala Temple", "video")
     },
     {
         "id": 104,
@@ -284,8 +282,8 @@ MULTI_DAY_DESTINATIONS = [
         "activities": ["Beach Activities", "Temple Visit", "Trekking", "Water Sports"],
         "best_season": "October to March",
         "famous_for": "Pristine Beaches, Spiritual Significance",
-        "photos": [get_destination_media("Gokarna Om Beach", "photo")],
-        "videos": [get_destination_media("Gokarna Om Beach", "video")]
+        "photos": get_destination_media("Gokarna Om Beach", "photo"),
+        "videos": get_destination_media("Gokarna Om Beach", "video")
     },
     {
         "id": 105,
@@ -298,8 +296,8 @@ MULTI_DAY_DESTINATIONS = [
         "activities": ["Trekking", "Plantation Tour", "Waterfall Visit", "Wildlife Safari"],
         "best_season": "September to March",
         "famous_for": "Coffee Origin, Trekking, Natural Beauty",
-        "photos": [get_destination_media("Chikmagalur Mullayanagiri", "photo")],
-        "videos": [get_destination_media("Chikmagalur Mullayanagiri", "video")]
+        "photos": get_destination_media("Chikmagalur Mullayanagiri", "photo"),
+        "videos": get_destination_media("Chikmagalur Mullayanagiri", "video")
     },
     # Hidden Gems - Multi-day destinations
     {
@@ -314,8 +312,8 @@ MULTI_DAY_DESTINATIONS = [
         "best_season": "October to March",
         "famous_for": "Cherrapunji of South India, Rainforest",
         "description": "Known as the Cherrapunji of South India, Agumbe receives the highest rainfall in Karnataka and offers stunning sunset views.",
-        "photos": [get_destination_media("Agumbe Sunset", "photo")],
-        "videos": [get_destination_media("Agumbe Sunset", "video")],
+        "photos": get_destination_media("Agumbe Sunset", "photo"),
+        "videos": get_destination_media("Agumbe Sunset", "video"),
         "hidden_gem": True
     },
     {
@@ -330,8 +328,8 @@ MULTI_DAY_DESTINATIONS = [
         "best_season": "October to March",
         "famous_for": "Unique Limestone Rock Formations",
         "description": "Unique limestone rock formations rising 90m high, accessible through dense forest trek.",
-        "photos": [get_destination_media("Yana Rocks", "photo")],
-        "videos": [get_destination_media("Yana Rocks", "video")],
+        "photos": get_destination_media("Yana Rocks", "photo"),
+        "videos": get_destination_media("Yana Rocks", "video"),
         "hidden_gem": True
     },
     {
@@ -346,8 +344,8 @@ MULTI_DAY_DESTINATIONS = [
         "best_season": "October to March",
         "famous_for": "Horse Face Peak, Biodiversity",
         "description": "Peak resembling a horse's face, part of Western Ghats with rich biodiversity.",
-        "photos": [get_destination_media("Kudremukh Peak", "photo")],
-        "videos": [get_destination_media("Kudremukh Peak", "video")],
+        "photos": get_destination_media("Kudremukh Peak", "photo"),
+        "videos": get_destination_media("Kudremukh Peak", "video"),
         "hidden_gem": True
     },
     {
@@ -362,8 +360,8 @@ MULTI_DAY_DESTINATIONS = [
         "best_season": "October to February",
         "famous_for": "Offbeat Trekking, Raw Wilderness",
         "description": "Hidden deep within Kudremukh National Park, this offbeat trail offers unspoiled Western Ghats views.",
-        "photos": [get_destination_media("Netravati Peak", "photo")],
-        "videos": [get_destination_media("Netravati Peak", "video")],
+        "photos": get_destination_media("Netravati Peak", "photo"),
+        "videos": get_destination_media("Netravati Peak", "video"),
         "hidden_gem": True
     },
     {
@@ -378,8 +376,8 @@ MULTI_DAY_DESTINATIONS = [
         "best_season": "October to March",
         "famous_for": "Railway Trek, Coffee Plantations",
         "description": "Hill station famous for railway track trekking through tunnels and bridges amidst coffee plantations.",
-        "photos": [get_destination_media("Sakleshpur Railway Trek", "photo")],
-        "videos": [get_destination_media("Sakleshpur Railway Trek", "video")],
+        "photos": get_destination_media("Sakleshpur Railway Trek", "photo"),
+        "videos": get_destination_media("Sakleshpur Railway Trek", "video"),
         "hidden_gem": True
     }
 ]
@@ -548,8 +546,8 @@ KARNATAKA_WATERFALLS = [
         "activities": ["Sightseeing", "Photography", "Trekking"],
         "entry_fee": 25,
         "facilities": ["Parking", "Viewpoints", "Cafeteria", "Restrooms"],
-        "photos": [get_destination_media("Jog Falls", "photo")],
-        "videos": [get_destination_media("Jog Falls", "video")],
+        "photos": get_destination_media("Jog Falls", "photo"),
+        "videos": get_destination_media("Jog Falls", "video"),
         "description": "The crown jewel of Karnataka waterfalls, Jog Falls plunges 253 meters in four distinct streams."
     },
     {
@@ -564,8 +562,8 @@ KARNATAKA_WATERFALLS = [
         "activities": ["Photography", "Nature Walk", "Plantation Tour"],
         "entry_fee": 30,
         "facilities": ["Parking", "Hanging Bridge", "Spice Garden", "Cafeteria"],
-        "photos": [get_destination_media("Abbey Falls", "photo")],
-        "videos": [get_destination_media("Abbey Falls", "video")],
+        "photos": get_destination_media("Abbey Falls", "photo"),
+        "videos": get_destination_media("Abbey Falls", "video"),
         "description": "Picturesque waterfall nestled amidst coffee and spice plantations in Coorg."
     },
     {
@@ -580,8 +578,8 @@ KARNATAKA_WATERFALLS = [
         "activities": ["Sightseeing", "Coracle Ride", "Photography", "Picnic"],
         "entry_fee": 20,
         "facilities": ["Parking", "Boat Services", "Viewpoints", "Food Stalls"],
-        "photos": [get_destination_media("Shivanasamudra Falls", "photo")],
-        "videos": [get_destination_media("Shivanasamudra Falls", "video")],
+        "photos": get_destination_media("Shivanasamudra Falls", "photo"),
+        "videos": get_destination_media("Shivanasamudra Falls", "video"),
         "description": "Twin waterfalls on River Cauvery, site of Asia's first hydroelectric power station."
     },
     {
@@ -596,8 +594,8 @@ KARNATAKA_WATERFALLS = [
         "activities": ["Trekking", "Photography", "Jeep Safari", "Swimming"],
         "entry_fee": 50,
         "facilities": ["Jeep Service", "Trekking Trails", "Basic Facilities"],
-        "photos": [get_destination_media("Hebbe Falls", "photo")],
-        "videos": [get_destination_media("Hebbe Falls", "video")],
+        "photos": get_destination_media("Hebbe Falls", "photo"),
+        "videos": get_destination_media("Hebbe Falls", "video"),
         "description": "Two-tier waterfall accessible through coffee plantation trek near Kemmangundi."
     },
     {
@@ -612,8 +610,8 @@ KARNATAKA_WATERFALLS = [
         "activities": ["Temple Visit", "Trekking", "Wildlife Spotting", "Photography"],
         "entry_fee": 25,
         "facilities": ["Temple", "Parking", "Trekking Trails", "Forest Department Rest House"],
-        "photos": [get_destination_media("Iruppu Falls", "photo")],
-        "videos": [get_destination_media("Iruppu Falls", "video")],
+        "photos": get_destination_media("Iruppu Falls", "photo"),
+        "videos": get_destination_media("Iruppu Falls", "video"),
         "description": "Sacred waterfall in Brahmagiri range, associated with Rameshwara Temple."
     },
     # Hidden Waterfall Gems
@@ -629,8 +627,8 @@ KARNATAKA_WATERFALLS = [
         "activities": ["Trekking", "Photography", "Bird Watching", "Nature Study"],
         "entry_fee": 30,
         "facilities": ["Forest Trek", "Basic Facilities", "Guide Services"],
-        "photos": [get_destination_media("Barkana Falls", "photo")],
-        "videos": [get_destination_media("Barkana Falls", "video")],
+        "photos": get_destination_media("Barkana Falls", "photo"),
+        "videos": get_destination_media("Barkana Falls", "video"),
         "description": "India's 10th highest waterfall, hidden in Agumbe rainforest, requires forest trek.",
         "hidden_gem": True
     },
@@ -646,8 +644,8 @@ KARNATAKA_WATERFALLS = [
         "activities": ["Trekking", "Photography", "Rainforest Exploration"],
         "entry_fee": 25,
         "facilities": ["Forest Trek", "Basic Facilities"],
-        "photos": [get_destination_media("Onake Abbi Falls", "photo")],
-        "videos": [get_destination_media("Onake Abbi Falls", "video")],
+        "photos": get_destination_media("Onake Abbi Falls", "photo"),
+        "videos": get_destination_media("Onake Abbi Falls", "video"),
         "description": "Named after pestle-shaped rock formation, hidden gem in Agumbe rainforest.",
         "hidden_gem": True
     },
@@ -663,8 +661,8 @@ KARNATAKA_WATERFALLS = [
         "activities": ["Trekking", "Photography", "Nature Walk"],
         "entry_fee": 20,
         "facilities": ["Viewpoints", "Trekking Trails", "Basic Facilities"],
-        "photos": [get_destination_media("Magod Falls", "photo")],
-        "videos": [get_destination_media("Magod Falls", "video")],
+        "photos": get_destination_media("Magod Falls", "photo"),
+        "videos": get_destination_media("Magod Falls", "video"),
         "description": "Two-stage waterfall on Bedthi River, relatively unexplored gem in Western Ghats.",
         "hidden_gem": True
     },
@@ -680,8 +678,8 @@ KARNATAKA_WATERFALLS = [
         "activities": ["Trekking", "Photography", "Swimming", "Picnic"],
         "entry_fee": 15,
         "facilities": ["Trekking Path", "Viewpoints", "Basic Facilities"],
-        "photos": [get_destination_media("Unchalli Falls", "photo")],
-        "videos": [get_destination_media("Unchalli Falls", "video")],
+        "photos": get_destination_media("Unchalli Falls", "photo"),
+        "videos": get_destination_media("Unchalli Falls", "video"),
         "description": "Also known as Lushington Falls, formed by Aghanashini River in pristine Western Ghats.",
         "hidden_gem": True
     },
@@ -697,8 +695,8 @@ KARNATAKA_WATERFALLS = [
         "activities": ["Photography", "Picnic", "Nature Walk", "Swimming"],
         "entry_fee": 10,
         "facilities": ["Parking", "Picnic Spots", "Basic Facilities"],
-        "photos": [get_destination_media("Sathodi Falls", "photo")],
-        "videos": [get_destination_media("Sathodi Falls", "video")],
+        "photos": get_destination_media("Sathodi Falls", "photo"),
+        "videos": get_destination_media("Sathodi Falls", "video"),
         "description": "Known as Mini Niagara of India, multiple streams cascading over rocks on Kali River.",
         "hidden_gem": True
     }
@@ -720,8 +718,8 @@ KARNATAKA_HERITAGE_SITES = [
         "entry_fee": 40,
         "best_time": "October to March",
         "facilities": ["Museum", "Guide Services", "Parking", "Cafeteria"],
-        "photos": [get_destination_media("Hampi Vittala Temple", "photo")],
-        "videos": [get_destination_media("Hampi Heritage", "video")],
+        "photos": get_destination_media("Hampi Vittala Temple", "photo"),
+        "videos": get_destination_media("Hampi Heritage", "video"),
         "description": "UNESCO World Heritage Site, ruins of the magnificent Vijayanagara Empire capital."
     },
     {
@@ -738,8 +736,8 @@ KARNATAKA_HERITAGE_SITES = [
         "entry_fee": 30,
         "best_time": "October to March",
         "facilities": ["Museum", "Guide Services", "Parking"],
-        "photos": [get_destination_media("Pattadakal Temples", "photo")],
-        "videos": [get_destination_media("Pattadakal Heritage", "video")],
+        "photos": get_destination_media("Pattadakal Temples", "photo"),
+        "videos": get_destination_media("Pattadakal Heritage", "video"),
         "description": "UNESCO site showcasing evolution of temple architecture from Dravidian to Nagara styles."
     },
     {
@@ -756,8 +754,8 @@ KARNATAKA_HERITAGE_SITES = [
         "entry_fee": 25,
         "best_time": "October to March",
         "facilities": ["Parking", "Boat Services", "Cafeteria", "Guide Services"],
-        "photos": [get_destination_media("Badami Caves", "photo")],
-        "videos": [get_destination_media("Badami Caves", "video")],
+        "photos": get_destination_media("Badami Caves", "photo"),
+        "videos": get_destination_media("Badami Caves", "video"),
         "description": "Ancient rock-cut cave temples showcasing early Chalukyan architecture and art."
     },
     # Hidden Heritage Gems
@@ -775,8 +773,8 @@ KARNATAKA_HERITAGE_SITES = [
         "entry_fee": 15,
         "best_time": "October to March",
         "facilities": ["Parking", "Basic Facilities", "Local Guides"],
-        "photos": [get_destination_media("Aihole Temples", "photo")],
-        "videos": [get_destination_media("Aihole Heritage", "video")],
+        "photos": get_destination_media("Aihole Temples", "photo"),
+        "videos": get_destination_media("Aihole Heritage", "video"),
         "description": "Cradle of Indian temple architecture with 125+ temples spanning different periods.",
         "hidden_gem": True
     },
@@ -794,8 +792,8 @@ KARNATAKA_HERITAGE_SITES = [
         "entry_fee": 25,
         "best_time": "October to March",
         "facilities": ["Museum", "Parking", "Guide Services"],
-        "photos": [get_destination_media("Halebidu Temple", "photo")],
-        "videos": [get_destination_media("Halebidu Heritage", "video")],
+        "photos": get_destination_media("Halebidu Temple", "photo"),
+        "videos": get_destination_media("Halebidu Heritage", "video"),
         "description": "Masterpiece of Hoysala architecture with incredibly detailed stone carvings.",
         "hidden_gem": True
     }
@@ -813,8 +811,8 @@ KARNATAKA_BEACHES = [
         "activities": ["Beach Trekking", "Water Sports", "Temple Visit", "Sunset Viewing"],
         "best_time": "October to March",
         "facilities": ["Accommodation", "Restaurants", "Water Sports", "Temple"],
-        "photos": [get_destination_media("Gokarna Om Beach", "photo")],
-        "videos": [get_destination_media("Gokarna Beaches", "video")],
+        "photos": get_destination_media("Gokarna Om Beach", "photo"),
+        "videos": get_destination_media("Gokarna Beaches", "video"),
         "description": "Sacred town with pristine beaches, perfect blend of spirituality and natural beauty."
     },
     {
@@ -827,8 +825,8 @@ KARNATAKA_BEACHES = [
         "activities": ["Water Sports", "Island Hopping", "Dolphin Spotting", "Fishing"],
         "best_time": "October to March",
         "facilities": ["Naval Base", "Resorts", "Water Sports Center", "Boat Services"],
-        "photos": [get_destination_media("Karwar Beach", "photo")],
-        "videos": [get_destination_media("Karwar Beach", "video")],
+        "photos": get_destination_media("Karwar Beach", "photo"),
+        "videos": get_destination_media("Karwar Beach", "video"),
         "description": "Pristine beaches with naval heritage and excellent water sports facilities."
     }
 ]
\ No newline at end of file
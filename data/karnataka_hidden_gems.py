@@ -3,7 +3,7 @@ Comprehensive Karnataka Hidden Gems Database
 Lesser-known destinations across all districts of Karnataka
 """
 
-from services.photo_service import get_curated_photos, get_destination_video
+from services.photo_service import defer_media
 
 # Karnataka Hidden Gems by Region
 KARNATAKA_HIDDEN_GEMS = {
@@ -24,7 +24,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Rock climbing", "Cave exploration", "Forest trekking", "Photography"],
                 "best_time": "October to March",
                 "entry_fee": 30,
-                "photos": get_curated_photos("Yana Rocks Karnataka"),
+                "photos": defer_media("Yana Rocks Karnataka"),
                 "hidden_gem": True
             },
             {
@@ -38,7 +38,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Photography", "Swimming", "Picnic", "Nature walk"],
                 "best_time": "June to February",
                 "entry_fee": 10,
-                "photos": get_curated_photos("Sathodi Falls Uttara Kannada"),
+                "photos": defer_media("Sathodi Falls Uttara Kannada"),
                 "hidden_gem": True
             },
             {
@@ -52,7 +52,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Trekking", "Photography", "Nature study"],
                 "best_time": "June to February",
                 "entry_fee": 20,
-                "photos": get_curated_photos("Magod Falls Karnataka"),
+                "photos": defer_media("Magod Falls Karnataka"),
                 "hidden_gem": True
             },
             {
@@ -66,7 +66,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Trekking", "Photography", "Swimming", "Bird watching"],
                 "best_time": "June to February",
                 "entry_fee": 15,
-                "photos": get_curated_photos("Unchalli Falls Karnataka"),
+                "photos": defer_media("Unchalli Falls Karnataka"),
                 "hidden_gem": True
             },
             {
@@ -80,7 +80,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Forest trekking", "Photography", "Nature study", "Bird watching"],
                 "best_time": "June to January",
                 "entry_fee": 25,
-                "photos": get_curated_photos("Vibhooti Falls Uttara Kannada"),
+                "photos": defer_media("Vibhooti Falls Uttara Kannada"),
                 "hidden_gem": True
             }
         ]
@@ -102,7 +102,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Rainforest trekking", "Sunset viewing", "Wildlife spotting", "Photography"],
                 "best_time": "October to March",
                 "entry_fee": 25,
-                "photos": get_curated_photos("Agumbe Rainforest Karnataka"),
+                "photos": defer_media("Agumbe Rainforest Karnataka"),
                 "hidden_gem": True
             },
             {
@@ -116,7 +116,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Forest trekking", "Photography", "Bird watching", "Nature study"],
                 "best_time": "June to February",
                 "entry_fee": 30,
-                "photos": get_curated_photos("Barkana Falls Agumbe"),
+                "photos": defer_media("Barkana Falls Agumbe"),
                 "hidden_gem": True
             },
             {
@@ -130,7 +130,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Trekking", "Photography", "Rock formation study"],
                 "best_time": "June to February",
                 "entry_fee": 25,
-                "photos": get_curated_photos("Onake Abbi Falls"),
+                "photos": defer_media("Onake Abbi Falls"),
                 "hidden_gem": True
             },
             {
@@ -144,7 +144,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Forest trekking", "Swimming", "Photography", "Picnic"],
                 "best_time": "June to January",
                 "entry_fee": 20,
-                "photos": get_curated_photos("Dabbe Falls Shivamogga"),
+                "photos": defer_media("Dabbe Falls Shivamogga"),
                 "hidden_gem": True
             },
             {
@@ -158,7 +158,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Trekking", "Temple visit", "Sunset viewing", "Wildlife spotting"],
                 "best_time": "October to March",
                 "entry_fee": 50,
-                "photos": get_curated_photos("Kodachadri Peak Karnataka"),
+                "photos": defer_media("Kodachadri Peak Karnataka"),
                 "hidden_gem": False
             }
         ]
@@ -180,7 +180,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Wilderness trekking", "Bird watching", "Photography", "Camping"],
                 "best_time": "October to February",
                 "entry_fee": 100,
-                "photos": get_curated_photos("Netravati Peak Kudremukh"),
+                "photos": defer_media("Netravati Peak Kudremukh"),
                 "hidden_gem": True
             },
             {
@@ -194,7 +194,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Trekking", "Sunrise viewing", "Plantation walk", "Photography"],
                 "best_time": "October to March",
                 "entry_fee": 30,
-                "photos": get_curated_photos("Pandavar Gudda Chikmagalur"),
+                "photos": defer_media("Pandavar Gudda Chikmagalur"),
                 "hidden_gem": True
             },
             {
@@ -208,7 +208,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Challenging trekking", "Wildlife spotting", "Photography", "Adventure"],
                 "best_time": "October to February",
                 "entry_fee": 40,
-                "photos": get_curated_photos("Ettina Bhuja Trek"),
+                "photos": defer_media("Ettina Bhuja Trek"),
                 "hidden_gem": True
             },
             {
@@ -222,7 +222,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Valley exploration", "Garden walks", "Photography", "Nature study"],
                 "best_time": "September to March",
                 "entry_fee": 35,
-                "photos": get_curated_photos("Kemmangundi Hidden Valleys"),
+                "photos": defer_media("Kemmangundi Hidden Valleys"),
                 "hidden_gem": True
             }
         ]
@@ -244,7 +244,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Beach walks", "Fishing", "Sunset viewing", "Photography"],
                 "best_time": "October to March",
                 "entry_fee": 0,
-                "photos": get_curated_photos("Hoode Beach Udupi"),
+                "photos": defer_media("Hoode Beach Udupi"),
                 "hidden_gem": True
             },
             {
@@ -258,7 +258,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Beach exploration", "Lighthouse visit", "Rock climbing", "Solitude"],
                 "best_time": "October to March",
                 "entry_fee": 10,
-                "photos": get_curated_photos("Kodi Beach Lighthouse"),
+                "photos": defer_media("Kodi Beach Lighthouse"),
                 "hidden_gem": True
             },
             {
@@ -272,7 +272,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Beach walks", "Temple visit", "Photography", "Peaceful retreat"],
                 "best_time": "October to March",
                 "entry_fee": 0,
-                "photos": get_curated_photos("Byndoor Beach Karnataka"),
+                "photos": defer_media("Byndoor Beach Karnataka"),
                 "hidden_gem": True
             },
             {
@@ -286,7 +286,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Beach relaxation", "Cultural interaction", "Photography", "Coconut climbing"],
                 "best_time": "October to March",
                 "entry_fee": 0,
-                "photos": get_curated_photos("Trasi Beach Udupi"),
+                "photos": defer_media("Trasi Beach Udupi"),
                 "hidden_gem": True
             }
         ]
@@ -308,7 +308,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Cave exploration", "Temple visit", "Trekking", "Spiritual experience"],
                 "best_time": "October to March",
                 "entry_fee": 0,
-                "photos": get_curated_photos("Kailasagiri Cave Temple Chintamani"),
+                "photos": defer_media("Kailasagiri Cave Temple Chintamani"),
                 "hidden_gem": True
             },
             {
@@ -322,7 +322,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Heritage exploration", "Temple visits", "Mythology study", "Photography"],
                 "best_time": "October to March",
                 "entry_fee": 20,
-                "photos": get_curated_photos("Avani Betta Ramayana"),
+                "photos": defer_media("Avani Betta Ramayana"),
                 "hidden_gem": True
             },
             {
@@ -336,7 +336,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Trekking", "Temple visit", "Meditation", "Photography"],
                 "best_time": "October to March",
                 "entry_fee": 15,
-                "photos": get_curated_photos("Markandeya Hill Kolar"),
+                "photos": defer_media("Markandeya Hill Kolar"),
                 "hidden_gem": True
             },
             {
@@ -350,7 +350,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Rock climbing", "Sunrise viewing", "Adventure sports", "Photography"],
                 "best_time": "October to March",
                 "entry_fee": 25,
-                "photos": get_curated_photos("Kolar Betta Adventure"),
+                "photos": defer_media("Kolar Betta Adventure"),
                 "hidden_gem": True
             }
         ]
@@ -372,7 +372,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Railway trekking", "Tunnel exploration", "Photography", "Heritage study"],
                 "best_time": "October to March",
                 "entry_fee": 50,
-                "photos": get_curated_photos("Sakleshpur Hidden Railway Tunnels"),
+                "photos": defer_media("Sakleshpur Hidden Railway Tunnels"),
                 "hidden_gem": True
             },
             {
@@ -386,7 +386,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Fort exploration", "History study", "Photography", "Architecture appreciation"],
                 "best_time": "October to March",
                 "entry_fee": 30,
-                "photos": get_curated_photos("Manjarabad Fort Secret Passages"),
+                "photos": defer_media("Manjarabad Fort Secret Passages"),
                 "hidden_gem": True
             },
             {
@@ -400,7 +400,7 @@ KARNATAKA_HIDDEN_GEMS = {
                 "activities": ["Temple exploration", "Architecture study", "Photography", "Peaceful meditation"],
                 "best_time": "October to March",
                 "entry_fee": 25,
-                "photos": get_curated_photos("Belur Hidden Hoysala Temples"),
+                "photos": defer_media("Belur Hidden Hoysala Temples"),
                 "hidden_gem": True
             }
         ]
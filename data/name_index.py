@@ -0,0 +1,185 @@
+"""
+Destination name index for Karnataka Travel Planner
+Resolves free-text destination names (as used in the seasonal, difficulty,
+photography and sample itinerary tables) to canonical catalog records
+"""
+
+import logging
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Mapping
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from data.catalog import GROUPED_CATALOGS, get_catalog
+from data.records import Destination
+
+logger = logging.getLogger(__name__)
+
+# Earlier catalogs win when the same place appears in several of them
+CATALOG_PRIORITY = (
+    "hidden_gems", "direction_itineraries", "waterfalls", "heritage_sites",
+    "beaches", "multi_day", "day_trips",
+)
+
+# Tables whose "destinations" lists (or plain lists) reference catalog names
+NAME_TABLES = ("seasonal_hidden_gems", "difficulty_based_gems", "photography_gems", "sample_itineraries")
+
+# Key kinds, best first
+FULL_NAME, ALIAS, WORD_SUFFIX = 0, 1, 2
+
+FUZZY_THRESHOLD = 0.6
+
+_PARENTHESES = re.compile(r"\(([^)]*)\)")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+def normalize_name(name: str) -> str:
+    """Lowercase, punctuation-free, single spaced form of a name"""
+    return _NON_WORD.sub(" ", name.lower()).strip()
+
+def _trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _name_keys(name: str) -> List[Tuple[str, int]]:
+    """Full name, parenthesised aliases and word suffixes of a name"""
+    keys = [(normalize_name(name), FULL_NAME)]
+    
+    base = normalize_name(_PARENTHESES.sub(" ", name))
+    keys.append((base, ALIAS))
+    keys.extend((normalize_name(alias), ALIAS) for alias in _PARENTHESES.findall(name))
+    
+    # "hesaraghatta lake nrityagram" also answers "nrityagram ..." prefixes
+    words = base.split()
+    keys.extend((" ".join(words[i:]), WORD_SUFFIX) for i in range(1, len(words)))
+    
+    return [(key, kind) for key, kind in keys if key]
+
+class NameIndex:
+    """Exact, prefix and trigram lookups over destination names"""
+    
+    def __init__(self, destinations: Iterable[Destination]):
+        self.records: List[Destination] = []
+        self._exact: Dict[str, int] = {}
+        entries = []
+        postings = defaultdict(list)
+        self._key_trigram_counts: List[int] = []
+        self._fuzzy_keys: List[Tuple[str, int]] = []
+        
+        for dest in destinations:
+            position = len(self.records)
+            self.records.append(dest)
+            for key, kind in _name_keys(dest.name):
+                entries.append((key, kind, position))
+                if kind != WORD_SUFFIX:
+                    self._exact.setdefault(key, position)
+                    key_id = len(self._fuzzy_keys)
+                    self._fuzzy_keys.append((key, position))
+                    grams = _trigrams(key)
+                    self._key_trigram_counts.append(len(grams))
+                    for gram in grams:
+                        postings[gram].append(key_id)
+        
+        # Sorted by key so prefix matches are one contiguous, bisectable run
+        entries.sort()
+        self._keys = [entry[0] for entry in entries]
+        self._entries = entries
+        self._postings = dict(postings)
+        self._memo: Dict[str, Optional[Destination]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def exact(self, name: str) -> Optional[Destination]:
+        position = self._exact.get(normalize_name(name))
+        return self.records[position] if position is not None else None
+    
+    def prefix(self, name: str) -> Optional[Destination]:
+        """Best record whose name (or a trailing part of it) starts with ``name``"""
+        query = normalize_name(name)
+        if not query:
+            return None
+        
+        best = None
+        start = bisect_left(self._keys, query)
+        for i in range(start, len(self._entries)):
+            key, kind, position = self._entries[i]
+            if not key.startswith(query):
+                break
+            # Insertion order already follows catalog priority
+            rank = (kind, position)
+            if best is None or rank < best:
+                best = rank
+        return self.records[best[1]] if best else None
+    
+    def fuzzy(self, name: str, threshold: float = FUZZY_THRESHOLD) -> Optional[Destination]:
+        """Closest record by trigram Jaccard similarity, if above ``threshold``"""
+        query = normalize_name(name)
+        grams = _trigrams(query)
+        overlap = defaultdict(int)
+        for gram in grams:
+            for key_id in self._postings.get(gram, ()):
+                overlap[key_id] += 1
+        
+        best_score, best_position = 0.0, None
+        for key_id, shared in overlap.items():
+            score = shared / (len(grams) + self._key_trigram_counts[key_id] - shared)
+            position = self._fuzzy_keys[key_id][1]
+            if score > best_score or (score == best_score and best_position is not None and position < best_position):
+                best_score, best_position = score, position
+        
+        if best_position is None or best_score < threshold:
+            return None
+        return self.records[best_position]
+    
+    def lookup(self, name: str) -> Optional[Destination]:
+        """Exact, then prefix, then fuzzy match; memoized"""
+        if name in self._memo:
+            return self._memo[name]
+        result = self.exact(name) or self.prefix(name) or self.fuzzy(name)
+        self._memo[name] = result
+        return result
+    
+    def unresolved(self, names: Iterable[str]) -> List[str]:
+        """Names that do not resolve to any record"""
+        return [name for name in names if self.lookup(name) is None]
+
+def build_name_index(catalog) -> NameIndex:
+    """Index every catalog, in CATALOG_PRIORITY order"""
+    def records(name):
+        if name in GROUPED_CATALOGS:
+            return [dest for group in catalog.groups(name).values() for dest in group["destinations"]]
+        return catalog.destinations(name)
+    
+    return NameIndex(dest for name in CATALOG_PRIORITY for dest in records(name))
+
+def referenced_names(catalog) -> Dict[str, List[str]]:
+    """Destination names referenced by the lookup tables, keyed "table.entry" """
+    references = {}
+    for table_name in NAME_TABLES:
+        for key, entry in catalog.table(table_name).items():
+            names = entry["destinations"] if isinstance(entry, Mapping) else entry
+            references[f"{table_name}.{key}"] = list(names)
+    return references
+
+def audit_names(index: NameIndex, catalog) -> Dict[str, List[str]]:
+    """Referenced names that match no catalog record, keyed "table.entry" """
+    report = {}
+    for reference, names in referenced_names(catalog).items():
+        missing = index.unresolved(names)
+        if missing:
+            report[reference] = missing
+    return report
+
+_index = None
+
+def get_name_index() -> NameIndex:
+    """Process-wide name index over the shared catalog"""
+    global _index
+    if _index is None:
+        catalog = get_catalog()
+        index = build_name_index(catalog)
+        for reference, missing in audit_names(index, catalog).items():
+            logger.warning("Unresolved destination names in %s: %s", reference, ", ".join(missing))
+        _index = index
+    return _index
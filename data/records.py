@@ -0,0 +1,192 @@
+"""
+Normalized destination record for Karnataka Travel Planner
+Every catalog is loaded into the same compact Destination type
+"""
+
+import re
+import sys
+from types import MappingProxyType
+from typing import Iterable, List, Optional
+
+from data.seasons import month_mask
+
+# Categories implied by catalogs whose records do not carry one
+CATALOG_CATEGORIES = {
+    "waterfalls": "Waterfalls",
+    "heritage_sites": "Heritage",
+    "beaches": "Beach",
+}
+
+# Source keys that were spelled differently across catalogs
+KEY_ALIASES = {
+    "distance_from_bangalore": "distance_km",
+    "estimated_time": "time_needed",
+}
+
+_SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
+
+def slugify(name: str) -> str:
+    """Lowercase, dash separated form of a destination name"""
+    return _SLUG_PATTERN.sub("-", name.lower()).strip("-")
+
+def freeze(value):
+    """Read-only copy of plain data: dicts become mapping proxies, lists tuples"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def _interned(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else None
+
+def _as_int(value) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        digits = re.sub(r"[^0-9]", "", str(value))
+        return int(digits) if digits else None
+
+class Destination:
+    """Compact, normalized, read-only destination record
+    
+    Hot render paths read attributes directly (``dest.distance_km``,
+    ``dest.lat``). For existing callers the record also answers the dict
+    protocol (``dest['name']``, ``dest.get('coordinates')``) including the
+    legacy key spellings. Fields missing from the source are None and are
+    reported as absent through the dict protocol. Records are shared by
+    every session in the process, so they cannot be modified.
+    """
+    
+    __slots__ = (
+        "uid", "id", "name", "catalog", "group", "category", "district",
+        "lat", "lon", "distance_km", "entry_fee", "best_time", "best_season",
+        "time_needed", "difficulty", "description", "highlights", "activities",
+        "facilities", "hidden_gem", "photos", "videos", "season_mask", "extra",
+    )
+    
+    FIELDS = (
+        "id", "name", "category", "district", "distance_km", "entry_fee",
+        "best_time", "best_season", "time_needed", "difficulty", "description",
+        "highlights", "activities", "facilities", "hidden_gem", "photos", "videos",
+    )
+    
+    def __init__(self, **fields):
+        for slot in self.__slots__:
+            object.__setattr__(self, slot, fields.get(slot))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Destination records are read-only (cannot set {name!r})")
+    
+    def __delattr__(self, name):
+        raise AttributeError(f"Destination records are read-only (cannot delete {name!r})")
+    
+    # Immutable, so copies can share the instance (Streamlit deep-copies widget options)
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        fields = {slot: getattr(self, slot) for slot in self.__slots__}
+        fields["extra"] = dict(self.extra) if self.extra else None
+        return _restore, (fields,)
+    
+    @classmethod
+    def from_dict(cls, record: dict, catalog: str, group: Optional[str] = None) -> "Destination":
+        """Normalize a raw catalog dict (any catalog's key spelling)"""
+        data = {KEY_ALIASES.get(key, key): value for key, value in record.items()}
+        
+        coordinates = data.pop("coordinates", None) or {}
+        lat = data.pop("lat", coordinates.get("lat"))
+        lon = data.pop("lon", coordinates.get("lon"))
+        
+        fields = {
+            "catalog": sys.intern(catalog),
+            "group": _interned(group),
+            "lat": float(lat) if lat is not None else None,
+            "lon": float(lon) if lon is not None else None,
+        }
+        for key in cls.FIELDS:
+            fields[key] = data.pop(key, None)
+        
+        fields["category"] = _interned(fields["category"] or CATALOG_CATEGORIES.get(catalog))
+        fields["district"] = _interned(fields["district"])
+        fields["difficulty"] = _interned(fields["difficulty"])
+        fields["distance_km"] = _as_int(fields["distance_km"])
+        fields["entry_fee"] = _as_int(fields["entry_fee"])
+        fields["hidden_gem"] = bool(fields["hidden_gem"])
+        # Parsed once here so season queries are bit tests (bit 0 = January)
+        fields["season_mask"] = month_mask(fields["best_season"] or fields["best_time"])
+        for key in ("highlights", "activities", "facilities"):
+            if fields[key] is not None:
+                fields[key] = tuple(fields[key])
+        
+        # Snapshot round trips carry these already; drop them from extra
+        data.pop("uid", None)
+        data.pop("catalog", None)
+        data.pop("group", None)
+        data.pop("season_mask", None)
+        fields["extra"] = freeze(data) if data else None
+        
+        local_id = fields["id"] if fields["id"] is not None else slugify(fields["name"])
+        fields["uid"] = "/".join(str(part) for part in (catalog, group, local_id) if part is not None)
+        
+        return cls(**fields)
+    
+    def to_dict(self) -> dict:
+        """Plain dict in the normalized key spelling"""
+        data = {key: getattr(self, key) for key in self.FIELDS if getattr(self, key) is not None}
+        if self.lat is not None:
+            data["coordinates"] = {"lat": self.lat, "lon": self.lon}
+        if self.extra:
+            data.update(self.extra)
+        return data
+    
+    # Dict protocol for existing callers
+    
+    def _lookup(self, key):
+        key = KEY_ALIASES.get(key, key)
+        if key == "coordinates":
+            return {"lat": self.lat, "lon": self.lon} if self.lat is not None else None
+        if key in _RECORD_KEYS:
+            return getattr(self, key)
+        if self.extra:
+            return self.extra.get(key)
+        return None
+    
+    def __getitem__(self, key):
+        value = self._lookup(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def get(self, key, default=None):
+        value = self._lookup(key)
+        return default if value is None else value
+    
+    def __contains__(self, key) -> bool:
+        return self._lookup(key) is not None
+    
+    def in_season(self, month: int) -> bool:
+        """Whether the destination's best season includes a 1-based month"""
+        return bool(self.season_mask >> (month - 1) & 1)
+    
+    def __repr__(self) -> str:
+        return f"Destination({self.uid!r}, {self.name!r})"
+
+def _restore(fields: dict) -> Destination:
+    """Unpickle a Destination, re-freezing its extra fields"""
+    if fields.get("extra"):
+        fields["extra"] = freeze(fields["extra"])
+    return Destination(**fields)
+
+_RECORD_KEYS = frozenset(Destination.__slots__) - {"extra"}
+
+def to_destinations(records: Iterable[dict], catalog: str, group: Optional[str] = None) -> List[Destination]:
+    """Load a catalog's raw records into Destination objects"""
+    return [Destination.from_dict(record, catalog, group) for record in records]
@@ -0,0 +1,75 @@
+"""
+Season parsing for Karnataka Travel Planner
+Turns free-text seasons ("October to March", "Post-monsoon (Oct-Feb)",
+"Year Round") into 12-bit month masks (bit 0 = January)
+"""
+
+import re
+from functools import lru_cache
+
+MONTHS = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+)
+
+ALL_MONTHS = (1 << 12) - 1
+
+# Karnataka seasons, matching utils.helpers.get_current_season
+SEASON_MONTHS = {
+    "winter": (12, 1, 2),
+    "summer": (3, 4, 5),
+    "monsoon": (6, 7, 8, 9),
+    "post_monsoon": (10, 11),
+}
+
+# Full month names or their three letter abbreviations ("Sept" too)
+_MONTH_TOKEN = re.compile(
+    r"\b(" + "|".join(f"{name[:3]}(?:{name[3:]})?" for name in MONTHS) + r"|sept)\b"
+    r"|(\bto\b|\bthrough\b|\buntil\b|[-–])"
+)
+_MONTH_NUMBERS = {name[:3]: number for number, name in enumerate(MONTHS, start=1)}
+_YEAR_ROUND = re.compile(r"year[\s-]*round|all[\s-]*year|any\s*time")
+_SEASON_WORD = re.compile(r"post[\s_-]*monsoon|winter|summer|monsoon")
+
+def months_to_mask(months) -> int:
+    """Mask with the given 1-based months set"""
+    mask = 0
+    for month in months:
+        mask |= 1 << (month - 1)
+    return mask
+
+def month_range_mask(start: int, end: int) -> int:
+    """Mask for an inclusive month range, wrapping over the new year"""
+    if start <= end:
+        return months_to_mask(range(start, end + 1))
+    return months_to_mask(range(start, 13)) | months_to_mask(range(1, end + 1))
+
+@lru_cache(maxsize=1024)
+def month_mask(text) -> int:
+    """Parse season text into a month mask; 0 when it names no months"""
+    if not text:
+        return 0
+    text = str(text).lower()
+    if _YEAR_ROUND.search(text):
+        return ALL_MONTHS
+    
+    mask = 0
+    previous = None
+    in_range = False
+    for match in _MONTH_TOKEN.finditer(text):
+        if match.group(2):
+            in_range = previous is not None
+            continue
+        month = _MONTH_NUMBERS[match.group(1)[:3]]
+        if in_range:
+            mask |= month_range_mask(previous, month)
+        else:
+            mask |= months_to_mask((month,))
+        previous, in_range = month, False
+    
+    # Season words only count when no explicit months were given
+    if not mask:
+        for word in _SEASON_WORD.findall(text):
+            key = "post_monsoon" if word.startswith("post") else word
+            mask |= months_to_mask(SEASON_MONTHS[key])
+    return mask
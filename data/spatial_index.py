@@ -0,0 +1,146 @@
+"""
+Spatial index for Karnataka Travel Planner
+A fixed lat/lon grid over every catalog's coordinates answering radius,
+k-nearest and bounding-box queries without scanning all destinations
+"""
+
+import math
+from collections import defaultdict
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from data.geo import KM_PER_DEGREE, haversine_km
+from data.name_index import get_name_index, normalize_name
+from data.records import Destination
+
+# ~28 km cells; small enough that a radius query touches a handful of cells
+CELL_DEGREES = 0.25
+
+class SpatialIndex:
+    """Grid of destination positions keyed by (row, col) cell"""
+    
+    def __init__(self, destinations: Iterable[Destination], cell_degrees: float = CELL_DEGREES):
+        self.cell_degrees = cell_degrees
+        self.records: List[Destination] = [dest for dest in destinations if dest.lat is not None]
+        self._cells = defaultdict(list)
+        for position, dest in enumerate(self.records):
+            self._cells[self._cell(dest.lat, dest.lon)].append(position)
+        
+        rows = [row for row, _ in self._cells] or [0]
+        cols = [col for _, col in self._cells] or [0]
+        self._row_range = (min(rows), max(rows))
+        self._col_range = (min(cols), max(cols))
+        # Widest latitude gives the narrowest longitude degree, the safe bound
+        max_abs_lat = max((abs(dest.lat) for dest in self.records), default=0.0)
+        self._min_cos_lat = max(math.cos(math.radians(max_abs_lat + cell_degrees)), 1e-6)
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_degrees), math.floor(lon / self.cell_degrees)
+    
+    def _positions_in_cells(self, row_min, row_max, col_min, col_max):
+        row_min, row_max = max(row_min, self._row_range[0]), min(row_max, self._row_range[1])
+        col_min, col_max = max(col_min, self._col_range[0]), min(col_max, self._col_range[1])
+        for row in range(row_min, row_max + 1):
+            for col in range(col_min, col_max + 1):
+                yield from self._cells.get((row, col), ())
+    
+    def bbox(self, south: float, west: float, north: float, east: float) -> List[Destination]:
+        """Destinations inside a bounding box, in index order"""
+        row_min, col_min = self._cell(south, west)
+        row_max, col_max = self._cell(north, east)
+        positions = sorted(self._positions_in_cells(row_min, row_max, col_min, col_max))
+        return [
+            self.records[p] for p in positions
+            if south <= self.records[p].lat <= north and west <= self.records[p].lon <= east
+        ]
+    
+    def radius(self, lat: float, lon: float, km: float,
+               where: Optional[Callable[[Destination], bool]] = None,
+               min_km: float = 0.0) -> List[Tuple[float, Destination]]:
+        """(distance, destination) pairs within ``km`` of a point, nearest first"""
+        dlat = km / KM_PER_DEGREE
+        dlon = km / (KM_PER_DEGREE * max(math.cos(math.radians(lat)), 1e-6))
+        row_min, col_min = self._cell(lat - dlat, lon - dlon)
+        row_max, col_max = self._cell(lat + dlat, lon + dlon)
+        
+        results = []
+        for position in self._positions_in_cells(row_min, row_max, col_min, col_max):
+            dest = self.records[position]
+            distance = haversine_km(lat, lon, dest.lat, dest.lon)
+            if min_km < distance <= km and (where is None or where(dest)):
+                results.append((distance, position))
+        results.sort()
+        return [(distance, self.records[position]) for distance, position in results]
+    
+    def nearest(self, lat: float, lon: float, k: int = 5,
+                where: Optional[Callable[[Destination], bool]] = None,
+                min_km: float = 0.0) -> List[Tuple[float, Destination]]:
+        """The ``k`` closest destinations to a point, nearest first
+        
+        Searches rings of cells outwards and stops once the k-th hit is closer
+        than anything an unvisited ring could contain.
+        """
+        if not self.records or k <= 0:
+            return []
+        
+        center_row, center_col = self._cell(lat, lon)
+        max_ring = max(
+            abs(center_row - self._row_range[0]), abs(center_row - self._row_range[1]),
+            abs(center_col - self._col_range[0]), abs(center_col - self._col_range[1]),
+        )
+        ring_km = self.cell_degrees * KM_PER_DEGREE * self._min_cos_lat
+        
+        found = []
+        for ring in range(max_ring + 1):
+            for row in range(center_row - ring, center_row + ring + 1):
+                for col in range(center_col - ring, center_col + ring + 1):
+                    # Only the outer edge of the square is new in this ring
+                    if ring and center_row - ring < row < center_row + ring and center_col - ring < col < center_col + ring:
+                        continue
+                    for position in self._cells.get((row, col), ()):
+                        dest = self.records[position]
+                        distance = haversine_km(lat, lon, dest.lat, dest.lon)
+                        if distance > min_km and (where is None or where(dest)):
+                            found.append((distance, position))
+            
+            found.sort()
+            del found[k:]
+            if len(found) == k and found[-1][0] <= ring * ring_km:
+                break
+        
+        return [(distance, self.records[position]) for distance, position in found]
+    
+    def nearby(self, dest: Destination, km: float = 100, k: int = 4,
+               where: Optional[Callable[[Destination], bool]] = None) -> List[Tuple[float, Destination]]:
+        """Up to ``k`` other destinations within ``km`` of ``dest``, nearest first
+        
+        Entries within half a kilometre are treated as the same place listed
+        in another catalog and skipped.
+        """
+        if dest.lat is None:
+            return []
+        found = self.nearest(dest.lat, dest.lon, k, where=where, min_km=0.5)
+        return [(distance, other) for distance, other in found if distance <= km]
+
+def build_spatial_index(records: Iterable[Destination]) -> SpatialIndex:
+    """Index records once per place, keeping the first spelling of each name"""
+    seen = set()
+    unique = []
+    for dest in records:
+        key = normalize_name(dest.name)
+        if key not in seen:
+            seen.add(key)
+            unique.append(dest)
+    return SpatialIndex(unique)
+
+_index = None
+
+def get_spatial_index() -> SpatialIndex:
+    """Process-wide spatial index over the shared catalog"""
+    global _index
+    if _index is None:
+        # The name index already holds every catalog in priority order
+        _index = build_spatial_index(get_name_index().records)
+    return _index
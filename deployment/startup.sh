@@ -18,6 +18,10 @@ echo "Installing dependencies..."
 pip install --upgrade pip
 pip install -r requirements.txt
 
+# Compile the destination catalogs into a memory-mapped snapshot shared by all workers
+echo "Building catalog snapshot..."
+python -m data.catalog_snapshot || echo "Catalog snapshot build failed, using data modules"
+
 # Set up logging
 echo "Setting up logging..."
 export STREAMLIT_LOGGER_LEVEL=INFO
@@ -4,11 +4,28 @@ Direction-wise Itinerary Pages for Karnataka Travel Planner
 
 import streamlit as st
 import folium
-from streamlit_folium import st_folium
 import plotly.express as px
-from data.bangalore_direction_itineraries import BANGALORE_DIRECTION_ITINERARIES, SAMPLE_ITINERARIES
-from data.karnataka_hidden_gems import KARNATAKA_HIDDEN_GEMS, SEASONAL_HIDDEN_GEMS, DIFFICULTY_BASED_GEMS
+from data.catalog import get_catalog
+from data.name_index import get_name_index
+from data.spatial_index import get_spatial_index
 from components.multimedia import multimedia_manager
+from services.photo_service import prefetch_photos
+from services.thumbnails import thumbnail
+from utils.map_cache import map_key, render_map
+from utils.map_markers import add_markers, destination_feature
+
+_catalog = get_catalog()
+BANGALORE_DIRECTION_ITINERARIES = _catalog.groups("direction_itineraries")
+SAMPLE_ITINERARIES = _catalog.table("sample_itineraries")
+KARNATAKA_HIDDEN_GEMS = _catalog.groups("hidden_gems")
+SEASONAL_HIDDEN_GEMS = _catalog.table("seasonal_hidden_gems")
+DIFFICULTY_BASED_GEMS = _catalog.table("difficulty_based_gems")
+
+# Padding around a region's gems when looking up other destinations for its map
+REGION_MAP_MARGIN_DEGREES = 0.2
+
+# Starting point shown on direction maps
+BANGALORE_CENTER = (12.9716, 77.5946)
 
 def show_direction_itineraries():
     """Main page for direction-wise itineraries from Bangalore"""
@@ -66,12 +83,14 @@ def display_direction_itinerary(itinerary, direction_key):
     with col3:
         st.metric("Destinations", len(itinerary['destinations']))
     with col4:
-        hidden_count = sum(1 for dest in itinerary['destinations'] if dest.get('hidden_gem', False))
+        hidden_count = sum(1 for dest in itinerary['destinations'] if dest.hidden_gem)
         st.metric("Hidden Gems", f"{hidden_count}/{len(itinerary['destinations'])}")
     
     # Destinations
     st.markdown("### 📍 Destinations in This Route")
     
+    prefetch_photos(dest.photos for dest in itinerary['destinations'])
+    
     for idx, destination in enumerate(itinerary['destinations']):
         with st.container():
             # Special styling for hidden gems
@@ -96,18 +115,18 @@ def display_direction_itinerary(itinerary, direction_key):
                 # Display photo if available
                 if destination.get('photos'):
                     st.image(
-                        destination['photos'][0] if isinstance(destination['photos'], list) else destination['photos'],
+                        thumbnail(destination['photos'][0]),
                         caption=destination['name'],
                         use_container_width=True
                     )
             
             with col2:
                 # Destination details
-                st.markdown(f"**📍 Distance:** {destination['distance_km']}km from Bangalore")
-                st.markdown(f"**🏷️ Category:** {destination['category']}")
-                st.markdown(f"**⏱️ Time Needed:** {destination['time_needed']}")
-                st.markdown(f"**💰 Entry Fee:** ₹{destination['entry_fee']}")
-                st.markdown(f"**🌟 Best Time:** {destination['best_time']}")
+                st.markdown(f"**📍 Distance:** {destination.distance_km}km from Bangalore")
+                st.markdown(f"**🏷️ Category:** {destination.category}")
+                st.markdown(f"**⏱️ Time Needed:** {destination.time_needed}")
+                st.markdown(f"**💰 Entry Fee:** ₹{destination.entry_fee}")
+                st.markdown(f"**🌟 Best Time:** {destination.best_time}")
                 
                 # Highlights
                 if destination.get('highlights'):
@@ -123,7 +142,7 @@ def display_direction_itinerary(itinerary, direction_key):
                 
                 with col_btn2:
                     if st.button(f"Get Directions", key=f"directions_{direction_key}_{idx}"):
-                        lat, lon = destination['coordinates']['lat'], destination['coordinates']['lon']
+                        lat, lon = destination.lat, destination.lon
                         maps_url = f"https://www.google.com/maps/dir/Bangalore/{lat},{lon}"
                         st.markdown(f"[🗺️ Open in Google Maps]({maps_url})")
             
@@ -136,51 +155,61 @@ def display_direction_itinerary(itinerary, direction_key):
                 activities_text = " • ".join(destination['activities'])
                 st.markdown(activities_text)
             
+            multimedia_manager.display_nearby_destinations(destination)
+            
             st.divider()
 
 def create_direction_map(itinerary, direction_key):
     """Create interactive map for the direction"""
     
+    destinations = itinerary['destinations']
+    
+    # Built and serialized once per itinerary
+    key = map_key((dest.uid for dest in destinations), "direction", BANGALORE_CENTER, 9)
+    map_data = render_map(key, lambda: build_direction_map(destinations), width=700, height=500)
+    
+    return map_data
+
+def build_direction_map(destinations):
+    """Folium map of an itinerary's destinations around Bangalore"""
+    
     # Create map centered on Bangalore
-    m = folium.Map(location=[12.9716, 77.5946], zoom_start=9)
+    m = folium.Map(location=BANGALORE_CENTER, zoom_start=9)
     
     # Add Bangalore marker
     folium.Marker(
-        [12.9716, 77.5946],
+        list(BANGALORE_CENTER),
         popup="Bangalore - Starting Point",
         tooltip="Bangalore",
         icon=folium.Icon(color='red', icon='home', prefix='fa')
     ).add_to(m)
     
-    # Add destination markers
-    for idx, dest in enumerate(itinerary['destinations']):
-        coords = dest['coordinates']
-        
-        # Different colors for hidden gems
-        color = 'purple' if dest.get('hidden_gem', False) else 'blue'
-        icon = 'star' if dest.get('hidden_gem', False) else 'map-pin'
-        
-        popup_html = f"""
-        <div style="width: 250px;">
-            <h4>{'💎 ' if dest.get('hidden_gem', False) else ''}{dest['name']}</h4>
-            <p><strong>Distance:</strong> {dest['distance_km']}km</p>
-            <p><strong>Category:</strong> {dest['category']}</p>
-            <p><strong>Time:</strong> {dest['time_needed']}</p>
-            <p>{dest['description'][:100]}...</p>
-        </div>
-        """
-        
-        folium.Marker(
-            [coords['lat'], coords['lon']],
-            popup=folium.Popup(popup_html, max_width=300),
-            tooltip=dest['name'],
-            icon=folium.Icon(color=color, icon=icon, prefix='fa')
-        ).add_to(m)
-    
-    # Display map
-    map_data = st_folium(m, width=700, height=500)
+    # Add destination markers; hidden gems get a purple star in the browser
+    features = [
+        destination_feature(
+            dest.lat, dest.lon, dest.name,
+            category=dest.category,
+            gem=dest.hidden_gem,
+            text=dest.description[:100],
+            km=dest.distance_km,
+            time=dest.time_needed
+        )
+        for dest in destinations
+    ]
+    add_markers(
+        m, features,
+        rows=[("Distance", "km", "km"), ("Category", "cat"), ("Time", "time")],
+        colors={},
+        color='blue',
+        icon='map-pin',
+        prefix='fa',
+        gem_icon='star',
+        gem_color='purple',
+        gem_prefix='💎 ',
+        popup_width=250
+    )
     
-    return map_data
+    return m
 
 def display_themed_itineraries():
     """Display themed itinerary combinations"""
@@ -248,18 +277,20 @@ def show_karnataka_hidden_gems():
     with col1:
         st.metric("Hidden Gems", len(destinations))
     with col2:
-        categories = set(dest['category'] for dest in destinations)
+        categories = set(dest.category for dest in destinations)
         st.metric("Categories", len(categories))
     with col3:
-        avg_distance = sum(dest['distance_from_bangalore'] for dest in destinations) // len(destinations)
+        avg_distance = sum(dest.distance_km for dest in destinations) // len(destinations)
         st.metric("Avg Distance", f"{avg_distance}km")
     with col4:
-        hidden_count = sum(1 for dest in destinations if dest.get('hidden_gem', True))
+        hidden_count = sum(1 for dest in destinations if dest.hidden_gem)
         st.metric("True Hidden Gems", hidden_count)
     
     # Display destinations
     st.markdown("### 🗺️ Hidden Gems in This Region")
     
+    prefetch_photos(dest.photos for dest in destinations)
+    
     for idx, destination in enumerate(destinations):
         with st.container():
             st.markdown(f"""
@@ -279,17 +310,17 @@ def show_karnataka_hidden_gems():
             with col1:
                 if destination.get('photos'):
                     st.image(
-                        destination['photos'][0] if isinstance(destination['photos'], list) else destination['photos'],
+                        thumbnail(destination['photos'][0]),
                         caption=destination['name'],
                         use_container_width=True
                     )
             
             with col2:
-                st.markdown(f"**📍 District:** {destination['district']}")
-                st.markdown(f"**🚗 Distance:** {destination['distance_from_bangalore']}km from Bangalore")
-                st.markdown(f"**🏷️ Category:** {destination['category']}")
-                st.markdown(f"**🌟 Best Time:** {destination['best_time']}")
-                st.markdown(f"**💰 Entry Fee:** ₹{destination['entry_fee']}")
+                st.markdown(f"**📍 District:** {destination.district}")
+                st.markdown(f"**🚗 Distance:** {destination.distance_km}km from Bangalore")
+                st.markdown(f"**🏷️ Category:** {destination.category}")
+                st.markdown(f"**🌟 Best Time:** {destination.best_time}")
+                st.markdown(f"**💰 Entry Fee:** ₹{destination.entry_fee}")
                 
                 # Highlights
                 if destination.get('highlights'):
@@ -315,6 +346,8 @@ def show_karnataka_hidden_gems():
                 activities_text = " • ".join(destination['activities'])
                 st.markdown(activities_text)
             
+            multimedia_manager.display_nearby_destinations(destination)
+            
             st.divider()
     
     # Regional map
@@ -328,37 +361,61 @@ def create_regional_map(region_data):
     destinations = region_data['destinations']
     
     # Calculate center point
-    avg_lat = sum(dest['coordinates']['lat'] for dest in destinations) / len(destinations)
-    avg_lon = sum(dest['coordinates']['lon'] for dest in destinations) / len(destinations)
+    avg_lat = sum(dest.lat for dest in destinations) / len(destinations)
+    avg_lon = sum(dest.lon for dest in destinations) / len(destinations)
+    
+    # Built and serialized once per region
+    key = map_key((dest.uid for dest in destinations), "regional", (avg_lat, avg_lon), 8)
+    map_data = render_map(key, lambda: build_regional_map(destinations, (avg_lat, avg_lon)), width=700, height=500)
+    
+    return map_data
+
+def build_regional_map(destinations, center):
+    """Folium map of a region's hidden gems with other nearby destinations for context"""
     
     # Create map
-    m = folium.Map(location=[avg_lat, avg_lon], zoom_start=8)
+    m = folium.Map(location=list(center), zoom_start=8)
+    
+    # Other catalog destinations within the region's bounds, as light context markers
+    region_names = {dest.name for dest in destinations}
+    south = min(dest.lat for dest in destinations) - REGION_MAP_MARGIN_DEGREES
+    north = max(dest.lat for dest in destinations) + REGION_MAP_MARGIN_DEGREES
+    west = min(dest.lon for dest in destinations) - REGION_MAP_MARGIN_DEGREES
+    east = max(dest.lon for dest in destinations) + REGION_MAP_MARGIN_DEGREES
+    for other in get_spatial_index().bbox(south, west, north, east):
+        if other.name not in region_names:
+            folium.CircleMarker(
+                [other.lat, other.lon],
+                radius=5,
+                color='gray',
+                fill=True,
+                tooltip=f"{other.name} ({other.category})"
+            ).add_to(m)
     
     # Add destination markers
-    for dest in destinations:
-        coords = dest['coordinates']
-        
-        popup_html = f"""
-        <div style="width: 250px;">
-            <h4>💎 {dest['name']}</h4>
-            <p><strong>District:</strong> {dest['district']}</p>
-            <p><strong>Category:</strong> {dest['category']}</p>
-            <p><strong>Distance:</strong> {dest['distance_from_bangalore']}km</p>
-            <p>{dest['description'][:100]}...</p>
-        </div>
-        """
-        
-        folium.Marker(
-            [coords['lat'], coords['lon']],
-            popup=folium.Popup(popup_html, max_width=300),
-            tooltip=dest['name'],
-            icon=folium.Icon(color='purple', icon='star', prefix='fa')
-        ).add_to(m)
-    
-    # Display map
-    map_data = st_folium(m, width=700, height=500)
+    features = [
+        destination_feature(
+            dest.lat, dest.lon, dest.name,
+            category=dest.category,
+            gem=True,
+            text=dest.description[:100],
+            district=dest.district,
+            km=dest.distance_km
+        )
+        for dest in destinations
+    ]
+    add_markers(
+        m, features,
+        rows=[("District", "district"), ("Category", "cat"), ("Distance", "km", "km")],
+        colors={},
+        color='purple',
+        icon='star',
+        prefix='fa',
+        gem_prefix='💎 ',
+        popup_width=250
+    )
     
-    return map_data
+    return m
 
 def show_seasonal_recommendations():
     """Display seasonal hidden gems recommendations"""
@@ -395,7 +452,7 @@ def show_seasonal_recommendations():
             
             if dest_details:
                 if dest_details.get('photos'):
-                    st.image(dest_details['photos'][0], use_container_width=True)
+                    st.image(thumbnail(dest_details['photos'][0]), use_container_width=True)
                 
                 st.markdown(f"📍 {dest_details.get('district', 'Karnataka')}")
                 st.markdown(f"🏷️ {dest_details.get('category', 'Hidden Gem')}")
@@ -404,14 +461,9 @@ def show_seasonal_recommendations():
                     st.success(f"Added {dest_name} to your {selected_season} itinerary!")
 
 def find_destination_details(dest_name):
-    """Find destination details from the hidden gems database"""
-    
-    for region_data in KARNATAKA_HIDDEN_GEMS.values():
-        for dest in region_data['destinations']:
-            if dest_name.lower() in dest['name'].lower():
-                return dest
+    """Find destination details across all catalogs (exact, prefix, then fuzzy)"""
     
-    return None
+    return get_name_index().lookup(dest_name)
 
 def show_difficulty_based_gems():
     """Display hidden gems based on difficulty level"""
@@ -445,13 +497,13 @@ def show_difficulty_based_gems():
                 
                 with col1:
                     if dest_details.get('photos'):
-                        st.image(dest_details['photos'][0], use_container_width=True)
+                        st.image(thumbnail(dest_details['photos'][0]), use_container_width=True)
                 
                 with col2:
                     st.markdown(f"### {dest_details['name']}")
                     st.markdown(f"**📍 District:** {dest_details.get('district', 'Karnataka')}")
                     st.markdown(f"**🏷️ Category:** {dest_details.get('category', 'Hidden Gem')}")
-                    st.markdown(f"**🚗 Distance:** {dest_details.get('distance_from_bangalore', 'N/A')}km")
+                    st.markdown(f"**🚗 Distance:** {dest_details.distance_km}km")
                     
                     if dest_details.get('highlights'):
                         st.markdown("**✨ Highlights:**")
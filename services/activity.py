@@ -0,0 +1,55 @@
+"""
+Live request tracking for Karnataka Travel Planner
+Counts lookups made on behalf of a user's page so background work can
+wait until the process is idle
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+# Background work resumes once no live lookup has run for this long (seconds)
+IDLE_GRACE = 1.0
+
+class LiveActivity:
+    """In-flight live lookups and when the last one finished"""
+    
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._active = 0
+        self._last_finished = 0.0
+    
+    @contextmanager
+    def track(self):
+        """Mark the enclosed block as serving a live request"""
+        with self._cond:
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._last_finished = time.monotonic()
+                self._cond.notify_all()
+    
+    @property
+    def active(self) -> int:
+        return self._active
+    
+    def is_idle(self, grace: float = IDLE_GRACE) -> bool:
+        with self._cond:
+            return self._active == 0 and time.monotonic() - self._last_finished >= grace
+    
+    def wait_idle(self, grace: float = IDLE_GRACE, stop: threading.Event = None) -> None:
+        """Block until no live lookup has run for ``grace`` seconds (or ``stop`` is set)"""
+        with self._cond:
+            while not (stop is not None and stop.is_set()):
+                if self._active:
+                    self._cond.wait(timeout=grace)
+                    continue
+                remaining = grace - (time.monotonic() - self._last_finished)
+                if remaining <= 0:
+                    return
+                self._cond.wait(timeout=remaining)
+
+live_activity = LiveActivity()
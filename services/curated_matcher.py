@@ -0,0 +1,72 @@
+"""
+Multi-pattern matcher for curated photo collections
+Aho-Corasick automaton over the lowercased collection keys, so matching a
+destination name costs one pass over the name however many keys exist
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional
+
+# Sentinel priority for automaton states that complete no key
+_NO_MATCH = float("inf")
+
+class CuratedMatcher:
+    """Finds which key of a mapping occurs in a name (case-insensitive)
+    
+    Keys keep the mapping's order as priority: when several occur in one
+    name, the earliest key wins, exactly as a loop over the keys would.
+    """
+    
+    def __init__(self, collections: Mapping[str, List[str]], memo_size: int = 4096):
+        self.keys = list(collections)
+        self.collections = collections
+        self._goto: List[Dict[str, int]] = [{}]
+        self._best: List[float] = [_NO_MATCH]
+        
+        for priority, key in enumerate(self.keys):
+            state = 0
+            for char in key.lower():
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._best.append(_NO_MATCH)
+                state = next_state
+            self._best[state] = min(self._best[state], priority)
+        
+        # Breadth-first failure links; each state inherits the best key of its suffixes
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._best[child] = min(self._best[child], self._best[self._fail[child]])
+                queue.append(child)
+        
+        self.match_key = lru_cache(maxsize=memo_size)(self._match_key)
+    
+    def _match_key(self, name: str) -> Optional[str]:
+        goto, fail, outputs = self._goto, self._fail, self._best
+        state = 0
+        best = outputs[0]  # an empty key matches every name
+        for char in name.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state] < best:
+                best = outputs[state]
+                if best == 0:
+                    break
+        return self.keys[best] if best != _NO_MATCH else None
+    
+    def match(self, name: str) -> Optional[List[str]]:
+        """Collection for the highest-priority key found in ``name``, if any"""
+        key = self.match_key(name)
+        return self.collections[key] if key is not None else None
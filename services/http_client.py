@@ -0,0 +1,183 @@
+"""
+Shared HTTP client for Karnataka Travel Planner
+Keep-alive connection pools per host, bounded retries with jittered
+backoff, and a per-host circuit breaker so a failing provider fails fast
+"""
+
+import logging
+import random
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 5
+DEFAULT_RETRIES = 2
+BACKOFF_BASE = 0.2   # seconds, doubled per attempt
+BACKOFF_MAX = 2.0
+POOL_MAXSIZE = 16
+
+# Open a host's circuit after this many consecutive failures, for this long
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30.0
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Only these are retried by default; a repeated POST could act twice
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised without a network call while a host's circuit is open"""
+
+class CircuitBreaker:
+    """Closed -> open after repeated failures -> half-open trial after a cool-down"""
+    
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+    
+    def allow(self) -> bool:
+        """Whether a request may go out now (one trial at a time when half-open)"""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                # A failed half-open trial re-opens the circuit for another cool-down
+                self.opened_at = time.monotonic()
+
+class HttpClient:
+    """Thread-safe GET/POST with pooled per-host sessions, retries and circuit breaking"""
+    
+    def __init__(self, retries: int = DEFAULT_RETRIES, timeout: float = DEFAULT_TIMEOUT,
+                 failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT):
+        self.retries = retries
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._sessions: Dict[str, requests.Session] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+    
+    def _host(self, url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+    
+    def session(self, url: str) -> requests.Session:
+        """Keep-alive session for the URL's host, created on first use"""
+        host = self._host(url)
+        session = self._sessions.get(host)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(host)
+                if session is None:
+                    session = requests.Session()
+                    # No cookie state is shared between the threads using a session
+                    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._sessions[host] = session
+        return session
+    
+    def breaker(self, url: str) -> CircuitBreaker:
+        host = self._host(url)
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return breaker
+    
+    def request(self, method: str, url: str, retries: Optional[int] = None, **kwargs) -> requests.Response:
+        """Send a request, retrying connection errors, timeouts and 429/5xx responses
+        
+        Only idempotent methods (RETRY_METHODS) are retried unless
+        ``retries`` is given. Raises CircuitOpenError straight away while
+        the host is failing, and the last error once retries are exhausted.
+        Other 4xx responses are returned as they are and do not count
+        against the host.
+        """
+        if retries is None:
+            retries = self.retries if method.upper() in RETRY_METHODS else 0
+        kwargs.setdefault("timeout", self.timeout)
+        breaker = self.breaker(url)
+        session = self.session(url)
+        
+        for attempt in range(retries + 1):
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {self._host(url)}")
+            
+            error = None
+            try:
+                response = session.request(method, url, **kwargs)
+                if response.status_code not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return response
+                error = requests.HTTPError(f"{response.status_code} from {self._host(url)}", response=response)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            except Exception:
+                # Not retried, but still ends a half-open trial
+                breaker.record_failure()
+                raise
+            breaker.record_failure()
+            
+            if attempt == retries:
+                if isinstance(error, requests.HTTPError):
+                    return error.response
+                raise error
+            
+            # Full jitter keeps workers that failed together from retrying together
+            delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+            logger.debug("Retrying %s %s in %.2fs after %s", method, url, delay, error)
+            time.sleep(delay)
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+    
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_http_client() -> HttpClient:
+    """Process-wide HTTP client shared by all services"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
@@ -0,0 +1,144 @@
+"""
+Persistent photo lookup cache for Karnataka Travel Planner
+SQLite-backed, shared by every worker process on the host, with a TTL and
+least-recently-used eviction once it holds more than a fixed number of keys
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.getenv(
+    "KTP_PHOTO_CACHE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "photos.sqlite3")
+)
+DEFAULT_TTL_SECONDS = int(os.getenv("KTP_PHOTO_CACHE_TTL", str(7 * 24 * 3600)))
+DEFAULT_MAX_ENTRIES = int(os.getenv("KTP_PHOTO_CACHE_MAX_ENTRIES", "5000"))
+
+# Skip rewriting the access time on hits more often than this (seconds)
+TOUCH_INTERVAL = 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS photo_lookups (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS photo_lookups_accessed ON photo_lookups (accessed);
+"""
+
+class PhotoCache:
+    """JSON values in SQLite keyed by lookup; errors behave as cache misses
+    
+    Each thread gets its own connection. WAL mode lets readers in other
+    processes carry on while one writer inserts, and writes run in
+    ``BEGIN IMMEDIATE`` transactions so insert + eviction is atomic.
+    """
+    
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._disabled = False
+    
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._disabled:
+            return None
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(_SCHEMA)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Photo cache %s unavailable, continuing without it: %s", self.path, e)
+                self._disabled = True
+                return None
+            self._local.conn = conn
+        return conn
+    
+    def get(self, key: str):
+        """Cached value, or None when missing, expired or unreadable"""
+        conn = self._connection()
+        if conn is None:
+            return None
+        
+        now = time.time()
+        try:
+            row = conn.execute(
+                "SELECT value, created, accessed FROM photo_lookups WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created, accessed = row
+            if now - created > self.ttl:
+                conn.execute("DELETE FROM photo_lookups WHERE key = ? AND created = ?", (key, created))
+                return None
+            if now - accessed > TOUCH_INTERVAL:
+                conn.execute("UPDATE photo_lookups SET accessed = ? WHERE key = ?", (now, key))
+            return json.loads(value)
+        except (sqlite3.Error, ValueError) as e:
+            logger.debug("Photo cache read failed for %s: %s", key, e)
+            return None
+    
+    def set(self, key: str, value) -> None:
+        """Store a value, then evict expired and least recently used keys"""
+        conn = self._connection()
+        if conn is None:
+            return
+        
+        now = time.time()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO photo_lookups (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value), now, now)
+                )
+                conn.execute("DELETE FROM photo_lookups WHERE created < ?", (now - self.ttl,))
+                (count,) = conn.execute("SELECT COUNT(*) FROM photo_lookups").fetchone()
+                if count > self.max_entries:
+                    conn.execute(
+                        "DELETE FROM photo_lookups WHERE key IN "
+                        "(SELECT key FROM photo_lookups ORDER BY accessed LIMIT ?)",
+                        (count - self.max_entries,)
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            logger.debug("Photo cache write failed for %s: %s", key, e)
+    
+    def clear(self) -> None:
+        conn = self._connection()
+        if conn is not None:
+            conn.execute("DELETE FROM photo_lookups")
+    
+    def __len__(self) -> int:
+        conn = self._connection()
+        if conn is None:
+            return 0
+        return conn.execute("SELECT COUNT(*) FROM photo_lookups").fetchone()[0]
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_photo_cache() -> PhotoCache:
+    """Process-wide handle on the shared on-disk photo cache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = PhotoCache()
+        return _cache
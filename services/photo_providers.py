@@ -0,0 +1,260 @@
+"""
+Photo provider chain for Karnataka Travel Planner
+Remote providers are tried in order, with a hedged request to the next one
+when the current provider runs past its usual (p90) latency; local curated
+photos and placeholders are the final fallbacks
+"""
+
+import bisect
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence
+
+from services.quota import PRIORITY_VISIBLE
+
+logger = logging.getLogger(__name__)
+
+UNSPLASH_SEARCH_URL = "https://api.unsplash.com/search/photos"
+PEXELS_SEARCH_URL = "https://api.pexels.com/v1/search"
+
+# Latency histogram bucket upper bounds (milliseconds); the last bucket is open
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+# Hedging: the quantile to wait for, the samples needed before trusting it,
+# the delay used until then and the shortest delay ever used (seconds)
+HEDGE_QUANTILE = 0.9
+HEDGE_MIN_SAMPLES = 20
+DEFAULT_HEDGE_AFTER = 1.0
+MIN_HEDGE_AFTER = 0.25
+LATENCY_WINDOW = 200
+
+CHAIN_MAX_WORKERS = 8
+
+class PhotoProvider:
+    """One source of photo URLs
+    
+    ``fetch`` returns a list of URLs (possibly empty when the provider has
+    nothing for the query) or None when the lookup itself failed.
+    """
+    
+    name = "provider"
+    remote = True
+    
+    def fetch(self, query: str, count: int, priority: int = PRIORITY_VISIBLE) -> Optional[List[str]]:
+        raise NotImplementedError
+
+class UnsplashProvider(PhotoProvider):
+    name = "unsplash"
+    
+    def __init__(self, access_key: str, http_client, quota, url: str = UNSPLASH_SEARCH_URL):
+        self.access_key = access_key
+        self.http = http_client
+        self.quota = quota
+        self.url = url
+    
+    def fetch(self, query, count, priority=PRIORITY_VISIBLE):
+        # Out of budget for this hour: let the next provider answer
+        if not self.quota.acquire(self.name, priority):
+            return None
+        
+        headers = {"Authorization": f"Client-ID {self.access_key}"}
+        params = {
+            "query": f"{query} Karnataka India",
+            "per_page": min(count, 10),
+            "orientation": "landscape"
+        }
+        # One token buys one request: no retries, and never re-ask after a 429
+        response = self.http.get(self.url, headers=headers, params=params, timeout=5, retries=0)
+        _sync_quota(self.quota, self.name, response)
+        if response.status_code != 200:
+            return None
+        return [photo["urls"]["regular"] for photo in response.json().get("results", [])]
+
+class PexelsProvider(PhotoProvider):
+    name = "pexels"
+    
+    def __init__(self, api_key: str, http_client, quota, url: str = PEXELS_SEARCH_URL):
+        self.api_key = api_key
+        self.http = http_client
+        self.quota = quota
+        self.url = url
+    
+    def fetch(self, query, count, priority=PRIORITY_VISIBLE):
+        if not self.quota.acquire(self.name, priority):
+            return None
+        
+        headers = {"Authorization": self.api_key}
+        params = {
+            "query": f"{query} Karnataka India",
+            "per_page": min(count, 10),
+            "orientation": "landscape"
+        }
+        response = self.http.get(self.url, headers=headers, params=params, timeout=5, retries=0)
+        _sync_quota(self.quota, self.name, response)
+        if response.status_code != 200:
+            return None
+        return [photo["src"]["large"] for photo in response.json().get("photos", [])]
+
+class CuratedProvider(PhotoProvider):
+    name = "curated"
+    remote = False
+    
+    def __init__(self, find: Callable[[str], Optional[List[str]]]):
+        self.find = find
+    
+    def fetch(self, query, count, priority=PRIORITY_VISIBLE):
+        return list(self.find(query) or [])[:count]
+
+class PlaceholderProvider(PhotoProvider):
+    name = "placeholder"
+    remote = False
+    
+    def __init__(self, render: Callable[[str, int], str]):
+        self.render = render
+    
+    def fetch(self, query, count, priority=PRIORITY_VISIBLE):
+        return [self.render(query, index) for index in range(count)]
+
+def _sync_quota(quota, provider: str, response) -> None:
+    """Keep the shared budget in step with what the provider says is left"""
+    remaining = response.headers.get("X-Ratelimit-Remaining")
+    if response.status_code == 429:
+        quota.observe_remaining(provider, 0)
+    elif remaining is not None and remaining.isdigit():
+        quota.observe_remaining(provider, int(remaining))
+
+class ProviderStats:
+    """Latency histogram, recent-latency window and outcome counts for one provider"""
+    
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=window)
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.outcomes: Dict[str, int] = {}
+        self.hedges = 0
+    
+    def record(self, seconds: float, outcome: str) -> None:
+        millis = seconds * 1000
+        with self._lock:
+            self._recent.append(seconds)
+            self.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, millis)] += 1
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+    
+    def record_hedge(self) -> None:
+        with self._lock:
+            self.hedges += 1
+    
+    def quantile(self, q: float, min_samples: int = 1) -> Optional[float]:
+        """Latency (seconds) at quantile ``q`` of recent calls, or None with too few samples"""
+        with self._lock:
+            samples = sorted(self._recent)
+        if len(samples) < max(1, min_samples):
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+    
+    def snapshot(self) -> Dict:
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        p50, p90 = self.quantile(0.5), self.quantile(0.9)
+        with self._lock:
+            return {
+                "latency_ms": dict(zip(labels, self.latency_buckets)),
+                "p50_ms": None if p50 is None else round(p50 * 1000, 1),
+                "p90_ms": None if p90 is None else round(p90 * 1000, 1),
+                "outcomes": dict(self.outcomes),
+                "hedges": self.hedges,
+            }
+
+class ProviderChain:
+    """First usable answer from an ordered list of providers
+    
+    Remote providers run on a shared pool. When the running provider has
+    not answered by its p90 latency, the next remote provider is started
+    alongside it (a hedged request) and whichever returns a non-empty list
+    first wins; a failed or empty answer moves on at once. Local providers
+    (curated, placeholder) are only consulted once every remote one has
+    come back empty-handed.
+    """
+    
+    def __init__(self, providers: Sequence[PhotoProvider], hedge_quantile: float = HEDGE_QUANTILE,
+                 hedge_min_samples: int = HEDGE_MIN_SAMPLES, default_hedge_after: float = DEFAULT_HEDGE_AFTER,
+                 max_workers: int = CHAIN_MAX_WORKERS):
+        self.providers = list(providers)
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.default_hedge_after = default_hedge_after
+        self.stats = {provider.name: ProviderStats() for provider in self.providers}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="photo-provider")
+    
+    @property
+    def has_remote(self) -> bool:
+        return any(provider.remote for provider in self.providers)
+    
+    def hedge_after(self, provider: PhotoProvider) -> float:
+        """Seconds to wait on ``provider`` before hedging to the next one"""
+        latency = self.stats[provider.name].quantile(self.hedge_quantile, self.hedge_min_samples)
+        # A floor keeps a fast provider's odd slow call from spending a second quota
+        return self.default_hedge_after if latency is None else max(MIN_HEDGE_AFTER, latency)
+    
+    def _call(self, provider: PhotoProvider, query: str, count: int, priority: int) -> Optional[List[str]]:
+        started = time.perf_counter()
+        try:
+            photos = provider.fetch(query, count, priority)
+        except Exception as e:
+            self.stats[provider.name].record(time.perf_counter() - started, f"error:{type(e).__name__}")
+            logger.debug("%s lookup for %s failed: %s", provider.name, query, e)
+            return None
+        outcome = "failed" if photos is None else ("ok" if photos else "empty")
+        self.stats[provider.name].record(time.perf_counter() - started, outcome)
+        return photos
+    
+    def fetch_remote(self, query: str, count: int, priority: int = PRIORITY_VISIBLE) -> Optional[List[str]]:
+        """First non-empty remote answer; [] if every provider answered empty, None if any failed"""
+        queue = [provider for provider in self.providers if provider.remote]
+        running = {}
+        failed = False
+        
+        while queue or running:
+            if not running:
+                provider = queue.pop(0)
+                running[self._executor.submit(self._call, provider, query, count, priority)] = provider
+            
+            # Wait on the newest request up to its usual latency before hedging
+            newest = list(running.values())[-1]
+            timeout = self.hedge_after(newest) if queue else None
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            
+            if not done:
+                self.stats[newest.name].record_hedge()
+                provider = queue.pop(0)
+                running[self._executor.submit(self._call, provider, query, count, priority)] = provider
+                continue
+            
+            for future in done:
+                del running[future]
+                photos = future.result()
+                if photos:
+                    # Slower requests still running finish in the background
+                    return photos
+                failed = failed or photos is None
+        
+        return None if failed else []
+    
+    def fetch_local(self, query: str, count: int, priority: int = PRIORITY_VISIBLE) -> List[str]:
+        """First non-empty answer from the local providers"""
+        for provider in self.providers:
+            if not provider.remote:
+                photos = self._call(provider, query, count, priority)
+                if photos:
+                    return photos
+        return []
+    
+    def fetch(self, query: str, count: int, priority: int = PRIORITY_VISIBLE) -> List[str]:
+        """First usable answer from the whole chain"""
+        return self.fetch_remote(query, count, priority) or self.fetch_local(query, count, priority)
+    
+    def metrics(self) -> Dict[str, Dict]:
+        """Per-provider latency histogram, p50/p90, outcome counts and hedges started"""
+        return {name: stats.snapshot() for name, stats in self.stats.items()}
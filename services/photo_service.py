@@ -3,14 +3,36 @@ Photo Service for Karnataka Travel Planner - Production Optimized
 """
 
 import streamlit as st
-import requests
 import json
-from typing import List, Dict, Optional
+from collections.abc import Sequence
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Iterable, List, Dict, Optional
+
+from services.activity import live_activity
+from services.http_client import HttpClient, get_http_client
+from services.curated_matcher import CuratedMatcher
+from services.photo_cache import PhotoCache, get_photo_cache
+from services.photo_providers import (
+    PEXELS_SEARCH_URL, UNSPLASH_SEARCH_URL, CuratedProvider, PexelsProvider, PhotoProvider,
+    PlaceholderProvider, ProviderChain, UnsplashProvider
+)
+from services.placeholders import placeholder_data_uri
+from services.quota import PRIORITY_VISIBLE, QuotaManager, get_quota_manager
+from services.single_flight import SingleFlight
+from services.thumbnails import thumbnail_service
+
+# Batch lookups: concurrent provider calls and the overall time budget (seconds)
+BATCH_MAX_WORKERS = 8
+BATCH_DEADLINE = 3.0
 
 class PhotoService:
     """Service to fetch and manage destination photos"""
     
-    def __init__(self):
+    def __init__(self, unsplash_access_key: Optional[str] = None, pexels_api_key: Optional[str] = None,
+                 unsplash_url: str = UNSPLASH_SEARCH_URL, cache: Optional[PhotoCache] = None,
+                 http_client: Optional[HttpClient] = None, quota: Optional[QuotaManager] = None,
+                 pexels_url: str = PEXELS_SEARCH_URL, providers: Optional[Iterable[PhotoProvider]] = None):
         # Handle secrets gracefully for production
         try:
             self.unsplash_access_key = st.secrets.get("UNSPLASH_ACCESS_KEY", "")
@@ -21,72 +43,191 @@ class PhotoService:
             self.unsplash_access_key = os.getenv("UNSPLASH_ACCESS_KEY", "")
             self.pexels_api_key = os.getenv("PEXELS_API_KEY", "")
         
-        self.cache = {}
+        # Explicit keys and endpoint (e.g. a local stub server in tests) win
+        if unsplash_access_key is not None:
+            self.unsplash_access_key = unsplash_access_key
+        if pexels_api_key is not None:
+            self.pexels_api_key = pexels_api_key
+        self.unsplash_url = unsplash_url
+        self.pexels_url = pexels_url
+        
+        # Provider lookups are shared with other workers through the on-disk cache
+        self.cache = cache if cache is not None else get_photo_cache()
+        self.http = http_client or get_http_client()
+        self.flights = SingleFlight()
+        self.quota = quota if quota is not None else get_quota_manager()
+        
+        # Explicit providers (e.g. stubs in offline tests) replace the default chain
+        self.chain = ProviderChain(providers if providers is not None else self._default_providers())
     
-    def get_destination_photos(self, destination_name: str, count: int = 3) -> List[str]:
+    def _default_providers(self) -> List[PhotoProvider]:
+        """Unsplash and Pexels when keys are configured, then curated photos and placeholders"""
+        providers = []
+        if self.unsplash_access_key:
+            providers.append(UnsplashProvider(self.unsplash_access_key, self.http, self.quota, self.unsplash_url))
+        if self.pexels_api_key:
+            providers.append(PexelsProvider(self.pexels_api_key, self.http, self.quota, self.pexels_url))
+        providers.append(CuratedProvider(find_curated_photos))
+        providers.append(PlaceholderProvider(self._generate_placeholder_image))
+        return providers
+    
+    def get_destination_photos(self, destination_name: str, count: int = 3,
+                               priority: int = PRIORITY_VISIBLE) -> List[str]:
         """Get photos for destination with production fallbacks"""
         
-        # Check cache first
-        cache_key = f"{destination_name}_{count}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        photos = self.find_photos(destination_name, count, priority)
+        if photos is None:
+            # Fallback to curated photos or placeholders
+            photos = self.local_photos(destination_name, count, priority)
+        return photos
+    
+    def find_photos(self, destination_name: str, count: int = 3, priority: int = PRIORITY_VISIBLE,
+                    wait: bool = True) -> Optional[List[str]]:
+        """Photos from the cache or a provider's answer, or None when the lookup is unsettled
+        
+        A lookup is unsettled when it failed, the quota refused it, or (with
+        ``wait=False``) another caller's fetch for it is still running. Only
+        settled lists are safe to keep; see LazyMedia.
+        """
         
         photos = []
         
-        # Try to get real photos if API keys available
-        if self.unsplash_access_key:
-            try:
-                unsplash_photos = self._fetch_unsplash_photos(destination_name, count)
-                photos.extend(unsplash_photos)
-            except:
-                pass  # Fail silently in production
+        # Background warm-up waits while lookups for a user's page are running
+        with live_activity.track() if priority == PRIORITY_VISIBLE else nullcontext():
+            # Try the remote providers if any are configured
+            if self.chain.has_remote:
+                photos = self._lookup_remote_photos(destination_name, count, priority, wait)
+                if photos is None:
+                    return None
+            
+            return self._with_local_fallback(destination_name, photos, count, priority)
+    
+    def local_photos(self, destination_name: str, count: int = 3, priority: int = PRIORITY_VISIBLE) -> List[str]:
+        """Curated photos or placeholders, without any remote lookup"""
+        return self._with_local_fallback(destination_name, [], count, priority)
+    
+    def get_destination_photos_many(self, destination_names: Iterable[str], count: int = 3,
+                                    max_workers: int = BATCH_MAX_WORKERS,
+                                    deadline: float = BATCH_DEADLINE,
+                                    priority: int = PRIORITY_VISIBLE) -> Dict[str, List[str]]:
+        """Get photos for several destinations concurrently within an overall deadline
         
-        # Fallback to curated photos or placeholders
-        while len(photos) < count:
-            placeholder_url = self._generate_placeholder_image(destination_name, len(photos))
-            photos.append(placeholder_url)
+        Names not settled within ``deadline`` seconds get curated photos or
+        placeholders for this call (see find_photos_many).
+        """
         
-        # Cache the results
-        self.cache[cache_key] = photos[:count]
-        return photos[:count]
+        names = list(dict.fromkeys(destination_names))
+        found = self.find_photos_many(names, count, max_workers, deadline, priority)
+        return {
+            name: found[name] if name in found else self.local_photos(name, count, priority)
+            for name in names
+        }
     
-    def _fetch_unsplash_photos(self, query: str, count: int) -> List[str]:
-        """Fetch photos from Unsplash API with error handling"""
+    def find_photos_many(self, destination_names: Iterable[str], count: int = 3,
+                         max_workers: int = BATCH_MAX_WORKERS, deadline: float = BATCH_DEADLINE,
+                         priority: int = PRIORITY_VISIBLE) -> Dict[str, List[str]]:
+        """Settled photo lists for several destinations, looked up concurrently
         
+        Lookups run on at most ``max_workers`` threads, in the order given.
+        Names that failed, were refused by the quota, or are still pending
+        when ``deadline`` seconds have passed are left out; pending and
+        queued lookups keep running in the background and fill the cache
+        for later. ``priority`` decides how much of the provider quota the
+        batch may spend.
+        """
+        
+        names = list(dict.fromkeys(destination_names))
+        results = {}
+        pending = []
+        for name in names:
+            cached = self.cache.get(self._cache_key(name, count)) if self.chain.has_remote else []
+            if cached is not None:
+                results[name] = self._with_local_fallback(name, cached, count, priority)
+            else:
+                pending.append(name)
+        
+        if not pending:
+            return results
+        
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(pending)), thread_name_prefix="photo-batch")
         try:
-            url = "https://api.unsplash.com/search/photos"
-            headers = {"Authorization": f"Client-ID {self.unsplash_access_key}"}
-            params = {
-                "query": f"{query} Karnataka India",
-                "per_page": min(count, 10),
-                "orientation": "landscape"
-            }
-            
-            response = requests.get(url, headers=headers, params=params, timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                photos = []
-                
-                for photo in data.get("results", []):
-                    photo_url = photo["urls"]["regular"]
-                    photos.append(photo_url)
-                
-                return photos
-            
-        except Exception:
-            pass  # Fail silently in production
+            futures = {executor.submit(self.find_photos, name, count, priority): name for name in pending}
+            done, _ = wait(futures, timeout=deadline)
+            for future in done:
+                try:
+                    photos = future.result()
+                except Exception:
+                    continue  # Fail silently in production
+                if photos is not None:
+                    results[futures[future]] = photos
+        finally:
+            # Queued lookups still run; only this call stops waiting for them
+            executor.shutdown(wait=False)
         
-        return []
+        return {name: results[name] for name in names if name in results}
+    
+    def _cache_key(self, destination_name: str, count: int) -> str:
+        return f"photos:{count}:{destination_name}"
+    
+    def _with_local_fallback(self, destination_name: str, photos: List[str], count: int,
+                             priority: int = PRIORITY_VISIBLE) -> List[str]:
+        if not photos:
+            photos = self.chain.fetch_local(destination_name, count, priority)
+        return self._pad_with_placeholders(destination_name, photos, count)
+    
+    def _lookup_remote_photos(self, destination_name: str, count: int, priority: int = PRIORITY_VISIBLE,
+                              wait: bool = True) -> Optional[List[str]]:
+        """Remote provider photos through the shared cache; None if the lookup failed
+        
+        Concurrent misses for the same key (e.g. many sessions opening one
+        page) share a single provider call. With ``wait=False`` a call
+        already in flight is not waited for and None is returned.
+        """
+        
+        cache_key = self._cache_key(destination_name, count)
+        photos = self.cache.get(cache_key)
+        if photos is None:
+            if not wait and self.flights.running(cache_key):
+                return None
+            photos = self.flights.do(cache_key, self._fetch_and_cache, cache_key, destination_name, count, priority)
+        return photos
+    
+    def _fetch_and_cache(self, cache_key: str, destination_name: str, count: int,
+                         priority: int = PRIORITY_VISIBLE) -> Optional[List[str]]:
+        # Another caller may have filled the cache while this one queued up
+        photos = self.cache.get(cache_key)
+        if photos is None:
+            photos = self.chain.fetch_remote(destination_name, count, priority)
+            if photos is not None:
+                self.cache.set(cache_key, photos)
+        return photos
+    
+    def lookup_metrics(self) -> Dict[str, Dict[str, int]]:
+        """Per-key provider calls made and concurrent callers collapsed onto them"""
+        return self.flights.metrics()
+    
+    def provider_metrics(self) -> Dict[str, Dict]:
+        """Per-provider latency and outcome histograms, and hedged requests started"""
+        return self.chain.metrics()
+    
+    def quota_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Remaining provider budget shared by all workers"""
+        return self.quota.metrics()
+    
+    def _pad_with_placeholders(self, destination_name: str, photos: List[str], count: int) -> List[str]:
+        """Fill a photo list up to ``count`` with placeholder images"""
+        photos = list(photos[:count])
+        while len(photos) < count:
+            photos.append(self._generate_placeholder_image(destination_name, len(photos)))
+        return photos
     
     def _generate_placeholder_image(self, destination_name: str, index: int) -> str:
-        """Generate placeholder image URL"""
+        """Generate a local placeholder image (data URI, no network access)"""
         
         colors = ["4CAF50", "2196F3", "FF9800", "9C27B0", "F44336"]
         color = colors[index % len(colors)]
-        encoded_name = destination_name.replace(" ", "+")
         
-        return f"https://via.placeholder.com/800x600/{color}/FFFFFF?text={encoded_name}"
+        return placeholder_data_uri(destination_name, "photo", color)
 
 # Curated photo collections for major destinations
 CURATED_PHOTOS = {
@@ -108,21 +249,130 @@ CURATED_PHOTOS = {
     ]
 }
 
+# Compiled once; rebuild with CuratedMatcher(CURATED_PHOTOS) if the collection changes
+_curated_matcher = CuratedMatcher(CURATED_PHOTOS)
+
+def find_curated_photos(destination_name: str) -> Optional[List[str]]:
+    """Curated photos whose key appears in the destination name, if any"""
+    return _curated_matcher.match(destination_name)
+
 def get_curated_photos(destination_name: str) -> List[str]:
     """Get curated photos for popular destinations"""
     
     # Check if we have curated photos
-    for key, photos in CURATED_PHOTOS.items():
-        if key.lower() in destination_name.lower():
-            return photos
+    photos = find_curated_photos(destination_name)
+    if photos is not None:
+        return photos
     
-    # Fallback to photo service
-    photo_service = PhotoService()
+    # Fallback to the shared photo service
     return photo_service.get_destination_photos(destination_name, 3)
 
 def get_destination_video(destination_name: str) -> Optional[str]:
     """Get video content for destination - placeholder for now"""
     return None
 
+class LazyMedia(Sequence):
+    """Media list for a catalog entry, resolved on first access and memoized
+    
+    Catalog modules create these at import instead of calling the photo
+    service, so import cost does not grow with the number of destinations.
+    Concurrent first accesses may both resolve; the results are identical.
+    """
+    
+    __slots__ = ("query", "media_type", "_items")
+    
+    def __init__(self, query: str, media_type: str = "photo"):
+        self.query = query
+        self.media_type = media_type
+        self._items = None
+    
+    @property
+    def resolved(self) -> bool:
+        return self._items is not None
+    
+    def resolve(self) -> List[str]:
+        """Resolve the media URLs and return them; only settled lookups are kept"""
+        items = self._items
+        if items is None:
+            if self.media_type == "photo":
+                items = find_curated_photos(self.query)
+                if items is None:
+                    items = photo_service.find_photos(self.query, 3, wait=False)
+                if items is None:
+                    # Failed, refused or still being fetched: show fallbacks
+                    # for now and look again on the next access
+                    return photo_service.local_photos(self.query, 3)
+                items = list(items)
+            else:
+                video = get_destination_video(self.query)
+                items = [video] if video else []
+            self._items = items
+        return items
+    
+    def preload(self, items: List[str]) -> None:
+        """Store items resolved elsewhere (e.g. by a batch lookup)"""
+        self._items = list(items)
+    
+    def __getitem__(self, index):
+        return self.resolve()[index]
+    
+    def __len__(self) -> int:
+        return len(self.resolve())
+    
+    def __iter__(self):
+        return iter(self.resolve())
+    
+    def __bool__(self) -> bool:
+        # Photo lookups always fall back to placeholders, so they are never
+        # empty and a truthiness check does not need to hit the service
+        if self._items is None and self.media_type == "photo":
+            return True
+        return len(self) > 0
+    
+    def __repr__(self) -> str:
+        state = self._items if self._items is not None else "unresolved"
+        return f"LazyMedia({self.query!r}, {self.media_type!r}, {state})"
+
+def defer_media(destination_name: str, media_type: str = "photo") -> LazyMedia:
+    """Deferred photo/video lookup for catalog entries"""
+    return LazyMedia(destination_name, media_type)
+
+def prefetch_photos(media_lists: Iterable, deadline: float = BATCH_DEADLINE,
+                    priority: int = PRIORITY_VISIBLE, max_workers: int = BATCH_MAX_WORKERS) -> None:
+    """Resolve many deferred photo lists with one concurrent batch lookup
+    
+    Call before rendering a page of cards so their photos are fetched in
+    parallel rather than one card at a time.
+    """
+    media_lists = list(media_lists)
+    unresolved = [
+        media for media in media_lists
+        if isinstance(media, LazyMedia) and media.media_type == "photo" and not media.resolved
+    ]
+    
+    pending = []
+    for media in unresolved:
+        curated = find_curated_photos(media.query)
+        if curated is not None:
+            media.preload(curated)
+        else:
+            pending.append(media)
+    
+    if pending:
+        photos = photo_service.find_photos_many(
+            [media.query for media in pending], 3, max_workers=max_workers, deadline=deadline, priority=priority
+        )
+        # Names not settled in time stay unresolved and read the cache later
+        for media in pending:
+            if media.query in photos:
+                media.preload(photos[media.query])
+    
+    # Cards show the first photo; their thumbnails build in the background
+    # and the page shows the remote photo until they are ready
+    thumbnail_service.schedule(
+        media[0] for media in media_lists
+        if isinstance(media, LazyMedia) and media.media_type == "photo" and media.resolved and len(media)
+    )
+
 # Initialize photo service
 photo_service = PhotoService()
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Placeholder images for Karnataka Travel Planner
+Colour blocks with a caption drawn in-process with Pillow, so missing photos
+cost no request to an external placeholder host
+"""
+
+import base64
+import io
+from functools import lru_cache
+from typing import Tuple, Union
+
+from PIL import Image, ImageDraw, ImageFont
+
+# Standard sizes (width, height) used across the app
+PLACEHOLDER_SIZES = {
+    "photo": (800, 600),
+    "card": (300, 200),
+    "logo": (300, 150),
+}
+DEFAULT_COLOR = "FF6B35"
+TEXT_COLOR = (255, 255, 255)
+
+FONT_FILE = "DejaVuSans-Bold.ttf"
+MARGIN = 0.08  # of the width, on each side
+
+JPEG_QUALITY = 90
+
+@lru_cache(maxsize=16)
+def _font(size: int) -> ImageFont.ImageFont:
+    try:
+        return ImageFont.truetype(FONT_FILE, size)
+    except OSError:
+        return ImageFont.load_default(size=size)
+
+def _parse_color(color: str) -> Tuple[int, int, int]:
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+def _resolve_size(size: Union[str, Tuple[int, int]]) -> Tuple[int, int]:
+    return PLACEHOLDER_SIZES[size] if isinstance(size, str) else tuple(size)
+
+def _wrap(draw: ImageDraw.ImageDraw, text: str, font, max_width: int):
+    lines, line = [], ""
+    for word in text.split():
+        candidate = f"{line} {word}".strip()
+        if line and draw.textlength(candidate, font=font) > max_width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    if line:
+        lines.append(line)
+    return lines
+
+@lru_cache(maxsize=256)
+def _render(text: str, size: Tuple[int, int], color: str, image_format: str) -> bytes:
+    width, height = size
+    image = Image.new("RGB", size, _parse_color(color))
+    draw = ImageDraw.Draw(image)
+    max_width = int(width * (1 - 2 * MARGIN))
+    
+    # Largest font (up to a tenth of the height) at which the caption fits in three lines
+    font_size = max(10, height // 10)
+    while True:
+        font = _font(font_size)
+        lines = _wrap(draw, text, font, max_width)
+        fits = len(lines) <= 3 and all(draw.textlength(line, font=font) <= max_width for line in lines)
+        if fits or font_size <= 10:
+            break
+        font_size -= 2
+    
+    line_height = int(font_size * 1.25)
+    y = (height - line_height * len(lines)) // 2
+    for line in lines:
+        x = (width - draw.textlength(line, font=font)) // 2
+        draw.text((x, y), line, font=font, fill=TEXT_COLOR)
+        y += line_height
+    
+    buffer = io.BytesIO()
+    image.save(buffer, format=image_format, quality=JPEG_QUALITY)
+    return buffer.getvalue()
+
+def placeholder_image(text: str, size: Union[str, Tuple[int, int]] = "card",
+                      color: str = DEFAULT_COLOR) -> bytes:
+    """JPEG bytes of a colour block captioned with ``text``, cached by (text, size, colour)
+    
+    st.image re-encodes any other format to JPEG on every render, so the
+    bytes are JPEG already and pass through untouched.
+    """
+    return _render(text, _resolve_size(size), color.lstrip("#").upper(), "JPEG")
+
+@lru_cache(maxsize=256)
+def placeholder_data_uri(text: str, size: Union[str, Tuple[int, int]] = "photo",
+                         color: str = DEFAULT_COLOR) -> str:
+    """Placeholder as a data: URI, for places that keep image references as strings"""
+    # Data URIs reach the browser as they are, so they keep lossless PNG
+    data = base64.b64encode(_render(text, _resolve_size(size), color.lstrip("#").upper(), "PNG")).decode("ascii")
+    return f"data:image/png;base64,{data}"
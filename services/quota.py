@@ -0,0 +1,182 @@
+"""
+Provider request quotas for Karnataka Travel Planner
+Token buckets kept in SQLite so every worker process on the host draws on
+the same hourly budget, with a reserve that only visible cards may spend
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUOTA_PATH = os.getenv(
+    "KTP_QUOTA_DB",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "quota.sqlite3")
+)
+
+# Requests per hour; Unsplash demo apps get 50, Pexels 200
+PROVIDER_QUOTAS = {
+    "unsplash": int(os.getenv("KTP_UNSPLASH_QUOTA_PER_HOUR", "50")),
+    "pexels": int(os.getenv("KTP_PEXELS_QUOTA_PER_HOUR", "200")),
+}
+
+# Lower numbers go first
+PRIORITY_VISIBLE = 0      # cards on the page being rendered
+PRIORITY_PREFETCH = 1     # warming the cache ahead of a visit
+
+# Share of each bucket held back for visible cards
+PREFETCH_RESERVE = 0.3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quota_buckets (
+    provider TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+class QuotaManager:
+    """Hourly token buckets per provider, shared through a SQLite file
+    
+    A bucket refills continuously at capacity/hour. Visible requests may
+    take the last token; prefetches stop once the bucket falls to the
+    reserve, so background work never starves the page a user is looking
+    at. If the database cannot be opened, requests are allowed.
+    """
+    
+    def __init__(self, path: str = DEFAULT_QUOTA_PATH, quotas: Optional[Dict[str, int]] = None,
+                 prefetch_reserve: float = PREFETCH_RESERVE):
+        self.path = path
+        self.quotas = dict(PROVIDER_QUOTAS if quotas is None else quotas)
+        self.prefetch_reserve = prefetch_reserve
+        self._local = threading.local()
+        self._disabled = False
+        self._lock = threading.Lock()
+        self._granted: Dict[str, int] = {}
+        self._denied: Dict[str, int] = {}
+    
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._disabled:
+            return None
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Quota store %s unavailable, requests will not be limited: %s", self.path, e)
+                self._disabled = True
+                return None
+            self._local.conn = conn
+        return conn
+    
+    def _floor(self, provider: str, priority: int) -> float:
+        if priority <= PRIORITY_VISIBLE:
+            return 0.0
+        return self.quotas[provider] * self.prefetch_reserve
+    
+    def _refilled(self, conn: sqlite3.Connection, provider: str, now: float) -> float:
+        capacity = self.quotas[provider]
+        row = conn.execute("SELECT tokens, updated FROM quota_buckets WHERE provider = ?", (provider,)).fetchone()
+        if row is None:
+            return float(capacity)
+        tokens, updated = row
+        return min(float(capacity), tokens + max(0.0, now - updated) * capacity / 3600.0)
+    
+    def _count(self, counters: Dict[str, int], provider: str) -> None:
+        with self._lock:
+            counters[provider] = counters.get(provider, 0) + 1
+    
+    def acquire(self, provider: str, priority: int = PRIORITY_VISIBLE) -> bool:
+        """Take one request from the provider's budget; False when it is spent"""
+        if provider not in self.quotas:
+            return True
+        conn = self._connection()
+        if conn is None:
+            return True
+        
+        now = time.time()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                tokens = self._refilled(conn, provider, now)
+                granted = tokens - 1 >= self._floor(provider, priority)
+                if granted:
+                    tokens -= 1
+                conn.execute(
+                    "INSERT OR REPLACE INTO quota_buckets (provider, tokens, updated) VALUES (?, ?, ?)",
+                    (provider, tokens, now)
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            logger.debug("Quota check for %s failed, allowing request: %s", provider, e)
+            return True
+        
+        self._count(self._granted if granted else self._denied, provider)
+        return granted
+    
+    def observe_remaining(self, provider: str, remaining: int) -> None:
+        """Lower the bucket to what the provider reports is left (e.g. a rate-limit header)"""
+        conn = self._connection()
+        if conn is None or provider not in self.quotas:
+            return
+        
+        now = time.time()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                tokens = min(self._refilled(conn, provider, now), float(max(0, remaining)))
+                conn.execute(
+                    "INSERT OR REPLACE INTO quota_buckets (provider, tokens, updated) VALUES (?, ?, ?)",
+                    (provider, tokens, now)
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as e:
+            logger.debug("Quota update for %s failed: %s", provider, e)
+    
+    def remaining(self, provider: str) -> float:
+        """Requests left in the provider's budget right now"""
+        conn = self._connection()
+        if conn is None:
+            return float(self.quotas.get(provider, 0))
+        try:
+            return self._refilled(conn, provider, time.time())
+        except sqlite3.Error:
+            return float(self.quotas.get(provider, 0))
+    
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """Remaining budget per provider, plus this process's granted/denied counts"""
+        with self._lock:
+            granted, denied = dict(self._granted), dict(self._denied)
+        return {
+            provider: {
+                "capacity": capacity,
+                "remaining": round(self.remaining(provider), 2),
+                "granted": granted.get(provider, 0),
+                "denied": denied.get(provider, 0),
+            }
+            for provider, capacity in self.quotas.items()
+        }
+
+_manager = None
+_manager_lock = threading.Lock()
+
+def get_quota_manager() -> QuotaManager:
+    """Process-wide handle on the shared provider quotas"""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = QuotaManager()
+        return _manager
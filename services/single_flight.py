@@ -0,0 +1,76 @@
+"""
+Single-flight call coalescing for Karnataka Travel Planner
+Concurrent calls for the same key share one execution and its result
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+class SingleFlight:
+    """Run at most one call per key at a time; later callers wait for it
+    
+    Per-key metrics count the calls that actually ran and the callers that
+    were collapsed onto a call already in flight.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._metrics: Dict[Hashable, Dict[str, int]] = {}
+    
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs):
+        """Return fn(*args, **kwargs), sharing the run with concurrent callers of ``key``"""
+        with self._lock:
+            metrics = self._metrics.setdefault(key, {"executions": 0, "collapsed": 0, "max_waiters": 0})
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                metrics["collapsed"] += 1
+                metrics["max_waiters"] = max(metrics["max_waiters"], call.waiters)
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                metrics["executions"] += 1
+                leader = True
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+    
+    def running(self, key: Hashable) -> bool:
+        """Whether a call for ``key`` is in flight right now"""
+        with self._lock:
+            return key in self._calls
+    
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+    
+    def metrics(self, key: Hashable = None):
+        """Counters for one key, or a copy of every key's counters"""
+        with self._lock:
+            if key is not None:
+                return dict(self._metrics.get(key, {"executions": 0, "collapsed": 0, "max_waiters": 0}))
+            return {k: dict(v) for k, v in self._metrics.items()}
@@ -0,0 +1,226 @@
+"""
+Thumbnail pipeline for Karnataka Travel Planner
+Fetches each source image once, renders card/gallery/popup JPEG variants
+with Pillow and keeps them in a content-addressed disk cache, so pages
+send small local images instead of full-size remote photos
+"""
+
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Iterable, Optional, Union
+
+from PIL import Image, ImageOps
+
+from services.http_client import get_http_client
+from services.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# name -> (width, height, crop); cropped variants are filled to the exact box
+THUMBNAIL_SIZES = {
+    "card": (400, 300, True),
+    "gallery": (800, 600, False),
+    "popup": (200, 150, True),
+}
+# st.image passes JPEG bytes through untouched when no resize is needed;
+# any other format is re-encoded to JPEG on every render, so the variants
+# are stored as JPEG and kept below Streamlit's maximum content width
+JPEG_QUALITY = 80
+
+# Bumped when the variant format changes, so old sources never point at missing files
+CACHE_LAYOUT = "v2"
+
+DEFAULT_THUMBNAIL_DIR = os.getenv(
+    "KTP_THUMBNAIL_CACHE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "thumbnails")
+)
+
+# Recently served variants kept in memory (bytes)
+MEMORY_CACHE_BYTES = 16 * 1024 * 1024
+
+MAX_SOURCE_BYTES = 10 * 1024 * 1024
+
+WARM_MAX_WORKERS = 4
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def _write_atomic(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp creates 0600; other workers may run as a different user
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def render_variant(image: Image.Image, size: str) -> bytes:
+    """Encode one named size of an image as progressive JPEG"""
+    width, height, crop = THUMBNAIL_SIZES[size]
+    if crop:
+        variant = ImageOps.fit(image, (width, height), Image.LANCZOS)
+    else:
+        variant = image.copy()
+        variant.thumbnail((width, height), Image.LANCZOS)
+    buffer = io.BytesIO()
+    variant.save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+class ThumbnailService:
+    """Content-addressed JPEG thumbnails on disk
+    
+    Layout under <cache directory>/<CACHE_LAYOUT>:
+        sources/<sha256(url)>         digest of the image content at that URL
+        variants/<digest>/<size>.jpg  rendered sizes, shared by identical images
+    """
+    
+    def __init__(self, cache_dir: str = DEFAULT_THUMBNAIL_DIR, http_client=None):
+        self.cache_dir = cache_dir
+        self.http = http_client or get_http_client()
+        self.flights = SingleFlight()
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        # Builds requested by a render run here, never on the render path
+        self._background = ThreadPoolExecutor(max_workers=WARM_MAX_WORKERS, thread_name_prefix="thumbnail")
+        self._scheduled = set()
+    
+    def _source_path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, CACHE_LAYOUT, "sources", _sha256(url.encode("utf-8")))
+    
+    def _variant_path(self, digest: str, size: str) -> str:
+        return os.path.join(self.cache_dir, CACHE_LAYOUT, "variants", digest[:2], digest, f"{size}.jpg")
+    
+    def _remember(self, key, data: bytes) -> None:
+        with self._lock:
+            if key in self._memory:
+                return
+            self._memory[key] = data
+            self._memory_bytes += len(data)
+            while self._memory_bytes > MEMORY_CACHE_BYTES and self._memory:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+    
+    def _recall(self, key) -> Optional[bytes]:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+            return data
+    
+    def _cached_digest(self, url: str) -> Optional[str]:
+        try:
+            with open(self._source_path(url), "r", encoding="ascii") as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+    
+    def _build(self, url: str) -> Optional[str]:
+        """Fetch the source once and render every size; returns the content digest"""
+        digest = self._cached_digest(url)
+        if digest is not None:
+            return digest
+        
+        response = self.http.get(url, timeout=10)
+        if response.status_code != 200 or len(response.content) > MAX_SOURCE_BYTES:
+            return None
+        
+        content = response.content
+        digest = _sha256(content)
+        image = Image.open(io.BytesIO(content))
+        image = ImageOps.exif_transpose(image).convert("RGB")
+        for size in THUMBNAIL_SIZES:
+            path = self._variant_path(digest, size)
+            if not os.path.exists(path):
+                _write_atomic(path, render_variant(image, size))
+        _write_atomic(self._source_path(url), digest.encode("ascii"))
+        return digest
+    
+    def ensure(self, url: str) -> Optional[str]:
+        """Make sure every size of ``url`` is on disk; None if it cannot be fetched"""
+        try:
+            return self._cached_digest(url) or self.flights.do(url, self._build, url)
+        except Exception as e:
+            logger.debug("Thumbnail for %s unavailable: %s", url, e)
+            return None
+    
+    def ensure_many(self, urls: Iterable[str], deadline: float, max_workers: int = WARM_MAX_WORKERS) -> None:
+        """Render thumbnails for many URLs in parallel, waiting at most ``deadline`` seconds"""
+        pending = [
+            url for url in dict.fromkeys(urls)
+            if isinstance(url, str) and url.startswith(("http://", "https://")) and self._cached_digest(url) is None
+        ]
+        if not pending:
+            return
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(pending)))
+        futures = [executor.submit(self.ensure, url) for url in pending]
+        wait(futures, timeout=deadline)
+        # Stragglers finish in the background and land in the disk cache
+        executor.shutdown(wait=False)
+    
+    def _ensure_scheduled(self, url: str) -> None:
+        try:
+            self.ensure(url)
+        finally:
+            with self._lock:
+                self._scheduled.discard(url)
+    
+    def schedule(self, urls: Iterable[str]) -> None:
+        """Queue background builds for URLs not yet rendered or queued; never waits"""
+        for url in dict.fromkeys(urls):
+            if not isinstance(url, str) or not url.startswith(("http://", "https://")):
+                continue
+            if self._cached_digest(url) is not None:
+                continue
+            with self._lock:
+                if url in self._scheduled:
+                    continue
+                self._scheduled.add(url)
+            self._background.submit(self._ensure_scheduled, url)
+    
+    def get(self, url: str, size: str = "card") -> Optional[bytes]:
+        """JPEG bytes of one size of the image at ``url``, if already rendered
+        
+        A miss never fetches here: the build is queued in the background
+        and None is returned, so the caller shows the original URL.
+        """
+        key = (url, size)
+        data = self._recall(key)
+        if data is not None:
+            return data
+        
+        digest = self._cached_digest(url)
+        if digest is None:
+            self.schedule([url])
+            return None
+        try:
+            with open(self._variant_path(digest, size), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        self._remember(key, data)
+        return data
+    
+    def image_source(self, url, size: str = "card") -> Union[bytes, str]:
+        """What to hand st.image: local JPEG bytes, or the original value as a fallback"""
+        if not isinstance(url, str) or not url.startswith(("http://", "https://")):
+            return url
+        return self.get(url, size) or url
+
+thumbnail_service = ThumbnailService()
+
+def thumbnail(url, size: str = "card") -> Union[bytes, str]:
+    """Local thumbnail for st.image (falls back to the remote URL)"""
+    return thumbnail_service.image_source(url, size)
@@ -0,0 +1,223 @@
+"""
+Background photo warm-up for Karnataka Travel Planner
+Walks every catalog once per server process, filling the photo and thumbnail
+caches between live requests, and records its progress in a status file per
+process that deployment checks combine. Catalog records themselves are
+never touched; pages pick the warm cache up on their next lookup
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+import streamlit as st
+
+from services.activity import live_activity
+from services.photo_service import LazyMedia, find_curated_photos, photo_service
+from services.quota import PRIORITY_PREFETCH
+from services.thumbnails import thumbnail_service
+
+logger = logging.getLogger(__name__)
+
+# One warmup-<pid>.json per server process, so workers never overwrite each other
+DEFAULT_STATUS_DIR = os.getenv(
+    "KTP_WARMUP_STATUS_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "warmup")
+)
+
+# How combined statuses are ranked: the caches are shared on disk, so one
+# process that finished warm makes the host ready
+STATE_RANK = {"ready": 0, "running": 1, "pending": 2, "incomplete": 3}
+
+# Destinations per step, threads per step, and the time allowed for one step (seconds)
+WARMUP_BATCH = 4
+WARMUP_MAX_WORKERS = 2
+WARMUP_STEP_DEADLINE = 30.0
+
+class WarmupWorker:
+    """Resolves every catalog photo list on a daemon thread
+    
+    Each step waits until no live lookup has run for a moment, then
+    fetches a few destinations at prefetch priority, so users' pages and
+    their share of the provider quota always come first. ``records`` is
+    called on the worker thread, so loading the catalog stays off the
+    request path.
+    
+    Lookups that fail, are refused by the quota or miss the step deadline
+    are counted in ``missed``; the run then ends "incomplete", not "ready".
+    """
+    
+    def __init__(self, records: Callable[[], Iterable], status_dir: str = DEFAULT_STATUS_DIR,
+                 batch: int = WARMUP_BATCH, max_workers: int = WARMUP_MAX_WORKERS,
+                 deadline: float = WARMUP_STEP_DEADLINE):
+        self.records = records
+        self.status_dir = status_dir
+        self.status_path = status_path(status_dir, os.getpid())
+        self.batch = batch
+        self.max_workers = max_workers
+        self.deadline = deadline
+        self.stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._status = {
+            "state": "pending", "done": 0, "total": None, "missed": 0, "started": None, "finished": None
+        }
+    
+    def start(self) -> "WarmupWorker":
+        if self._thread is None:
+            prune_status(self.status_dir)
+            self._thread = threading.Thread(target=self._run, name="photo-warmup", daemon=True)
+            self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self.stop_event.set()
+    
+    @property
+    def ready(self) -> bool:
+        return self._status["state"] == "ready"
+    
+    def status(self) -> Dict:
+        return dict(self._status)
+    
+    def _update(self, **changes) -> None:
+        self._status = {**self._status, **changes, "pid": os.getpid()}
+        write_status(self.status_path, self._status)
+    
+    def _warm(self, queries) -> int:
+        """Fill the photo and thumbnail caches for ``queries``; returns how many were missed"""
+        photos = {}
+        pending = []
+        for query in queries:
+            curated = find_curated_photos(query)
+            if curated is not None:
+                photos[query] = curated
+            else:
+                pending.append(query)
+        
+        if pending:
+            photos.update(photo_service.find_photos_many(
+                pending, 3, max_workers=self.max_workers, deadline=self.deadline, priority=PRIORITY_PREFETCH
+            ))
+        thumbnail_service.ensure_many(
+            [url for urls in photos.values() for url in urls], deadline=self.deadline, max_workers=self.max_workers
+        )
+        return len(queries) - len(photos)
+    
+    def _run(self) -> None:
+        self._update(state="running", started=time.time())
+        try:
+            queries = list(dict.fromkeys(
+                dest.photos.query for dest in self.records()
+                if isinstance(dest.photos, LazyMedia) and dest.photos.media_type == "photo"
+            ))
+            self._update(total=len(queries))
+            
+            missed = 0
+            for start in range(0, len(queries), self.batch):
+                live_activity.wait_idle(stop=self.stop_event)
+                if self.stop_event.is_set():
+                    self._update(state="stopped")
+                    return
+                
+                chunk = queries[start:start + self.batch]
+                missed += self._warm(chunk)
+                self._update(done=start + len(chunk), missed=missed)
+        except Exception as e:
+            logger.warning("Photo warm-up stopped early: %s", e)
+            self._update(state="failed", finished=time.time(), error=str(e))
+            return
+        
+        # Refused or failed lookups leave part of the cache cold
+        self._update(state="incomplete" if missed else "ready", finished=time.time())
+        logger.info("Photo warm-up finished: %d destinations, %d missed", len(queries), missed)
+
+def status_path(status_dir: str, pid: int) -> str:
+    return os.path.join(status_dir, f"warmup-{pid}.json")
+
+def write_status(path: str, status: Dict) -> None:
+    try:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(status, f)
+        # mkstemp creates 0600; the deployment check may run as another user
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("Could not write warm-up status %s: %s", path, e)
+
+def _pid_alive(pid) -> bool:
+    try:
+        os.kill(int(pid), 0)
+    except (OSError, TypeError, ValueError):
+        return False
+    return True
+
+def _read_one(path: str) -> Optional[Dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            status = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if status.get("state") == "running" and not _pid_alive(status.get("pid")):
+        status["state"] = "interrupted"
+    return status
+
+def prune_status(status_dir: str = DEFAULT_STATUS_DIR) -> None:
+    """Remove the status files of processes that have exited (e.g. before a restart)"""
+    for path in glob.glob(status_path(status_dir, "*")):
+        status = _read_one(path)
+        if status is None or not _pid_alive(status.get("pid")):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def read_status(status_dir: str = DEFAULT_STATUS_DIR) -> Optional[Dict]:
+    """Combined progress of every process's warm-up, or None if none has run
+    
+    The best state wins (see STATE_RANK), the most recent on a tie; a run
+    whose process exited before finishing reads as "interrupted".
+    ``processes`` maps each pid to its own state.
+    """
+    statuses = [status for status in map(_read_one, glob.glob(status_path(status_dir, "*"))) if status]
+    if not statuses:
+        return None
+    best = min(statuses, key=lambda status: (
+        STATE_RANK.get(status.get("state"), len(STATE_RANK)),
+        -(status.get("finished") or status.get("started") or 0)
+    ))
+    return {**best, "processes": {str(status.get("pid")): status.get("state") for status in statuses}}
+
+@st.cache_resource(show_spinner=False)
+def start_warmup() -> Optional[WarmupWorker]:
+    """Start the warm-up once per server process (set KTP_PHOTO_WARMUP=0 to disable)"""
+    if os.getenv("KTP_PHOTO_WARMUP", "1") == "0":
+        return None
+    from data.catalog import get_catalog
+    return WarmupWorker(lambda: get_catalog().all_destinations).start()
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Report the photo warm-up status")
+    parser.add_argument("--status-dir", default=DEFAULT_STATUS_DIR)
+    args = parser.parse_args(argv)
+    
+    status = read_status(args.status_dir)
+    if status is None:
+        print("Photo warm-up has not run")
+        return 1
+    print(f"Photo warm-up {status['state']}: {status['done']}/{status['total']} destinations, "
+          f"{status.get('missed', 0)} missed ({len(status['processes'])} process(es))")
+    # Exit 0 only when warm, so this doubles as a readiness probe
+    return 0 if status["state"] == "ready" else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,6 +30,11 @@ enableCORS = false
 gatherUsageStats = false
 EOF
 
+# Compile the destination catalogs into a memory-mapped snapshot shared by all workers
+# (the app falls back to the Python data modules if this step fails)
+echo "📦 Building catalog snapshot..."
+python -m data.catalog_snapshot || echo "⚠️  Catalog snapshot build failed, using data modules"
+
 # Start the application
 echo "🌐 Starting Streamlit on port $STREAMLIT_SERVER_PORT..."
 python -m streamlit run app.py \
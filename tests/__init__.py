@@ -0,0 +1 @@
+"""Tests for Karnataka Travel Planner"""
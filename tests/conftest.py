@@ -0,0 +1,22 @@
+"""
+Shared fixtures for the Karnataka Travel Planner tests
+Each test gets its own photo cache and quota store under pytest's tmp_path
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.photo_cache import PhotoCache
+from services.quota import QuotaManager
+
+@pytest.fixture
+def photo_cache(tmp_path):
+    return PhotoCache(str(tmp_path / "photos.db"))
+
+@pytest.fixture
+def quota(tmp_path):
+    return QuotaManager(str(tmp_path / "quota.db"))
@@ -0,0 +1,40 @@
+"""
+Offline test doubles for Karnataka Travel Planner
+Photo providers with canned answers, delays and errors
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+from services.photo_providers import PhotoProvider
+from services.quota import PRIORITY_VISIBLE
+
+class StubProvider(PhotoProvider):
+    """Canned answers with an optional delay or error
+    
+    ``delays`` overrides ``delay`` per query, so one batch can mix fast
+    and slow lookups.
+    """
+    
+    def __init__(self, name: str, photos: Optional[List[str]] = None, delay: float = 0.0,
+                 error: Optional[BaseException] = None, remote: bool = True,
+                 delays: Optional[Dict[str, float]] = None):
+        self.name = name
+        self.photos = photos
+        self.delay = delay
+        self.delays = delays or {}
+        self.error = error
+        self.remote = remote
+        self.calls = 0
+        self._lock = threading.Lock()
+    
+    def fetch(self, query, count, priority=PRIORITY_VISIBLE):
+        with self._lock:
+            self.calls += 1
+        delay = self.delays.get(query, self.delay)
+        if delay:
+            time.sleep(delay)
+        if self.error is not None:
+            raise self.error
+        return None if self.photos is None else list(self.photos)[:count]
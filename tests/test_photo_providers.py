@@ -0,0 +1,72 @@
+"""
+Tests for the photo provider chain
+Hedged requests and fall-through between providers, with stub providers only
+"""
+
+import time
+
+from services.photo_providers import HEDGE_MIN_SAMPLES, MIN_HEDGE_AFTER, ProviderChain
+from tests.stubs import StubProvider
+
+def _train(chain, provider, seconds):
+    """Give ``provider`` enough recent samples for its p90 to be trusted"""
+    for _ in range(HEDGE_MIN_SAMPLES):
+        chain.stats[provider.name].record(seconds, "ok")
+
+def test_hedge_fires_after_p90_latency():
+    slow = StubProvider("slow", ["slow.jpg"], delay=1.0)
+    fast = StubProvider("fast", ["fast.jpg"])
+    chain = ProviderChain([slow, fast])
+    _train(chain, slow, 0.3)
+    
+    started = time.perf_counter()
+    photos = chain.fetch_remote("Hampi", 1)
+    elapsed = time.perf_counter() - started
+    
+    assert photos == ["fast.jpg"]
+    assert chain.hedge_after(slow) == 0.3
+    # Hedged once the p90 passed, long before the slow provider answered
+    assert 0.3 <= elapsed < 0.9
+    assert chain.metrics()["slow"]["hedges"] == 1
+
+def test_no_hedge_within_p90_latency():
+    primary = StubProvider("primary", ["primary.jpg"], delay=0.1)
+    backup = StubProvider("backup", ["backup.jpg"])
+    chain = ProviderChain([primary, backup])
+    _train(chain, primary, 0.5)
+    
+    assert chain.fetch_remote("Hampi", 1) == ["primary.jpg"]
+    assert backup.calls == 0
+    assert chain.metrics()["primary"]["hedges"] == 0
+
+def test_hedge_delay_has_a_floor():
+    quick = StubProvider("quick", ["quick.jpg"])
+    chain = ProviderChain([quick, StubProvider("other", ["other.jpg"])])
+    _train(chain, quick, 0.01)
+    
+    assert chain.hedge_after(quick) == MIN_HEDGE_AFTER
+
+def test_failed_and_empty_answers_fall_through():
+    failing = StubProvider("failing", error=ConnectionError("down"))
+    refused = StubProvider("refused", photos=None)
+    empty = StubProvider("empty", photos=[])
+    good = StubProvider("good", ["good.jpg"])
+    chain = ProviderChain([failing, refused, empty, good])
+    
+    assert chain.fetch_remote("Coorg", 1) == ["good.jpg"]
+    assert [p.calls for p in (failing, refused, empty, good)] == [1, 1, 1, 1]
+    assert chain.metrics()["failing"]["outcomes"] == {"error:ConnectionError": 1}
+    assert chain.metrics()["empty"]["outcomes"] == {"empty": 1}
+
+def test_remote_result_distinguishes_empty_from_failed():
+    assert ProviderChain([StubProvider("a", []), StubProvider("b", [])]).fetch_remote("x", 1) == []
+    assert ProviderChain([StubProvider("a", []), StubProvider("b", None)]).fetch_remote("x", 1) is None
+
+def test_local_providers_only_after_remote_ones():
+    remote = StubProvider("remote", photos=None)
+    local = StubProvider("local", ["local.jpg"], remote=False)
+    chain = ProviderChain([local, remote])
+    
+    assert chain.fetch_remote("Gokarna", 1) is None
+    assert local.calls == 0
+    assert chain.fetch("Gokarna", 1) == ["local.jpg"]
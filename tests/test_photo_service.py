@@ -0,0 +1,87 @@
+"""
+Tests for batch photo lookups
+Deadlines, partial results and coalesced lookups, against stub providers
+"""
+
+import threading
+import time
+
+import services.photo_service as photo_module
+from services.photo_service import LazyMedia, PhotoService, prefetch_photos
+from services.photo_providers import PlaceholderProvider
+from tests.stubs import StubProvider
+
+def _service(photo_cache, quota, *providers):
+    placeholders = PlaceholderProvider(lambda name, index: f"placeholder:{name}:{index}")
+    return PhotoService(cache=photo_cache, quota=quota, providers=[*providers, placeholders])
+
+def test_batch_deadline_returns_partial_results(photo_cache, quota):
+    remote = StubProvider("remote", ["real.jpg"], delays={"Slow Falls": 1.0})
+    service = _service(photo_cache, quota, remote)
+    
+    started = time.perf_counter()
+    found = service.find_photos_many(["Hampi", "Slow Falls"], 1, deadline=0.3)
+    
+    assert time.perf_counter() - started < 0.8
+    assert found == {"Hampi": ["real.jpg"]}
+    
+    # The display variant fills the gap with local fallbacks
+    shown = service.get_destination_photos_many(["Hampi", "Slow Falls"], 1, deadline=0.3)
+    assert shown["Hampi"] == ["real.jpg"]
+    assert shown["Slow Falls"] == ["placeholder:Slow Falls:0"]
+
+def test_pending_lookups_finish_in_the_background(photo_cache, quota):
+    remote = StubProvider("remote", ["real.jpg"], delay=0.3)
+    service = _service(photo_cache, quota, remote)
+    
+    # Two workers for four names: two run, two stay queued past the deadline
+    assert service.find_photos_many(["A", "B", "C", "D"], 1, max_workers=2, deadline=0.05) == {}
+    
+    time.sleep(1.0)
+    assert remote.calls == 4
+    assert all(photo_cache.get(service._cache_key(name, 1)) == ["real.jpg"] for name in "ABCD")
+
+def test_prefetch_keeps_unsettled_records_unresolved(photo_cache, quota, monkeypatch):
+    remote = StubProvider("remote", ["real.jpg"], delays={"Slow Falls": 0.5})
+    monkeypatch.setattr(photo_module, "photo_service", _service(photo_cache, quota, remote))
+    monkeypatch.setattr(photo_module.thumbnail_service, "schedule", lambda urls: None)
+    fast, slow = LazyMedia("Quiet Ridge"), LazyMedia("Slow Falls")
+    
+    prefetch_photos([fast, slow], deadline=0.2)
+    
+    assert fast.resolved and fast[0] == "real.jpg"
+    assert not slow.resolved
+    
+    time.sleep(0.6)
+    assert slow[0] == "real.jpg"
+    assert slow.resolved
+
+def test_refused_lookup_is_not_memoized(photo_cache, quota, monkeypatch):
+    remote = StubProvider("remote", photos=None)
+    monkeypatch.setattr(photo_module, "photo_service", _service(photo_cache, quota, remote))
+    media = LazyMedia("Quiet Valley")
+    
+    assert media[0] == "placeholder:Quiet Valley:0"
+    assert not media.resolved
+
+def test_concurrent_lookups_share_one_provider_call(photo_cache, quota):
+    remote = StubProvider("remote", ["real.jpg"], delay=0.3)
+    service = _service(photo_cache, quota, remote)
+    barrier = threading.Barrier(6)
+    results = []
+    
+    def lookup():
+        barrier.wait()
+        results.append(service.get_destination_photos("Jog Falls", 1))
+    
+    threads = [threading.Thread(target=lookup) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert remote.calls == 1
+    assert results == [["real.jpg"]] * 6
+    metrics = service.lookup_metrics()["photos:1:Jog Falls"]
+    assert metrics["executions"] == 1
+    assert metrics["collapsed"] == 5
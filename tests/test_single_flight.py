@@ -0,0 +1,75 @@
+"""
+Tests for single-flight call coalescing
+"""
+
+import threading
+import time
+
+import pytest
+
+from services.single_flight import SingleFlight
+
+def _run_concurrently(count, target):
+    barrier = threading.Barrier(count)
+    threads = [threading.Thread(target=lambda: (barrier.wait(), target())) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def test_concurrent_callers_share_one_execution():
+    flights = SingleFlight()
+    executions = []
+    results = []
+    
+    def work():
+        executions.append(1)
+        time.sleep(0.2)
+        return "done"
+    
+    _run_concurrently(8, lambda: results.append(flights.do("key", work)))
+    
+    assert len(executions) == 1
+    assert results == ["done"] * 8
+    assert flights.metrics("key")["collapsed"] == 7
+    assert flights.in_flight() == 0
+
+def test_errors_reach_every_waiter():
+    flights = SingleFlight()
+    errors = []
+    
+    def fail():
+        time.sleep(0.2)
+        raise ValueError("boom")
+    
+    def call():
+        try:
+            flights.do("key", fail)
+        except ValueError as e:
+            errors.append(str(e))
+    
+    _run_concurrently(4, call)
+    assert errors == ["boom"] * 4
+
+def test_later_calls_run_again():
+    flights = SingleFlight()
+    assert flights.do("key", lambda: 1) == 1
+    assert flights.do("key", lambda: 2) == 2
+    assert flights.metrics("key")["executions"] == 2
+    assert not flights.running("key")
+
+def test_running_reports_calls_in_flight():
+    flights = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    
+    def work():
+        started.set()
+        release.wait()
+    
+    thread = threading.Thread(target=flights.do, args=("key", work))
+    thread.start()
+    started.wait()
+    assert flights.running("key")
+    release.set()
+    thread.join()
+    assert not flights.running("key")
@@ -0,0 +1,55 @@
+"""
+Distance matrix engine for the Karnataka Travel Planner
+Great-circle distances between destinations, computed in one NumPy pass
+"""
+
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from data.geo import EARTH_RADIUS_KM
+
+def haversine_matrix(lats, lons) -> np.ndarray:
+    """Pairwise haversine distances (km) for coordinate arrays in degrees"""
+    phi = np.radians(np.asarray(lats, dtype=np.float64))
+    lam = np.radians(np.asarray(lons, dtype=np.float64))
+    
+    dphi = phi[:, None] - phi[None, :]
+    dlam = lam[:, None] - lam[None, :]
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi)[:, None] * np.cos(phi)[None, :] * np.sin(dlam / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+class DistanceMatrix:
+    """Dense distance matrix with a name -> row/column index map"""
+    
+    def __init__(self, names: Tuple[str, ...], lats: Tuple[float, ...], lons: Tuple[float, ...]):
+        self.names = names
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(names)}
+        self.matrix = haversine_matrix(lats, lons)
+        self.matrix.setflags(write=False)
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def distance(self, origin: str, destination: str) -> float:
+        return float(self.matrix[self.index[origin], self.index[destination]])
+    
+    def to_dict(self, decimals: int = 1) -> Dict[str, Dict[str, float]]:
+        """Nested {origin: {destination: km}} shape used by existing callers"""
+        rounded = np.round(self.matrix, decimals).tolist()
+        return {name: dict(zip(self.names, row)) for name, row in zip(self.names, rounded)}
+
+@lru_cache(maxsize=32)
+def _cached_matrix(names, lats, lons) -> DistanceMatrix:
+    return DistanceMatrix(names, lats, lons)
+
+def get_distance_matrix(destinations: Sequence) -> DistanceMatrix:
+    """Distance matrix for a destination set, cached by names and coordinates"""
+    names, lats, lons = [], [], []
+    for dest in destinations:
+        coordinates = dest['coordinates']
+        names.append(dest['name'])
+        lats.append(coordinates['lat'])
+        lons.append(coordinates['lon'])
+    return _cached_matrix(tuple(names), tuple(lats), tuple(lons))
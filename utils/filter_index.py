@@ -0,0 +1,140 @@
+"""
+Bitmap filter engine for the Karnataka Travel Planner
+Precomputes per-attribute bitmaps so destination filters become bitwise ANDs
+"""
+
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from collections.abc import MutableSequence, Sequence
+
+import numpy as np
+
+from data.seasons import month_mask
+
+# Keyed attributes with one bitmap per distinct value
+KEYED_ATTRIBUTES = ("category", "difficulty", "district")
+
+_MAX_CACHED_INDEXES = 8
+
+def _value(dest, key):
+    return dest.get(key) if hasattr(dest, "get") else None
+
+def _bitmap(positions, size):
+    """Python int with the given bit positions set"""
+    bits = np.zeros(size, dtype=bool)
+    bits[list(positions)] = True
+    return int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little")
+
+class FilterIndex:
+    """Attribute bitmaps over a fixed list of destinations
+    
+    Records are stored in ascending distance order, so "within N km" is the
+    low-bit mask up to a bisected position. Records without a distance sort
+    last and never pass a distance filter.
+    """
+    
+    def __init__(self, destinations):
+        self.destinations = destinations
+        distances = [_value(dest, "distance_km") for dest in destinations]
+        
+        # Bit position -> input position, ordered by distance (stable)
+        order = sorted(range(len(destinations)), key=lambda i: (distances[i] is None, distances[i] or 0))
+        self._order = np.array(order, dtype=np.int64)
+        self._distances = [distances[i] for i in order if distances[i] is not None]
+        self.size = len(order)
+        self.all = (1 << self.size) - 1
+        
+        keyed = {key: defaultdict(list) for key in KEYED_ATTRIBUTES}
+        months = [[] for _ in range(12)]
+        hidden = []
+        for position, index in enumerate(order):
+            dest = destinations[index]
+            for key in KEYED_ATTRIBUTES:
+                keyed[key][_value(dest, key)].append(position)
+            if _value(dest, "hidden_gem"):
+                hidden.append(position)
+            season = getattr(dest, "season_mask", None)
+            if season is None:
+                season = month_mask(_value(dest, "best_season") or _value(dest, "best_time"))
+            for month in range(12):
+                if season >> month & 1:
+                    months[month].append(position)
+        
+        self.keyed = {
+            key: {value: _bitmap(positions, self.size) for value, positions in values.items()}
+            for key, values in keyed.items()
+        }
+        self.months = [_bitmap(positions, self.size) for positions in months]
+        self.hidden_gem = _bitmap(hidden, self.size)
+    
+    def within(self, max_distance) -> int:
+        """Bitmap of records at most ``max_distance`` km from Bangalore"""
+        return (1 << bisect_right(self._distances, max_distance)) - 1
+    
+    def season(self, season) -> int:
+        """Bitmap of records in season during any month named by ``season``"""
+        mask = 0
+        query = month_mask(season)
+        for month in range(12):
+            if query >> month & 1:
+                mask |= self.months[month]
+        return mask
+    
+    def match(self, filters) -> int:
+        """AND together the bitmaps selected by a filters dict"""
+        mask = self.all
+        
+        for key in KEYED_ATTRIBUTES:
+            value = filters.get(key)
+            if value and value != 'All':
+                mask &= self.keyed[key].get(value, 0)
+        
+        if filters.get('max_distance'):
+            mask &= self.within(filters['max_distance'])
+        
+        if filters.get('season') and filters['season'] != 'All':
+            mask &= self.season(filters['season'])
+        
+        if filters.get('hidden_gem') is not None:
+            mask &= self.hidden_gem if filters['hidden_gem'] else self.all & ~self.hidden_gem
+        
+        return mask
+    
+    def select(self, mask) -> list:
+        """Records whose bits are set in ``mask``, in input order"""
+        if not mask:
+            return []
+        packed = np.frombuffer(mask.to_bytes((self.size + 7) // 8, "little"), dtype=np.uint8)
+        positions = np.flatnonzero(np.unpackbits(packed, bitorder="little"))
+        indices = np.sort(self._order[positions])
+        return [self.destinations[i] for i in indices.tolist()]
+    
+    def filter(self, filters) -> list:
+        return self.select(self.match(filters))
+
+_indexes = OrderedDict()
+
+def _immutable(destinations) -> bool:
+    """Tuples and read-only sequences (e.g. snapshot records) cannot change under an index"""
+    return isinstance(destinations, Sequence) and not isinstance(destinations, MutableSequence)
+
+def get_filter_index(destinations) -> FilterIndex:
+    """Cached FilterIndex for an immutable destination sequence (by identity)
+    
+    Lists and other mutable inputs may change in place between calls, so
+    they get a fresh index every time.
+    """
+    if not _immutable(destinations):
+        return FilterIndex(destinations)
+    
+    # The cached index holds a reference, so the id cannot be reused while cached
+    key = id(destinations)
+    index = _indexes.get(key)
+    if index is None or index.destinations is not destinations:
+        index = FilterIndex(destinations)
+        _indexes[key] = index
+        if len(_indexes) > _MAX_CACHED_INDEXES:
+            _indexes.popitem(last=False)
+    else:
+        _indexes.move_to_end(key)
+    return index
@@ -6,8 +6,12 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
 import folium
-from folium import plugins
 import json
+from utils.distance_matrix import get_distance_matrix
+from utils.filter_index import get_filter_index
+from utils.map_cache import cached_map, map_key
+from utils.map_markers import CATEGORY_COLORS, DEFAULT_MARKER_COLOR, add_markers, destination_feature
+from utils.route_planner import plan_days
 
 def calculate_trip_cost(num_people, days, accommodation_type, transport_type, meal_plan="breakfast"):
     """Calculate estimated trip cost based on parameters"""
@@ -57,8 +61,27 @@ def calculate_trip_cost(num_people, days, accommodation_type, transport_type, me
         "per_person": total_cost / num_people
     }
 
-def create_destination_map(destinations, center_lat=12.9716, center_lon=77.5946):
-    """Create an interactive map with destinations"""
+def create_destination_map(destinations, center_lat=12.9716, center_lon=77.5946, marker_mode="auto"):
+    """Create an interactive map with destinations (shared per destination set; do not modify)"""
+    
+    destinations = list(destinations)
+    
+    # Keyed on what the markers show, so Destination records and plain dicts both work
+    key = map_key(
+        (_marker_fields(dest) for dest in destinations), f"destinations:{marker_mode}", (center_lat, center_lon), 8
+    )
+    return cached_map(key, lambda: build_destination_map(destinations, center_lat, center_lon, marker_mode))
+
+def _marker_fields(dest):
+    """Values one destination's marker shows, read through the dict protocol"""
+    coordinates = dest['coordinates']
+    return (
+        dest['name'], coordinates['lat'], coordinates['lon'],
+        dest.get('category'), dest.get('distance_km'), dest.get('best_time')
+    )
+
+def build_destination_map(destinations, center_lat=12.9716, center_lon=77.5946, marker_mode="auto"):
+    """Build a new folium map with a marker per destination, clustered when there are many"""
     
     m = folium.Map(location=[center_lat, center_lon], zoom_start=8)
     
@@ -70,83 +93,64 @@ def create_destination_map(destinations, center_lat=12.9716, center_lon=77.5946)
         icon=folium.Icon(color='red', icon='home', prefix='fa')
     ).add_to(m)
     
-    # Add destination markers
-    for dest in destinations:
-        color = get_marker_color(dest.get('category', 'other'))
-        
-        folium.Marker(
-            [dest['coordinates']['lat'], dest['coordinates']['lon']],
-            popup=f"""
-            <b>{dest['name']}</b><br>
-            Distance: {dest['distance_km']}km<br>
-            Category: {dest['category']}<br>
-            Best Time: {dest.get('best_time', 'Anytime')}
-            """,
-            tooltip=dest['name'],
-            icon=folium.Icon(color=color, icon='map-pin', prefix='fa')
-        ).add_to(m)
+    # Add destination markers, coloured by category in the browser
+    features = [
+        destination_feature(lat, lon, name, category=category, km=km, best=best or 'Anytime')
+        for name, lat, lon, category, km, best in map(_marker_fields, destinations)
+    ]
+    add_markers(
+        m, features, marker_mode,
+        rows=[("Distance", "km", "km"), ("Category", "cat"), ("Best Time", "best")],
+        icon='map-pin',
+        prefix='fa',
+        popup_width=200
+    )
     
     return m
 
 def get_marker_color(category):
     """Get marker color based on destination category"""
-    color_map = {
-        'Hill Station': 'green',
-        'Wildlife': 'orange', 
-        'Trekking': 'purple',
-        'Adventure': 'red',
-        'Theme Park': 'pink',
-        'Waterfalls': 'blue',
-        'Heritage': 'darkred',
-        'Beach': 'lightblue',
-        'Spiritual': 'gray'
-    }
-    return color_map.get(category, 'blue')
+    return CATEGORY_COLORS.get(category, DEFAULT_MARKER_COLOR)
 
 def filter_destinations(destinations, filters):
-    """Filter destinations based on user criteria"""
-    filtered = destinations.copy()
-    
-    if filters.get('category') and filters['category'] != 'All':
-        filtered = [d for d in filtered if d['category'] == filters['category']]
-    
-    if filters.get('max_distance'):
-        filtered = [d for d in filtered if d['distance_km'] <= filters['max_distance']]
+    """Filter destinations based on user criteria
     
-    if filters.get('difficulty') and filters['difficulty'] != 'All':
-        filtered = [d for d in filtered if d.get('difficulty') == filters['difficulty']]
-    
-    if filters.get('season') and filters['season'] != 'All':
-        filtered = [d for d in filtered if filters['season'] in d.get('best_season', '')]
-    
-    return filtered
+    Supported keys: category, difficulty, district, season ('All' or empty
+    to skip), max_distance and hidden_gem. Bitmaps for each list are built
+    once and reused across calls; the result keeps the input order.
+    """
+    return get_filter_index(destinations).filter(filters)
 
 def generate_itinerary(destinations, days, preferences):
-    """Generate a suggested itinerary based on destinations and preferences"""
+    """Generate a suggested itinerary based on destinations and preferences
     
-    itinerary = {}
+    Stops are ordered into a short round trip from Bangalore and split into
+    days by time budget (preferences: hours_per_day, avg_speed_kmh). Each
+    day lists its ordered legs with per-leg distances. If the stops need more
+    days than requested the itinerary grows; spare days are left free.
+    """
     
-    # Simple algorithm to distribute destinations across days
-    destinations_per_day = len(destinations) // days
-    remainder = len(destinations) % days
+    itinerary = {}
     
-    start_idx = 0
-    for day in range(1, days + 1):
-        end_idx = start_idx + destinations_per_day
-        if remainder > 0:
-            end_idx += 1
-            remainder -= 1
-        
-        day_destinations = destinations[start_idx:end_idx]
-        
-        itinerary[f"Day {day}"] = {
-            "destinations": day_destinations,
-            "activities": [],
-            "estimated_time": "8-10 hours",
-            "travel_distance": sum([d['distance_km'] for d in day_destinations])
-        }
-        
-        start_idx = end_idx
+    plan = plan_days(destinations, preferences)
+    for day in range(1, max(days, len(plan)) + 1):
+        if day <= len(plan):
+            day_plan = plan[day - 1]
+            itinerary[f"Day {day}"] = {
+                "destinations": day_plan["destinations"],
+                "activities": [],
+                "estimated_time": f"{day_plan['hours']:.1f} hours",
+                "travel_distance": round(sum(leg["distance_km"] for leg in day_plan["legs"]), 1),
+                "legs": day_plan["legs"]
+            }
+        else:
+            itinerary[f"Day {day}"] = {
+                "destinations": [],
+                "activities": [],
+                "estimated_time": "Free day",
+                "travel_distance": 0,
+                "legs": []
+            }
     
     return itinerary
 
@@ -169,25 +173,12 @@ def format_currency(amount):
     return f"₹{amount:,.0f}"
 
 def calculate_distance_matrix(destinations):
-    """Calculate distance matrix between destinations (simplified)"""
-    # This is a simplified version - in production, you'd use Google Maps API
-    matrix = {}
-    
-    for i, dest1 in enumerate(destinations):
-        matrix[dest1['name']] = {}
-        for j, dest2 in enumerate(destinations):
-            if i == j:
-                matrix[dest1['name']][dest2['name']] = 0
-            else:
-                # Simplified distance calculation
-                lat1, lon1 = dest1['coordinates']['lat'], dest1['coordinates']['lon']
-                lat2, lon2 = dest2['coordinates']['lat'], dest2['coordinates']['lon']
-                
-                # Haversine formula (simplified)
-                distance = ((lat2 - lat1) ** 2 + (lon2 - lon1) ** 2) ** 0.5 * 111  # Rough km conversion
-                matrix[dest1['name']][dest2['name']] = round(distance, 1)
-    
-    return matrix
+    """Calculate great-circle distance matrix between destinations (km)
+    
+    Returns the nested {origin: {destination: km}} dict; use
+    utils.distance_matrix.get_distance_matrix for the dense array form.
+    """
+    return get_distance_matrix(destinations).to_dict()
 
 def get_weather_info(destination, date=None):
     """Get weather information for destination (mock data)"""
@@ -0,0 +1,132 @@
+"""
+Map render cache for the Karnataka Travel Planner
+Folium maps are built and serialized once per process, keyed by a hash of
+what they show, so a rerun redraws a map from cached strings
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, Optional
+
+import folium
+# streamlit-folium is pinned in requirements.txt; its component is reused so
+# cached maps skip the per-call render that st_folium does
+from streamlit_folium import _component_func, _get_map_string, _get_siblings, generate_js_hash, get_full_id
+
+MAP_CACHE_SIZE = 64
+
+def map_key(ids: Iterable, style: str, center, zoom) -> str:
+    """Stable hash of a map's destination ids, builder style, center and zoom"""
+    payload = json.dumps([list(ids), style, [round(float(c), 6) for c in center], zoom], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class RenderedMap:
+    """Serialized pieces st_folium sends to the browser for one map"""
+    
+    __slots__ = ("script", "html", "map_id", "bounds", "zoom", "js_hash")
+    
+    def __init__(self, fig: folium.Map):
+        fig.render()
+        self.script = _get_map_string(fig)
+        self.html = _get_siblings(fig)
+        self.map_id = get_full_id(fig)
+        try:
+            southwest, northeast = fig.get_bounds()
+        except AttributeError:
+            southwest, northeast = [None, None], [None, None]
+        self.bounds = {
+            "_southWest": {"lat": southwest[0], "lng": southwest[1]},
+            "_northEast": {"lat": northeast[0], "lng": northeast[1]},
+        }
+        self.zoom = fig.options.get("zoom")
+        self.js_hash = generate_js_hash(self.script, None, False)
+    
+    def defaults(self, returned_objects: Optional[Iterable[str]] = None) -> dict:
+        values = {
+            "last_clicked": None,
+            "last_object_clicked": None,
+            "last_object_clicked_tooltip": None,
+            "last_object_clicked_popup": None,
+            "all_drawings": None,
+            "last_active_drawing": None,
+            "bounds": self.bounds,
+            "zoom": self.zoom,
+            "last_circle_radius": None,
+            "last_circle_polygon": None,
+        }
+        return {k: v for k, v in values.items() if returned_objects is None or k in returned_objects}
+
+class MapCache:
+    """Thread-safe LRU of built or serialized maps"""
+    
+    def __init__(self, max_entries: int = MAP_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get_or_build(self, key: Hashable, build: Callable):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        
+        # Built outside the lock; a concurrent duplicate build is harmless
+        value = build()
+        with self._lock:
+            value = self._entries.setdefault(key, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+map_cache = MapCache()
+
+def cached_map(key: str, build: Callable[[], folium.Map]) -> folium.Map:
+    """Built folium.Map for ``key``, shared by every caller; do not modify it"""
+    return map_cache.get_or_build(("map", key), build)
+
+def component_key(key: str, build: Callable[[], folium.Map]) -> str:
+    """Streamlit key of the component render_map shows for ``key``"""
+    return map_cache.get_or_build(("rendered", key), lambda: RenderedMap(build())).js_hash
+
+def render_map(key: str, build: Callable[[], folium.Map], width: int = 700, height: int = 500,
+               interactive: bool = False, returned_objects: Optional[Iterable[str]] = None,
+               st_key: Optional[str] = None, feature_group: Optional[str] = None):
+    """st_folium for a cached map: ``build`` only runs the first time ``key`` is seen
+    
+    Maps are display-only by default: no pan, zoom or click is sent back,
+    so using the map never reruns the script. Pass ``interactive=True``
+    (optionally narrowed with ``returned_objects``) where a page reads
+    the returned clicks or bounds. ``feature_group`` is leaflet script for
+    a layer swapped in without reloading the map (see utils.map_viewport).
+    """
+    returned_objects = (None if returned_objects is None else list(returned_objects)) if interactive else []
+    rendered = map_cache.get_or_build(("rendered", key), lambda: RenderedMap(build()))
+    return _component_func(
+        script=rendered.script,
+        html=rendered.html,
+        id=rendered.map_id,
+        key=rendered.js_hash if st_key is None else generate_js_hash(rendered.script, st_key, False),
+        height=height,
+        width=width,
+        returned_objects=returned_objects,
+        default=rendered.defaults(returned_objects),
+        zoom=None,
+        center=None,
+        feature_group=feature_group,
+        return_on_hover=False,
+    )
@@ -0,0 +1,145 @@
+"""
+Destination markers for the Karnataka Travel Planner maps
+All of a map's destinations go out as one GeoJSON FeatureCollection; icons,
+colours and popups are built in the browser from each feature's properties,
+and larger sets are clustered
+"""
+
+import os
+
+from branca.element import MacroElement
+from folium import plugins
+from jinja2 import Template
+
+# Marker counts above which "auto" mode clusters, and loads clusters in chunks
+CLUSTER_THRESHOLD = int(os.getenv("KTP_MAP_CLUSTER_THRESHOLD", "25"))
+FAST_CLUSTER_THRESHOLD = int(os.getenv("KTP_MAP_FAST_CLUSTER_THRESHOLD", "250"))
+
+MARKER_MODES = ("plain", "cluster", "fast")
+
+# The one category -> marker colour table used by every map
+CATEGORY_COLORS = {
+    'Hill Station': 'green',
+    'Wildlife': 'orange',
+    'Trekking': 'purple',
+    'Adventure': 'red',
+    'Theme Park': 'pink',
+    'Waterfalls': 'blue',
+    'Heritage': 'darkred',
+    'Beach': 'lightblue',
+    'Spiritual': 'gray'
+}
+DEFAULT_MARKER_COLOR = 'blue'
+
+def marker_mode(count, mode="auto"):
+    """Resolve "auto" to plain, cluster or fast for ``count`` markers"""
+    if mode != "auto":
+        if mode not in MARKER_MODES:
+            raise ValueError(f"Unknown marker mode {mode!r}; expected auto or one of {MARKER_MODES}")
+        return mode
+    if count > FAST_CLUSTER_THRESHOLD:
+        return "fast"
+    if count > CLUSTER_THRESHOLD:
+        return "cluster"
+    return "plain"
+
+def destination_feature(lat, lon, name, category=None, gem=False, icon=None, text=None, **fields):
+    """GeoJSON point for one destination; ``fields`` are the values its popup rows show"""
+    properties = {"name": name}
+    if category:
+        properties["cat"] = category
+    if gem:
+        properties["gem"] = 1
+    if icon:
+        properties["icon"] = icon
+    if text:
+        properties["text"] = text
+    properties.update({key: value for key, value in fields.items() if value is not None})
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [round(lon, 5), round(lat, 5)]},
+        "properties": properties,
+    }
+
+class DestinationLayer(MacroElement):
+    """One L.geoJSON layer whose markers and popups are styled client-side
+    
+    ``rows`` lists the popup lines as (label, property, suffix); marker
+    colour comes from ``colors`` by category, and hidden gems may get
+    their own icon, colour and title prefix.
+    """
+    
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        var {{ this.get_name() }} = (function () {
+            var style = {{ this.style|tojson }};
+            var escape = function (value) {
+                return String(value).replace(/[&<>"]/g, function (c) {
+                    return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}[c];
+                });
+            };
+            return L.geoJSON({{ this.data|tojson }}, {
+                pointToLayer: function (feature, latlng) {
+                    var p = feature.properties;
+                    var icon = L.AwesomeMarkers.icon({
+                        icon: p.icon || (p.gem && style.gem_icon) || style.icon,
+                        markerColor: (p.gem && style.gem_color) || style.colors[p.cat] || style.color,
+                        prefix: style.prefix
+                    });
+                    return L.marker(latlng, {icon: icon}).bindTooltip(escape(p.name));
+                },
+                onEachFeature: function (feature, layer) {
+                    var p = feature.properties;
+                    var html = '<div style="width: ' + style.width + 'px;"><h4>'
+                        + (p.gem ? style.gem_prefix : '') + escape(p.name) + '</h4>';
+                    style.rows.forEach(function (row) {
+                        if (p[row[1]] !== undefined) {
+                            html += '<p><strong>' + row[0] + ':</strong> ' + escape(p[row[1]]) + row[2] + '</p>';
+                        }
+                    });
+                    if (p.text) html += '<p>' + escape(p.text) + '...</p>';
+                    layer.bindPopup(html + '</div>', {maxWidth: 300});
+                }
+            });
+        })().addTo({{ this._parent.get_name() }});
+        {% endmacro %}
+        """)
+    
+    def __init__(self, features, rows=(), colors=None, color=DEFAULT_MARKER_COLOR, icon='info-sign',
+                 prefix='glyphicon', gem_icon=None, gem_color=None, gem_prefix='', popup_width=300):
+        super().__init__()
+        self._name = "DestinationLayer"
+        self.data = {"type": "FeatureCollection", "features": list(features)}
+        self.style = {
+            "rows": [list(row) + [""] * (3 - len(row)) for row in rows],
+            "colors": CATEGORY_COLORS if colors is None else colors,
+            "color": color,
+            "icon": icon,
+            "prefix": prefix,
+            "gem_icon": gem_icon,
+            "gem_color": gem_color,
+            "gem_prefix": gem_prefix,
+            "width": popup_width,
+        }
+    
+    def _get_self_bounds(self):
+        coordinates = [feature["geometry"]["coordinates"] for feature in self.data["features"]]
+        if not coordinates:
+            return [[None, None], [None, None]]
+        lons, lats = zip(*coordinates)
+        return [[min(lats), min(lons)], [max(lats), max(lons)]]
+
+def add_markers(m, features, mode="auto", name=None, **style):
+    """Add destination features to a map as one layer, clustered by mode; returns the mode used"""
+    features = list(features)
+    mode = marker_mode(len(features), mode)
+    
+    parent = m
+    if mode == "cluster":
+        parent = plugins.MarkerCluster(name=name).add_to(m)
+    elif mode == "fast":
+        # Clusters are filled in chunks so thousands of points never block the page
+        parent = plugins.MarkerCluster(name=name, options={"chunkedLoading": True}).add_to(m)
+    
+    DestinationLayer(features, **style).add_to(parent)
+    return mode
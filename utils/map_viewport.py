@@ -0,0 +1,90 @@
+"""
+Viewport marker loading for the Karnataka Travel Planner maps
+Only destinations inside the visible bounds plus a margin are sent, found
+through the spatial grid; when the map is panned or zoomed its new bounds
+come back and the next run swaps in the markers for that view
+"""
+
+import math
+import os
+from typing import Callable, Iterable, Optional, Tuple
+
+import folium
+import streamlit as st
+from streamlit_folium import _get_feature_group_string
+
+from data.spatial_index import SpatialIndex
+from utils.map_cache import component_key, map_cache, render_map
+from utils.map_markers import add_markers
+
+# Maps holding more destinations than this load markers by viewport when
+# asked to decide ("auto"); below it the whole set is small enough to send
+# once, and a display-only map never reruns the page
+VIEWPORT_THRESHOLD = int(os.getenv("KTP_MAP_VIEWPORT_THRESHOLD", "500"))
+
+# Share of the visible span loaded beyond each edge, so small pans need no new markers
+VIEWPORT_MARGIN = 0.25
+
+TILE_SIZE = 256
+
+Bounds = Tuple[float, float, float, float]
+
+def use_viewport(count: int, viewport="auto") -> bool:
+    """Resolve "auto" to whether ``count`` destinations warrant viewport loading"""
+    if viewport == "auto":
+        return count > VIEWPORT_THRESHOLD
+    return bool(viewport)
+
+def estimate_bounds(center, zoom: int, width: int, height: int) -> Bounds:
+    """(south, west, north, east) a web-mercator map of this size shows at ``zoom``"""
+    degrees_per_pixel = 360.0 / (TILE_SIZE * 2 ** zoom)
+    half_lon = width * degrees_per_pixel / 2
+    half_lat = height * degrees_per_pixel * math.cos(math.radians(center[0])) / 2
+    return center[0] - half_lat, center[1] - half_lon, center[0] + half_lat, center[1] + half_lon
+
+def returned_bounds(value) -> Optional[Bounds]:
+    """Bounds from a map component's returned value, or None before the first pan"""
+    bounds = (value or {}).get("bounds") or {}
+    southwest, northeast = bounds.get("_southWest") or {}, bounds.get("_northEast") or {}
+    corners = (southwest.get("lat"), southwest.get("lng"), northeast.get("lat"), northeast.get("lng"))
+    return None if None in corners else corners
+
+def padded_area(bounds: Bounds, margin: float, cell_degrees: float) -> Bounds:
+    """Bounds grown by ``margin`` of their span and snapped outward to grid cells"""
+    south, west, north, east = bounds
+    pad_lat, pad_lon = (north - south) * margin, (east - west) * margin
+    # Snapping makes nearby views share one cached layer
+    return (
+        math.floor((south - pad_lat) / cell_degrees) * cell_degrees,
+        math.floor((west - pad_lon) / cell_degrees) * cell_degrees,
+        math.ceil((north + pad_lat) / cell_degrees) * cell_degrees,
+        math.ceil((east + pad_lon) / cell_degrees) * cell_degrees,
+    )
+
+def viewport_layer(destinations, to_feature: Callable, marker_mode: str = "auto", **style) -> str:
+    """Leaflet script for a feature group holding ``destinations`` as markers"""
+    group = folium.FeatureGroup(name="Destinations in view")
+    add_markers(group, [to_feature(dest) for dest in destinations], marker_mode, **style)
+    return _get_feature_group_string(group, folium.Map())
+
+def render_viewport_map(key: str, build_base: Callable[[], folium.Map], destinations: Iterable,
+                        to_feature: Callable, center, zoom: int, width: int = 700, height: int = 500,
+                        marker_mode: str = "auto", margin: float = VIEWPORT_MARGIN, **style):
+    """render_map for a marker-free base map, with markers for the current view only
+    
+    The first run sizes the view from ``center`` and ``zoom``, so the
+    initial payload depends on the zoom rather than on how many
+    destinations exist. ``style`` is passed on to add_markers.
+    """
+    index = map_cache.get_or_build(("index", key), lambda: SpatialIndex(destinations))
+    
+    bounds = returned_bounds(st.session_state.get(component_key(key, build_base)))
+    area = padded_area(bounds or estimate_bounds(center, zoom, width, height), margin, index.cell_degrees)
+    
+    layer = map_cache.get_or_build(
+        ("viewport", key, marker_mode, area),
+        lambda: viewport_layer(index.bbox(*area), to_feature, marker_mode, **style)
+    )
+    # Bounds are the only value sent back, so only a pan or zoom reruns the page
+    return render_map(key, build_base, width, height, interactive=True,
+                      returned_objects=["bounds"], feature_group=layer)
@@ -0,0 +1,150 @@
+"""
+Route planner for the Karnataka Travel Planner
+Orders stops into a short round trip from Bangalore (nearest-neighbour seed,
+then 2-opt and Or-opt improvement) and splits it into days by time budget
+"""
+
+import re
+from typing import Dict, List, Sequence
+
+from utils.distance_matrix import get_distance_matrix
+
+BANGALORE = {"name": "Bangalore", "coordinates": {"lat": 12.9716, "lon": 77.5946}}
+
+DEFAULT_HOURS_PER_DAY = 10
+DEFAULT_SPEED_KMH = 40  # average road speed over straight-line distance
+DEFAULT_VISIT_HOURS = 2
+
+_HOURS_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(?:\s*-\s*(\d+(?:\.\d+)?))?\s*(?:hours?|hrs?)")
+
+def visit_hours(time_needed) -> float:
+    """Hours to spend at a stop from text like "2-3 hours" or "Full day" """
+    text = str(time_needed or "").lower()
+    if "full day" in text:
+        return 8.0
+    if "half day" in text:
+        return 4.0
+    match = _HOURS_PATTERN.search(text)
+    if match:
+        low = float(match.group(1))
+        high = float(match.group(2) or low)
+        return (low + high) / 2
+    return float(DEFAULT_VISIT_HOURS)
+
+def tour_length(tour: Sequence[int], dist) -> float:
+    """Length of the closed tour (returning to its first node)"""
+    return sum(dist[tour[i - 1]][tour[i]] for i in range(len(tour)))
+
+def nearest_neighbour_tour(dist, start: int = 0) -> List[int]:
+    """Greedy tour: always travel to the closest unvisited node"""
+    unvisited = set(range(len(dist))) - {start}
+    tour = [start]
+    while unvisited:
+        row = dist[tour[-1]]
+        nearest = min(unvisited, key=row.__getitem__)
+        unvisited.remove(nearest)
+        tour.append(nearest)
+    return tour
+
+def two_opt(tour: List[int], dist) -> List[int]:
+    """Reverse segments while that shortens the closed tour; node 0 stays first"""
+    n = len(tour)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, n - 1):
+            a, b = tour[i - 1], tour[i]
+            for j in range(i + 1, n):
+                c, d = tour[j], tour[(j + 1) % n]
+                delta = dist[a][c] + dist[b][d] - dist[a][b] - dist[c][d]
+                if delta < -1e-9:
+                    tour[i:j + 1] = reversed(tour[i:j + 1])
+                    a, b = tour[i - 1], tour[i]
+                    improved = True
+    return tour
+
+def or_opt(tour: List[int], dist, max_segment: int = 3) -> List[int]:
+    """Move runs of 1..max_segment stops to a cheaper place in the tour"""
+    n = len(tour)
+    improved = True
+    while improved:
+        improved = False
+        for length in range(1, max_segment + 1):
+            for i in range(1, n - length + 1):
+                segment = tour[i:i + length]
+                prev, nxt = tour[i - 1], tour[(i + length) % n]
+                first, last = segment[0], segment[-1]
+                removal_gain = dist[prev][first] + dist[last][nxt] - dist[prev][nxt]
+                
+                rest = tour[:i] + tour[i + length:]
+                best_delta, best_at = -1e-9, None
+                for j in range(len(rest)):
+                    p, q = rest[j], rest[(j + 1) % len(rest)]
+                    delta = dist[p][first] + dist[last][q] - dist[p][q] - removal_gain
+                    if delta < best_delta:
+                        best_delta, best_at = delta, j + 1
+                if best_at is not None:
+                    tour[:] = rest[:best_at] + segment + rest[best_at:]
+                    improved = True
+    return tour
+
+def optimize_tour(dist) -> List[int]:
+    """Short closed tour over all nodes, starting (and ending) at node 0"""
+    tour = nearest_neighbour_tour(dist)
+    if len(tour) < 4:
+        return tour
+    
+    best = tour_length(tour, dist)
+    while True:
+        or_opt(two_opt(tour, dist), dist)
+        length = tour_length(tour, dist)
+        if length >= best - 1e-9:
+            return tour
+        best = length
+
+def plan_days(destinations: Sequence, preferences: Dict = None) -> List[Dict]:
+    """Ordered round trip from Bangalore split into days by a time budget
+    
+    Each day starts where the previous one ended (overnight stay) and the
+    last day returns to Bangalore. Distances are great-circle kilometres;
+    stops without coordinates are visited at the end without legs.
+    """
+    preferences = preferences or {}
+    hours_per_day = preferences.get('hours_per_day', DEFAULT_HOURS_PER_DAY)
+    speed = preferences.get('avg_speed_kmh', DEFAULT_SPEED_KMH)
+    
+    routable = [d for d in destinations if d.get('coordinates')]
+    unroutable = [d for d in destinations if not d.get('coordinates')]
+    nodes = [BANGALORE] + routable
+    dist = get_distance_matrix(nodes).matrix.tolist()
+    order = optimize_tour(dist)[1:]
+    
+    plan = []
+    day = None
+    previous = 0
+    for node in order:
+        leg = dist[previous][node]
+        stop = nodes[node]
+        hours = leg / speed + visit_hours(stop.get('time_needed'))
+        if day is None or (day["destinations"] and day["hours"] + hours > hours_per_day):
+            day = {"destinations": [], "legs": [], "hours": 0.0}
+            plan.append(day)
+        day["destinations"].append(stop)
+        day["legs"].append({"from": nodes[previous]['name'], "to": stop['name'], "distance_km": round(leg, 1)})
+        day["hours"] += hours
+        previous = node
+    
+    if unroutable:
+        if day is None:
+            day = {"destinations": [], "legs": [], "hours": 0.0}
+            plan.append(day)
+        for stop in unroutable:
+            day["destinations"].append(stop)
+            day["hours"] += visit_hours(stop.get('time_needed'))
+    
+    if previous:
+        leg = dist[previous][0]
+        day["legs"].append({"from": nodes[previous]['name'], "to": BANGALORE['name'], "distance_km": round(leg, 1)})
+        day["hours"] += leg / speed
+    
+    return plan
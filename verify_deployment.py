@@ -84,6 +84,68 @@ def check_app_structure():
         print(f"❌ App structure error: {e}")
         return False
 
+def check_catalog_names():
+    """Report destination names in the lookup tables that match no catalog record"""
+    print("\n🔎 Checking catalog destination names...")
+    
+    try:
+        sys.path.insert(0, '.')
+        from data.catalog import get_catalog
+        from data.name_index import build_name_index, audit_names
+        
+        catalog = get_catalog()
+        unresolved = audit_names(build_name_index(catalog), catalog)
+        if unresolved:
+            for reference, names in unresolved.items():
+                print(f"⚠️  {reference}: {', '.join(names)}")
+        else:
+            print("✅ All referenced destination names resolve")
+    except Exception as e:
+        print(f"⚠️  Could not check catalog names: {e}")
+    
+    # Unresolved names only hide cards; they never block a deployment
+    return True
+
+def check_photo_quota():
+    """Report how much of each photo provider's hourly budget is left"""
+    print("\n📷 Checking photo provider quotas...")
+    
+    try:
+        sys.path.insert(0, '.')
+        from services.quota import get_quota_manager
+        
+        for provider, stats in get_quota_manager().metrics().items():
+            print(f"ℹ️  {provider}: {stats['remaining']:.0f}/{stats['capacity']} requests left this hour")
+    except Exception as e:
+        print(f"⚠️  Could not read photo quotas: {e}")
+    
+    # A spent quota only means placeholders until it refills
+    return True
+
+def check_photo_warmup():
+    """Report whether the server's background photo warm-up has finished"""
+    print("\n🔥 Checking photo cache warm-up...")
+    
+    try:
+        sys.path.insert(0, '.')
+        from services.warmup import read_status
+        
+        status = read_status()
+        if status is None:
+            print("ℹ️  Photo warm-up has not run yet (it starts with the server)")
+        elif status["state"] == "ready":
+            print(f"✅ Photo cache warm: {status['done']}/{status['total']} destinations")
+        elif status["state"] == "incomplete":
+            print(f"⚠️  Photo warm-up incomplete: {status['missed']} of {status['total']} destinations "
+                  "were refused or failed and will be fetched on first view")
+        else:
+            print(f"ℹ️  Photo warm-up {status['state']}: {status['done']}/{status['total']} destinations")
+    except Exception as e:
+        print(f"⚠️  Could not read photo warm-up status: {e}")
+    
+    # A cold cache only makes first page views slower
+    return True
+
 def check_azure_config():
     """Check Azure deployment configuration"""
     print("\n☁️  Checking Azure configuration...")
@@ -121,6 +183,9 @@ def main():
         check_required_files,
         check_imports,
         check_app_structure, 
+        check_catalog_names,
+        check_photo_quota,
+        check_photo_warmup,
         check_azure_config
     ]
     